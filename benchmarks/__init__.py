@@ -0,0 +1 @@
+#Esto debe estar vacio
\ No newline at end of file
@@ -0,0 +1,260 @@
+# benchmarks/run.py - BANCO DE PRUEBAS DE RENDIMIENTO
+"""Mide las rutas críticas del juego con vocabularios sintéticos.
+
+Uso:
+    python -m benchmarks.run                          # todos los tamaños
+    python -m benchmarks.run --sizes 1k,10k --output baseline.json
+    python -m benchmarks.run --compare baseline.json --tolerance 0.25
+
+Con ``--compare`` el proceso termina con código 1 si alguna medición es
+más lenta que la línea base en más de la tolerancia.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from core import vocabulary as vocabulary_module
+from core.answer_matcher import AnswerMatcher
+from core.game import Game
+from core.progress_manager import ProgressManager
+from core.quiz_generator import QuizGenerator
+from core.vocabulary import (get_completion_index, get_word_count, mark_vocabulary_changed,
+                             set_vocabulary)
+from core.vocabulary_pack import VocabularyPack
+from data_manager import DataManager
+
+from .synthetic import SIZES, make_vocabulary, make_vocabulary_pack, parse_size, size_label
+
+BASELINE_VERSION = 1
+DEFAULT_SIZES = "1k,10k,100k,1m"
+DEFAULT_TOLERANCE = 0.25
+# A partir de este tamaño el vocabulario se sirve desde un paquete compilado
+PACK_THRESHOLD = 100_000
+# Tiempo mínimo de cada repetición al calibrar (segundos)
+MIN_REPEAT_TIME = 0.05
+
+
+def measure(fn, repeat=5, calibrate=True):
+    """Tiempo por llamada en µs (mínimo y mediana de varias repeticiones)"""
+    number = 1
+    if calibrate:
+        # Llamadas suficientes para que cada repetición dure MIN_REPEAT_TIME
+        while True:
+            start = time.perf_counter()
+            for _ in range(number):
+                fn()
+            elapsed = time.perf_counter() - start
+            if elapsed >= MIN_REPEAT_TIME or number >= 1 << 20:
+                break
+            number *= 2 if elapsed <= 0 else max(2, min(10, int(MIN_REPEAT_TIME / elapsed) + 1))
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        times.append((time.perf_counter() - start) / number)
+    return {
+        "us_per_op": round(min(times) * 1e6, 3),
+        "median_us": round(statistics.median(times) * 1e6, 3),
+        "ops": number
+    }
+
+
+# --- Casos ---
+# Cada caso recibe el contexto (vocabulario y carpeta temporal) y devuelve
+# (función a medir, calibrar). La preparación no se mide.
+
+def bench_quiz_cold_start(context):
+    def run():
+        # Índices reconstruidos: lo que paga el primer quiz tras cambiar el vocabulario
+        mark_vocabulary_changed()
+        QuizGenerator(context["vocabulary"]).generate_multiple_choice(None, 10)
+    return run, False
+
+
+def bench_generate_multiple_choice(context):
+    generator = QuizGenerator(context["vocabulary"])
+    generator.generate_multiple_choice(None, 10)
+    return lambda: generator.generate_multiple_choice(None, 10), True
+
+
+def bench_get_random_word(context):
+    game = context["game"]
+    game.get_random_word()
+    return game.get_random_word, True
+
+
+def bench_get_word_count(context):
+    vocabulary = context["vocabulary"]
+    return lambda: get_word_count(vocabulary), True
+
+
+def bench_match_answer(context):
+    # Comprobación de una respuesta con errata contra una palabra ya preparada
+    matcher = AnswerMatcher()
+    _spanish, english = context["game"].get_random_word()
+    typo = english[:-1] + ("x" if english[-1] != "x" else "y")
+    matcher.match(english, typo)
+    return lambda: matcher.match(english, typo), True
+
+
+def bench_complete_answer(context):
+    # Sugerencias de una pulsación (dos letras) con el índice ya construido
+    completion = get_completion_index(vocabulary=context["vocabulary"])
+    _spanish, english = context["game"].get_random_word()
+    prefix = english[:2]
+    completion.complete(prefix)
+    return lambda: completion.complete(prefix), True
+
+
+def bench_update_stats(context):
+    manager = DataManager(os.path.join(context["tmp"], "data_stats"))
+    return lambda: manager.update_stats("quiz", 7, 10), True
+
+
+def bench_save_progress(context):
+    manager = DataManager(os.path.join(context["tmp"], "data_progress"))
+    counter = iter(range(1 << 30))
+    return lambda: manager.save_progress({"score": next(counter), "level": 3}), True
+
+
+def bench_load_progress(context):
+    manager = ProgressManager(os.path.join(context["tmp"], "data_load"))
+    manager.save_progress({"score": 1234, "level": 13, "games_played": 40})
+    return manager.load_progress, True
+
+
+BENCHMARKS = [
+    ("quiz.cold_start", bench_quiz_cold_start),
+    ("quiz.generate_multiple_choice", bench_generate_multiple_choice),
+    ("game.get_random_word", bench_get_random_word),
+    ("vocabulary.get_word_count", bench_get_word_count),
+    ("answer_matcher.match", bench_match_answer),
+    ("completion.complete", bench_complete_answer),
+    ("data_manager.update_stats", bench_update_stats),
+    ("data_manager.save_progress", bench_save_progress),
+    ("progress_manager.load_progress", bench_load_progress),
+]
+
+
+def load_vocabulary(num_words, tmp, cache_dir=None):
+    """Vocabulario sintético: diccionario si es pequeño, paquete si es grande"""
+    if num_words < PACK_THRESHOLD:
+        return make_vocabulary(num_words)
+    return VocabularyPack(make_vocabulary_pack(num_words, cache_dir or tmp))
+
+
+def run_size(num_words, repeat=5, only=None, cache_dir=None):
+    """Ejecuta todos los casos con un tamaño de vocabulario"""
+    results = {}
+    previous = vocabulary_module._active_vocabulary
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="ea_bench_") as tmp:
+        start = time.perf_counter()
+        vocabulary = load_vocabulary(num_words, tmp, cache_dir)
+        print(f"📚 {size_label(num_words)}: vocabulario listo en "
+              f"{(time.perf_counter() - start) * 1000:.0f} ms")
+        try:
+            # Game y sus diarios escriben en data/ relativo al directorio actual
+            os.chdir(tmp)
+            set_vocabulary(vocabulary)
+            context = {"vocabulary": vocabulary, "tmp": tmp, "game": Game()}
+
+            for name, bench in BENCHMARKS:
+                if only and not any(pattern in name for pattern in only):
+                    continue
+                fn, calibrate = bench(context)
+                result = measure(fn, repeat=repeat if calibrate else min(repeat, 3),
+                                 calibrate=calibrate)
+                results[f"{name}@{size_label(num_words)}"] = result
+                print(f"   {name:<34} {format_time(result['us_per_op']):>12}"
+                      f"  (x{result['ops']})")
+        finally:
+            os.chdir(cwd)
+            set_vocabulary(previous)
+            if isinstance(vocabulary, VocabularyPack):
+                vocabulary.close()
+    return results
+
+
+def format_time(us):
+    if us >= 1000:
+        return f"{us / 1000:.2f} ms"
+    return f"{us:.2f} µs"
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Compara con una línea base; devuelve la lista de regresiones"""
+    regressions = []
+    print(f"\n📊 Comparación con la línea base (tolerancia {tolerance:.0%}):")
+    for key, result in results.items():
+        reference = baseline.get("results", {}).get(key)
+        if reference is None:
+            print(f"   {key:<44} {'(nuevo)':>10}")
+            continue
+        ratio = result["us_per_op"] / max(reference["us_per_op"], 1e-9)
+        flag = ""
+        if ratio > 1 + tolerance:
+            flag = "  ⚠️ REGRESIÓN"
+            regressions.append((key, ratio))
+        elif ratio < 1 - tolerance:
+            flag = "  🚀 mejora"
+        print(f"   {key:<44} {ratio:>9.2f}x{flag}")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de Aventura de Inglés")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help=f"tamaños separados por comas ({', '.join(SIZES)} o un número)")
+    parser.add_argument("--only", help="medir solo los casos que contengan estos textos (comas)")
+    parser.add_argument("--repeat", type=int, default=5, help="repeticiones por caso")
+    parser.add_argument("--output", help="guardar los resultados como línea base JSON")
+    parser.add_argument("--compare", help="comparar con una línea base JSON")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="margen de regresión permitido (0.25 = 25%% más lento)")
+    parser.add_argument("--cache-dir", help="carpeta donde reutilizar los paquetes sintéticos")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    sizes = [parse_size(size) for size in args.sizes.split(",") if size.strip()]
+    only = [pattern.strip() for pattern in args.only.split(",")] if args.only else None
+
+    results = {}
+    for num_words in sizes:
+        results.update(run_size(num_words, args.repeat, only, args.cache_dir))
+
+    if args.output:
+        data = {
+            "version": BASELINE_VERSION,
+            "created": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 Resultados guardados en: {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regresiones por encima del {args.tolerance:.0%}")
+            return 1
+        print("\n✅ Sin regresiones")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+# benchmarks/synthetic.py - VOCABULARIOS SINTÉTICOS
+import os
+import random
+
+from core.vocabulary_pack import compile_vocabulary_pack
+
+# Tamaños con nombre para la línea de comandos
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+# Palabras por categoría (una categoría cada 250 palabras, mínimo 8)
+WORDS_PER_CATEGORY = 250
+MIN_CATEGORIES = 8
+
+_SYLLABLES = ["ba", "ce", "di", "fo", "gu", "la", "me", "ni", "ño", "pa",
+              "que", "ro", "sa", "te", "vi", "za", "lla", "cho", "rá", "bé"]
+_LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def parse_size(text):
+    """Convierte '10k' o '2500' en número de palabras"""
+    text = text.strip().lower()
+    if text in SIZES:
+        return SIZES[text]
+    return int(text)
+
+
+def size_label(num_words):
+    for label, value in SIZES.items():
+        if value == num_words:
+            return label
+    return str(num_words)
+
+
+def make_vocabulary(num_words, num_categories=None, seed=0):
+    """Crea {categoría: {español: inglés}} con palabras inventadas.
+
+    Las palabras son únicas dentro de cada categoría y algunas inglesas se
+    repiten entre categorías, como en el vocabulario real. El resultado es
+    siempre el mismo para una semilla.
+    """
+    rng = random.Random(seed)
+    num_categories = num_categories or max(MIN_CATEGORIES, num_words // WORDS_PER_CATEGORY)
+    vocabulary = {f"Categoría {c:05d}": {} for c in range(num_categories)}
+    categories = list(vocabulary)
+
+    for n in range(num_words):
+        # El número se incluye para garantizar que no hay duplicados
+        spanish = "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4))) + f"{n:x}"
+        english = "".join(rng.choice(_LETTERS) for _ in range(rng.randint(3, 9)))
+        vocabulary[categories[n % num_categories]][spanish] = english
+    return vocabulary
+
+
+def make_vocabulary_pack(num_words, directory, seed=0):
+    """Compila (o reutiliza) el paquete sintético de un tamaño en 'directory'"""
+    pack_path = os.path.join(directory, f"synthetic_{size_label(num_words)}_{seed}.pack")
+    if not os.path.exists(pack_path):
+        compile_vocabulary_pack(make_vocabulary(num_words, seed=seed), pack_path)
+    return pack_path
@@ -1,7 +1,31 @@
 import PyInstaller.__main__
+import argparse
+import json
 import os
 import shutil
+import statistics
+import subprocess
 import sys
+import tempfile
+import time
+
+from utils.paths import RESOURCE_PACK_NAME
+from utils.resource_pack import build_resource_pack
+from utils.startup_trace import EXIT_AFTER_PAINT_ENV, TRACE_FILE_ENV
+
+APP_NAME = "EnglishAdventure"
+
+# Perfiles de build:
+#   onefile     -> un solo ejecutable; se extrae a una carpeta temporal en cada arranque
+#   onedir      -> carpeta con el ejecutable y sus bibliotecas; arranca sin extraer nada
+#   onedir-fast -> onedir con los recursos preparados: sonidos ya en PCM, vocabulario
+#                  compilado y solo el bytecode optimizado (sin copias del código fuente)
+PROFILES = {
+    'onefile': {'onefile': True, 'precompiled': False},
+    'onedir': {'onefile': False, 'precompiled': False},
+    'onedir-fast': {'onefile': False, 'precompiled': True},
+}
+DEFAULT_PROFILE = 'onefile'
 
 def clean_build_folders():
     """Limpia carpetas de builds anteriores"""
@@ -11,28 +35,101 @@ def clean_build_folders():
             print(f"🧹 Limpiando carpeta: {folder}")
             shutil.rmtree(folder)
 
-def build_executable():
+def executable_name():
+    return APP_NAME + ('.exe' if sys.platform == 'win32' else '')
+
+def artifact_paths(profile):
+    """Devuelve (carpeta de la aplicación, ejecutable) de un perfil"""
+    dist_dir = os.path.join('dist', profile)
+    if PROFILES[profile]['onefile']:
+        app_dir = dist_dir
+    else:
+        app_dir = os.path.join(dist_dir, APP_NAME)
+    return app_dir, os.path.join(app_dir, executable_name())
+
+def transcode_sounds(assets_dir):
+    """Convierte los sonidos a PCM con el formato del mezclador.
+    
+    Así la aplicación carga los efectos con Sound(buffer=...) sin decodificar
+    MP3 en el arranque (ver SoundManager.load_default_sounds).
+    """
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    import pygame
+    from utils.sound_manager import MIXER_FORMAT, pcm_resource_name
+    
+    frequency, size, channels = MIXER_FORMAT
+    pygame.mixer.init(frequency=frequency, size=size, channels=channels)
+    mixer_format = pygame.mixer.get_init()
+    
+    sounds_dir = os.path.join(assets_dir, 'sounds')
+    total = 0
+    try:
+        for filename in sorted(os.listdir(sounds_dir)):
+            if os.path.splitext(filename)[1].lower() not in ('.mp3', '.ogg', '.wav'):
+                continue
+            resource = pcm_resource_name(filename, mixer_format)
+            if resource is None:
+                print(f"⚠️ Formato de mezclador sin PCM precalculado: {mixer_format}")
+                break
+            
+            # El recurso empieza por "assets/": se escribe dentro de assets_dir
+            pcm_path = os.path.join(os.path.dirname(assets_dir), *resource.split('/'))
+            os.makedirs(os.path.dirname(pcm_path), exist_ok=True)
+            with open(pcm_path, 'wb') as f:
+                f.write(pygame.mixer.Sound(os.path.join(sounds_dir, filename)).get_raw())
+            total += 1
+    finally:
+        pygame.mixer.quit()
+    return total
+
+def prepare_resources(profile, app_dir):
+    """Empaqueta los assets (y, en los perfiles precompilados, los prepara)"""
+    staging_dir = os.path.join('build', profile, 'resources')
+    if os.path.exists(staging_dir):
+        shutil.rmtree(staging_dir)
+    shutil.copytree('assets', os.path.join(staging_dir, 'assets'))
+    
+    if PROFILES[profile]['precompiled']:
+        converted = transcode_sounds(os.path.join(staging_dir, 'assets'))
+        print(f"🔊 Sonidos convertidos a PCM: {converted}")
+        
+        from core.vocabulary import (VOCABULARY_PACK_NAME, alternative_answers,
+                                     synonym_groups, vocabulary_data)
+        from core.vocabulary_pack import compile_vocabulary_pack
+        words = compile_vocabulary_pack(vocabulary_data,
+                                        os.path.join(app_dir, VOCABULARY_PACK_NAME),
+                                        alternative_answers, synonym_groups)
+        print(f"📚 Vocabulario compilado: {words} palabras")
+    
+    # Empaquetar los assets en un único archivo sin comprimir
+    pack_path = os.path.join(app_dir, RESOURCE_PACK_NAME)
+    total = build_resource_pack(pack_path, ['assets'], root_dir=staging_dir)
+    print(f"📦 Recursos empaquetados: {pack_path} ({total} archivos)")
+
+def build_executable(profile=DEFAULT_PROFILE):
     """Construye el ejecutable con PyInstaller"""
+    settings = PROFILES[profile]
+    app_dir, exe_path = artifact_paths(profile)
     
     # Configuración para PyInstaller
     args = [
         'main.py',  # Archivo principal
-        '--name=EnglishAdventure',  # Nombre del ejecutable
-        '--onefile',  # Un solo archivo .exe
+        f'--name={APP_NAME}',  # Nombre del ejecutable
+        '--onefile' if settings['onefile'] else '--onedir',
         '--windowed',  # Sin consola (ocultar terminal)
         '--clean',  # Limpiar builds anteriores
         '--noconfirm',  # No preguntar confirmación
         
-        # Icono de la aplicación
-        '--icon=assets/icon/icon.ico',
+        # Cada perfil en su carpeta para poder compararlos
+        f'--distpath={os.path.join("dist", profile)}',
+        f'--workpath={os.path.join("build", profile)}',
+        f'--specpath={os.path.join("build", profile)}',
         
-        # Incluir recursos
-        '--add-data=assets;assets',
-        '--add-data=core;core',
-        '--add-data=ui;ui',
-        '--add-data=utils;utils',
+        # Icono de la aplicación
+        f'--icon={os.path.abspath("assets/icon/icon.ico")}',
         
-        # Excluir módulos innecesarios (reduce tamaño)
+        # Excluir módulos innecesarios (reduce tamaño). numpy es opcional:
+        # los tonos de respaldo se sintetizan también sin él
         '--exclude-module=matplotlib',
         '--exclude-module=scipy',
         '--exclude-module=numpy',
@@ -41,51 +138,127 @@ def build_executable():
         '--optimize=2',
     ]
     
+    # Los assets van en resources.pack, junto al ejecutable, para no
+    # extraerlos a una carpeta temporal en cada arranque
+    if not settings['precompiled']:
+        # Copia del código fuente; los perfiles precompilados usan solo el
+        # bytecode optimizado que PyInstaller ya incluye
+        for folder in ('core', 'ui', 'utils'):
+            args.append(f'--add-data={os.path.abspath(folder)}{os.pathsep}{folder}')
+    
     # Para Windows específicamente
     if sys.platform == 'win32':
         args.extend([
             '--uac-admin',  # No pedir admin por defecto
         ])
     
-    print("🚀 Construyendo ejecutable...")
+    print(f"🚀 Construyendo ejecutable (perfil {profile})...")
     print(f"📋 Argumentos: {' '.join(args)}")
     
     try:
         PyInstaller.__main__.run(args)
         print("✅ ¡Ejecutable creado exitosamente!")
-        print("📁 El archivo se encuentra en: dist/EnglishAdventure.exe")
+        print(f"📁 El archivo se encuentra en: {exe_path}")
+        
+        prepare_resources(profile, app_dir)
         
         # Copiar recursos adicionales si es necesario
         if os.path.exists('data'):
             print("📋 Copiando datos de usuario...")
-            if not os.path.exists('dist/data'):
-                shutil.copytree('data', 'dist/data')
-        
+            if not os.path.exists(os.path.join(app_dir, 'data')):
+                shutil.copytree('data', os.path.join(app_dir, 'data'))
+    
     except Exception as e:
         print(f"❌ Error al crear el ejecutable: {e}")
         return False
     
     return True
 
-def create_portable_version():
+def artifact_size(path):
+    """Tamaño en bytes de un archivo o de una carpeta completa"""
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for folder, _dirs, names in os.walk(path):
+        for name in names:
+            total += os.path.getsize(os.path.join(folder, name))
+    return total
+
+def launch_headless(exe_path, timeout=60):
+    """Arranca el ejecutable hasta la primera pintura y devuelve (ms reales, traza)"""
+    fd, trace_path = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    env = dict(os.environ)
+    env[EXIT_AFTER_PAINT_ENV] = '1'
+    env[TRACE_FILE_ENV] = trace_path
+    env.setdefault('SDL_AUDIODRIVER', 'dummy')
+    
+    command = [os.path.abspath(exe_path)]
+    # En Linux sin pantalla, Tk necesita un servidor X virtual
+    if sys.platform.startswith('linux') and not env.get('DISPLAY') and shutil.which('xvfb-run'):
+        command = ['xvfb-run', '-a'] + command
+    
+    try:
+        start = time.perf_counter()
+        subprocess.run(command, env=env, timeout=timeout, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        elapsed = (time.perf_counter() - start) * 1000
+        with open(trace_path, 'r', encoding='utf-8') as f:
+            trace = json.load(f) if os.path.getsize(trace_path) else {}
+        return elapsed, trace
+    finally:
+        os.remove(trace_path)
+
+def benchmark_startup(profile, runs=5):
+    """Mide el arranque de un perfil ya construido.
+    
+    La primera ejecución tras la build cuenta como arranque en frío (en
+    onefile incluye la extracción); las siguientes, como arranque en
+    caliente (se da la mediana). Para un frío real hay que reiniciar el
+    equipo o vaciar la caché de disco antes de medir.
+    """
+    app_dir, exe_path = artifact_paths(profile)
+    if not os.path.exists(exe_path):
+        print(f"⚠️ No existe el ejecutable del perfil {profile}: {exe_path}")
+        return None
+    
+    timings = [launch_headless(exe_path) for _ in range(max(2, runs))]
+    cold_ms, cold_trace = timings[0]
+    warm = timings[1:]
+    return {
+        'profile': profile,
+        'size_mb': round(artifact_size(exe_path if PROFILES[profile]['onefile'] else app_dir)
+                         / (1024 * 1024), 1),
+        'cold_ms': round(cold_ms, 1),
+        'warm_ms': round(statistics.median(elapsed for elapsed, _ in warm), 1),
+        'cold_first_paint_ms': cold_trace.get('first_paint'),
+        'warm_first_paint_ms': statistics.median(
+            [trace['first_paint'] for _, trace in warm if 'first_paint' in trace] or [0]),
+    }
+
+def print_benchmark(results):
+    print("\n⏱️ Arranque por perfil (proceso completo / primera pintura):")
+    print(f"   {'perfil':<12} {'tamaño':>9} {'frío':>16} {'caliente':>16}")
+    for result in results:
+        print(f"   {result['profile']:<12} {result['size_mb']:>6.1f} MB "
+              f"{result['cold_ms']:>7.0f} / {result['cold_first_paint_ms'] or 0:>5.0f} ms "
+              f"{result['warm_ms']:>7.0f} / {result['warm_first_paint_ms']:>5.0f} ms")
+
+def create_portable_version(profile=DEFAULT_PROFILE):
     print("🎒 Creando versión portable...")
     
     portable_dir = "EnglishAdventure_Portable"
+    app_dir, exe_path = artifact_paths(profile)
     
     if os.path.exists(portable_dir):
         shutil.rmtree(portable_dir)
     
-    # Crear estructura
-    os.makedirs(portable_dir)
-    
-    # Copiar ejecutable
-    if os.path.exists("dist/EnglishAdventure.exe"):
-        shutil.copy2("dist/EnglishAdventure.exe", 
-                    os.path.join(portable_dir, "EnglishAdventure.exe"))
-    
-    # Copiar assets si existen
-    if os.path.exists("assets"):
-        shutil.copytree("assets", os.path.join(portable_dir, "assets"))
+    # Copiar el ejecutable con todo lo que lo acompaña (bibliotecas en
+    # onedir, paquete de recursos y vocabulario compilado)
+    if os.path.exists(exe_path):
+        shutil.copytree(app_dir, portable_dir)
+    else:
+        os.makedirs(portable_dir)
     
     # Crear README portable
     readme_text = """# Aventura de Inglés - Versión Portable
@@ -105,14 +278,32 @@ Puedes copiar esta carpeta a cualquier lugar.
 
 ¡Disfruta aprendiendo!
 """
-    
+
     with open(os.path.join(portable_dir, "README.txt"), "w", encoding="utf-8") as f:
         f.write(readme_text)
     
     print(f"✅ Versión portable creada en: {portable_dir}/")
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Construye Aventura de Inglés")
+    parser.add_argument('--profile', choices=sorted(PROFILES) + ['all'], default=DEFAULT_PROFILE,
+                        help="perfil de build (por defecto: onefile)")
+    parser.add_argument('--benchmark', action='store_true',
+                        help="medir el arranque de cada perfil tras construirlo")
+    parser.add_argument('--benchmark-only', action='store_true',
+                        help="medir sin volver a construir")
+    parser.add_argument('--runs', type=int, default=5,
+                        help="arranques por perfil al medir (el primero es en frío)")
+    parser.add_argument('--report', help="guardar los resultados de la medición en JSON")
+    parser.add_argument('--portable', choices=['s', 'n'],
+                        help="crear la versión portable sin preguntar")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Función principal del script de build"""
+    args = parse_args(argv)
+    profiles = sorted(PROFILES) if args.profile == 'all' else [args.profile]
+    
     print("=" * 50)
     print("🔧 CONSTRUCTOR DE EJECUTABLE - AVENTURA DE INGLÉS")
     print("=" * 50)
@@ -123,28 +314,43 @@ def main():
         print("   Directorio actual:", os.getcwd())
         return
     
-    # Limpiar builds anteriores
-    clean_build_folders()
-    
-    # Construir ejecutable
-    if build_executable():
-        # Crear versión portable opcional
-        create = input("\n¿Crear versión portable también? (s/n): ").lower()
+    if not args.benchmark_only:
+        # Limpiar builds anteriores
+        clean_build_folders()
+        
+        # Construir ejecutables
+        built = [profile for profile in profiles if build_executable(profile)]
+        if not built:
+            print("❌ Fallo en la construcción del ejecutable")
+            return
+        
+        # Crear versión portable opcional (del primer perfil construido)
+        create = args.portable or input("\n¿Crear versión portable también? (s/n): ").lower()
         if create == 's':
-            create_portable_version()
+            create_portable_version(built[0])
         
         print("\n" + "=" * 50)
         print("🎉 ¡PROCESO COMPLETADO!")
         print("=" * 50)
         print("\n📋 Resumen:")
-        print("  • Ejecutable: dist/EnglishAdventure.exe")
-        print("  • Tamaño aproximado: 20-30 MB")
+        for profile in built:
+            print(f"  • {profile}: {artifact_paths(profile)[1]}")
+        print(f"  • Recursos: {RESOURCE_PACK_NAME} (debe ir junto al ejecutable)")
         print("  • Requisitos: Windows 7/8/10/11 (64-bit)")
-        print("\n⚠️  Nota: El primer inicio puede ser lento")
-        print("   debido a la extracción de archivos.")
-        
-    else:
-        print("❌ Fallo en la construcción del ejecutable")
+        if 'onefile' in built:
+            print("\n⚠️  Nota: en el perfil onefile el primer inicio puede ser lento")
+            print("   debido a la extracción de archivos (onedir no extrae nada).")
+        profiles = built
+    
+    if args.benchmark or args.benchmark_only:
+        results = [benchmark_startup(profile, args.runs) for profile in profiles]
+        results = [result for result in results if result]
+        if results:
+            print_benchmark(results)
+            if args.report:
+                with open(args.report, 'w', encoding='utf-8') as f:
+                    json.dump(results, f, indent=2)
+                print(f"💾 Resultados guardados en: {args.report}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,214 @@
+# core/achievements.py - LOGROS POR CONTADORES
+from datetime import datetime
+
+from .vocabulary import get_category_size, get_vocabulary
+
+
+class AchievementRule:
+    """Regla declarativa: un logro y los contadores de los que depende"""
+
+    __slots__ = ("id", "name", "counters", "check")
+
+    def __init__(self, rule_id, name, counters, check):
+        self.id = rule_id
+        self.name = name
+        self.counters = tuple(counters)
+        # check(contadores) -> bool
+        self.check = check
+
+
+def threshold_rule(rule_id, name, counter, value):
+    """Logro que se desbloquea cuando un contador llega a un valor"""
+    return AchievementRule(rule_id, name, (counter,),
+                           lambda counters: counters.get(counter, 0) >= value)
+
+
+def accuracy_rule(rule_id, name, percent):
+    """Logro por precisión global (aciertos / preguntas)"""
+    def check(counters):
+        questions = counters.get("total_questions", 0)
+        return questions > 0 and counters.get("total_correct", 0) * 100 >= percent * questions
+    return AchievementRule(rule_id, name, ("total_questions", "total_correct"), check)
+
+
+def mastery_rule(category, size):
+    """Logro por acertar al menos una vez todas las palabras de una categoría"""
+    counter = f"mastered.{category}"
+    return AchievementRule(f"mastery.{category}", f"Dominio de {category}", (counter,),
+                           lambda counters: size > 0 and counters.get(counter, 0) >= size)
+
+
+DEFAULT_RULES = [
+    # Logros basados en puntuación
+    threshold_rule("score_100", "Primeros 100 puntos", "score", 100),
+    threshold_rule("score_500", "500 puntos", "score", 500),
+    threshold_rule("score_1000", "Maestro del inglés (1000 puntos)", "score", 1000),
+    # Logros basados en nivel
+    threshold_rule("level_5", "Nivel 5 alcanzado", "level", 5),
+    threshold_rule("level_10", "Nivel 10 alcanzado", "level", 10),
+    # Logros basados en juegos jugados
+    threshold_rule("games_10", "10 juegos completados", "total_games", 10),
+    threshold_rule("games_50", "50 juegos completados", "total_games", 50),
+    # Logros basados en precisión
+    accuracy_rule("accuracy_80", "Precisión del 80%", 80),
+    accuracy_rule("accuracy_95", "Precisión experta (95%)", 95),
+]
+
+
+def category_rules(vocabulary=None):
+    """Crea un logro de dominio por cada categoría del vocabulario"""
+    vocabulary = get_vocabulary() if vocabulary is None else vocabulary
+    return [mastery_rule(category, get_category_size(category, vocabulary))
+            for category in vocabulary.keys()]
+
+
+def evaluate(counters, rules=None):
+    """Devuelve los nombres de los logros cumplidos con unos contadores"""
+    rules = DEFAULT_RULES if rules is None else rules
+    return [rule.name for rule in rules if rule.check(counters)]
+
+
+class AchievementEngine:
+    """Motor incremental de logros.
+
+    Cada regla se suscribe a sus contadores; al cambiar un contador solo se
+    vuelven a comprobar las reglas suscritas que aún no están desbloqueadas.
+    Los logros nuevos se emiten como eventos ``{"type": "achievement", "id",
+    "name", "time"}`` a los oyentes registrados con ``subscribe``.
+    """
+
+    def __init__(self, rules=None):
+        self.rules = {}
+        self.counters = {}
+        self.unlocked = {}
+        self._subscriptions = {}
+        self._listeners = []
+        # Palabras acertadas por categoría (para los logros de dominio)
+        self._mastered = {}
+        # Mientras está en pausa solo se anotan los contadores cambiados
+        self._paused = 0
+        self._pending = set()
+
+        for rule in (DEFAULT_RULES if rules is None else rules):
+            self.add_rule(rule)
+
+    def add_rule(self, rule):
+        """Registra una regla y la suscribe a sus contadores"""
+        self.rules[rule.id] = rule
+        for counter in rule.counters:
+            self._subscriptions.setdefault(counter, []).append(rule)
+
+    def subscribe(self, listener):
+        """Registra una función que recibe cada logro desbloqueado"""
+        self._listeners.append(listener)
+
+    # --- Estado ---
+
+    def to_dict(self):
+        """Estado serializable (contadores, palabras acertadas y logros)"""
+        return {
+            "counters": dict(self.counters),
+            "mastered": {category: sorted(words) for category, words in self._mastered.items()},
+            "unlocked": dict(self.unlocked)
+        }
+
+    def load_state(self, state):
+        """Restaura el estado guardado con to_dict, sin emitir eventos"""
+        self.counters = dict(state.get("counters", {}))
+        self.unlocked = dict(state.get("unlocked", {}))
+        self._mastered = {}
+        for category, words in state.get("mastered", {}).items():
+            self._mastered[category] = set(words)
+            self.counters[f"mastered.{category}"] = len(words)
+
+    def restore(self, rule_id, when):
+        """Marca un logro como desbloqueado en una fecha (al reproducir el diario)"""
+        self.unlocked[rule_id] = when
+
+    def pause(self):
+        """Acumula cambios sin comprobar reglas (p. ej. al reproducir el diario)"""
+        self._paused += 1
+
+    def resume(self):
+        """Reanuda y comprueba las reglas afectadas mientras estaba en pausa"""
+        self._paused = max(0, self._paused - 1)
+        if self._paused == 0 and self._pending:
+            changed, self._pending = self._pending, set()
+            return self._check(changed)
+        return []
+
+    # --- Contadores ---
+
+    def set_counter(self, counter, value):
+        """Fija un contador absoluto (puntuación, nivel)"""
+        if self.counters.get(counter) == value:
+            return []
+        self.counters[counter] = value
+        return self._changed((counter,))
+
+    def increment(self, counter, amount=1):
+        """Suma a un contador acumulado"""
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+        return self._changed((counter,))
+
+    def record_answer(self, category, spanish, correct):
+        """Cuenta una palabra acertada por primera vez en su categoría"""
+        if not correct:
+            return []
+        words = self._mastered.setdefault(category, set())
+        if spanish in words:
+            return []
+        words.add(spanish)
+        return self.set_counter(f"mastered.{category}", len(words))
+
+    def record_game(self, correct, questions):
+        """Suma una partida terminada a los contadores globales"""
+        for counter, amount in (("total_games", 1), ("total_questions", questions),
+                                ("total_correct", correct)):
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+        return self._changed(("total_games", "total_questions", "total_correct"))
+
+    # --- Reglas ---
+
+    def _changed(self, counters):
+        if self._paused:
+            self._pending.update(counters)
+            return []
+        return self._check(counters)
+
+    def _check(self, counters):
+        # Solo las reglas suscritas a los contadores cambiados
+        unlocked = []
+        for counter in counters:
+            for rule in self._subscriptions.get(counter, ()):
+                if rule.id not in self.unlocked and rule.check(self.counters):
+                    unlocked.append(self._unlock(rule))
+        return unlocked
+
+    def check_all(self):
+        """Comprueba todas las reglas (tras cargar o al añadir reglas nuevas)"""
+        return self._check(list(self._subscriptions))
+
+    def _unlock(self, rule):
+        event = {"type": "achievement", "id": rule.id, "name": rule.name,
+                 "time": datetime.now().isoformat()}
+        self.unlocked[rule.id] = event["time"]
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                print(f"Error al notificar logro: {e}")
+        return event
+
+    # --- Consultas ---
+
+    def get_unlocked(self):
+        """Lista de (regla, fecha) de los logros desbloqueados, por fecha"""
+        items = [(self.rules[rule_id], when) for rule_id, when in self.unlocked.items()
+                 if rule_id in self.rules]
+        items.sort(key=lambda item: item[1])
+        return items
+
+    def get_names(self):
+        """Nombres de los logros desbloqueados"""
+        return [rule.name for rule, _ in self.get_unlocked()]
@@ -0,0 +1,156 @@
+# core/answer_index.py - RESPUESTAS ACEPTADAS Y SINÓNIMOS
+from array import array
+
+from .answer_matcher import normalize
+from .vocabulary_pack import VocabularyPack
+
+
+def form_key(english):
+    """Clave de una traducción inglesa: "Hello " y "hello" son la misma forma"""
+    return english.strip().lower()
+
+
+class AnswerIndex:
+    """Traducciones aceptadas de cada palabra del índice como ids internados.
+
+    Cada traducción inglesa (principal, alternativa o sinónimo) se guarda una
+    sola vez y se identifica por su id de forma. Las formas equivalentes
+    comparten id de grupo, así que saber si una traducción vale para una
+    palabra, o si un distractor es en realidad un sinónimo de la correcta,
+    es comparar enteros en lugar de cadenas.
+
+    Las formas principales se internan primero: los ids menores que
+    ``primary_count`` son respuestas principales de alguna palabra.
+    """
+
+    def __init__(self, word_index, alternatives=None, synonym_groups=()):
+        self.word_index = word_index
+        self.forms = []
+        # Forma principal de cada posición del índice
+        self.form_ids = array("I")
+        # Grupo de sinónimos de cada forma (su propio id si no tiene)
+        self.group_ids = array("I")
+        self.primary_count = 0
+        self._form_lookup = {}
+        # id de grupo -> ids de forma, solo para grupos de más de una forma
+        self._groups = {}
+        # id de palabra -> ids de forma alternativos (pocas palabras los tienen)
+        self._alternatives = {}
+        self._entries_by_group = None
+        self.build(alternatives or {}, synonym_groups or ())
+
+    def intern(self, english):
+        """Devuelve el id de forma de una traducción, creándolo si no existe"""
+        key = form_key(english)
+        form_id = self._form_lookup.get(key)
+        if form_id is None:
+            form_id = self._form_lookup[key] = len(self.forms)
+            self.forms.append(english)
+            self.group_ids.append(form_id)
+        return form_id
+
+    def build(self, alternatives, synonym_groups):
+        """Interna las traducciones principales, las alternativas y los grupos"""
+        index = self.word_index
+        vocabulary = index.vocabulary
+        if isinstance(vocabulary, VocabularyPack):
+            # Las cadenas del paquete ya están internadas: se decodifica cada
+            # traducción una vez y nunca el texto español
+            english_ids = vocabulary.english_ids()
+            by_string = {}
+            for word_id in index.word_ids:
+                string_id = english_ids[word_id]
+                form_id = by_string.get(string_id)
+                if form_id is None:
+                    form_id = by_string[string_id] = self.intern(vocabulary.get_string(string_id))
+                self.form_ids.append(form_id)
+        else:
+            for position in range(len(index)):
+                _, english = index.get_word(index.word_ids[position])
+                self.form_ids.append(self.intern(english))
+        self.primary_count = len(self.forms)
+
+        for word_id, extra in alternatives.items():
+            ids = tuple(self.intern(english) for english in extra)
+            if ids:
+                self._alternatives[word_id] = ids
+
+        for group in synonym_groups:
+            self.join([self.intern(english) for english in group])
+
+    def join(self, form_ids):
+        """Une en un solo grupo las formas indicadas (y sus grupos actuales)"""
+        roots = {self.group_ids[form_id] for form_id in form_ids}
+        if len(roots) < 2:
+            return
+        root = min(roots)
+        members = []
+        for group_id in roots:
+            members.extend(self._groups.pop(group_id, (group_id,)))
+        for form_id in members:
+            self.group_ids[form_id] = root
+        self._groups[root] = tuple(sorted(members))
+        self._entries_by_group = None
+
+    # --- Consultas ---
+
+    def form_id(self, english):
+        """Devuelve el id de forma de una traducción, o None"""
+        return self._form_lookup.get(form_key(english))
+
+    def __contains__(self, text):
+        """Indica si lo escrito es alguna traducción del vocabulario"""
+        return form_key(text) in self._form_lookup or normalize(text) in self._form_lookup
+
+    def synonyms(self, form_id):
+        """Ids de forma equivalentes a una forma (incluida ella misma)"""
+        return self._groups.get(self.group_ids[form_id], (form_id,))
+
+    def accepted_form_ids(self, position):
+        """Forma principal y alternativas de una posición del índice"""
+        word_id = self.word_index.word_ids[position]
+        return (self.form_ids[position],) + self._alternatives.get(word_id, ())
+
+    def accepted_groups(self, position):
+        """Ids de grupo que se aceptan como respuesta en una posición"""
+        return {self.group_ids[form_id] for form_id in self.accepted_form_ids(position)}
+
+    def accepted_answers(self, position):
+        """Traducciones aceptadas de una posición; la principal va primero"""
+        answers = []
+        seen = set()
+        for form_id in self.accepted_form_ids(position):
+            for synonym in (form_id,) + self.synonyms(form_id):
+                if synonym not in seen:
+                    seen.add(synonym)
+                    answers.append(self.forms[synonym])
+        return answers
+
+    def is_accepted(self, position, english):
+        """Indica si una traducción (o un sinónimo suyo) vale en una posición"""
+        form_id = self.form_id(english)
+        if form_id is None:
+            return False
+        group_id = self.group_ids[form_id]
+        return any(self.group_ids[accepted] == group_id
+                   for accepted in self.accepted_form_ids(position))
+
+    def entries_for(self, english):
+        """Posiciones del índice que aceptan una traducción inglesa"""
+        form_id = self.form_id(english)
+        if form_id is None:
+            return ()
+        if self._entries_by_group is None:
+            # Índice inverso inglés -> entradas, construido solo si se consulta
+            entries = {}
+            word_ids = self.word_index.word_ids
+            for position, primary in enumerate(self.form_ids):
+                group_id = self.group_ids[primary]
+                entries.setdefault(group_id, array("I")).append(position)
+                for extra in self._alternatives.get(word_ids[position], ()):
+                    extra_group = self.group_ids[extra]
+                    bucket = entries.setdefault(extra_group, array("I"))
+                    if extra_group != group_id and (not bucket or bucket[-1] != position):
+                        bucket.append(position)
+            self._entries_by_group = entries
+        return self._entries_by_group.get(self.group_ids[form_id], ())
@@ -0,0 +1,269 @@
+# core/answer_matcher.py - COMPROBACIÓN TOLERANTE DE RESPUESTAS
+import unicodedata
+from collections import OrderedDict
+
+# Veredictos
+EXACT = "exact"      # igual tras normalizar (mayúsculas, acentos, espacios...)
+CLOSE = "close"      # con una errata pequeña: cuenta como acierto
+WRONG = "wrong"
+
+# Apóstrofos y comillas que se eliminan sin separar palabras ("you're" = "youre")
+_APOSTROPHES = "'’‘`´"
+# Ortografía británica/americana aceptada en ambos sentidos
+SPELLING_VARIANTS = {
+    "gray": "grey",
+    "color": "colour",
+    "favorite": "favourite",
+    "neighbor": "neighbour",
+    "center": "centre",
+    "theater": "theatre",
+    "mom": "mum",
+    "pajamas": "pyjamas",
+    "airplane": "aeroplane",
+}
+# Contracciones: se acepta la forma larga (tras quitar el apóstrofo)
+CONTRACTIONS = {
+    "youre": "you are",
+    "im": "i am",
+    "its": "it is",
+    "dont": "do not",
+    "doesnt": "does not",
+    "cant": "cannot",
+    "isnt": "is not",
+    "thats": "that is",
+    "lets": "let us",
+    "whats": "what is",
+}
+# Palabras opcionales al principio de la respuesta ("the dog", "to run")
+OPTIONAL_PREFIXES = ("to", "the", "a", "an")
+
+# Letras iniciales que no pueden llevar las dos erratas de una distancia 2
+# ("grandmother" no vale por "grandfather" ni "mother" por "father")
+PREFIX_LETTERS = 4
+
+# Respuestas preparadas que se mantienen en memoria
+DEFAULT_CACHE_SIZE = 4096
+
+
+def fold(text):
+    """Minúsculas y sin acentos ni diacríticos (la ñ pasa a n)"""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def normalize(text):
+    """Forma normalizada: sin acentos, apóstrofos ni puntuación, espacios simples"""
+    text = fold(text)
+    words = []
+    word = []
+    for char in text:
+        if char in _APOSTROPHES:
+            continue
+        if char.isalnum():
+            word.append(char)
+        elif word:
+            words.append("".join(word))
+            word = []
+    if word:
+        words.append("".join(word))
+    return " ".join(words)
+
+
+def variants(answer):
+    """Formas aceptadas de una respuesta, ya normalizadas y sin espacios.
+
+    Se compara sin espacios para que "thankyou" valga por "thank you".
+    """
+    base = normalize(answer).split()
+    forms = set()
+    pending = [base]
+    while pending:
+        words = pending.pop()
+        form = "".join(words)
+        if not form or form in forms:
+            continue
+        forms.add(form)
+        for i, word in enumerate(words):
+            # Ortografía alternativa y contracciones, palabra a palabra
+            for source, target in SPELLING_VARIANTS.items():
+                if word == source:
+                    pending.append(words[:i] + [target] + words[i + 1:])
+                elif word == target:
+                    pending.append(words[:i] + [source] + words[i + 1:])
+            expanded = CONTRACTIONS.get(word)
+            if expanded:
+                pending.append(words[:i] + expanded.split() + words[i + 1:])
+        if len(words) > 1 and words[0] in OPTIONAL_PREFIXES:
+            pending.append(words[1:])
+    return forms
+
+
+def max_typos(length):
+    """Erratas permitidas según la longitud: ninguna en palabras muy cortas"""
+    if length <= 3:
+        return 0
+    if length <= 7:
+        return 1
+    return 2
+
+
+def pattern_masks(pattern):
+    """Máscaras de bits por carácter para el algoritmo de Myers"""
+    masks = {}
+    for i, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def edit_distance(pattern, text, limit=None, masks=None):
+    """Distancia de Levenshtein con el algoritmo bit-paralelo de Myers.
+
+    Procesa una columna por carácter de 'text' con operaciones sobre enteros
+    (una palabra de bits por fila del patrón). Con 'limit' devuelve
+    limit + 1 en cuanto la distancia ya no puede bajar de ese valor.
+    """
+    m = len(pattern)
+    n = len(text)
+    if limit is not None and abs(m - n) > limit:
+        return limit + 1
+    if m == 0:
+        return n
+
+    masks = masks if masks is not None else pattern_masks(pattern)
+    full = (1 << m) - 1
+    high = 1 << (m - 1)
+    vp = full
+    vn = 0
+    score = m
+    for position, char in enumerate(text):
+        eq = masks.get(char, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        hp = (vn | ~(xh | vp)) & full
+        hn = vp & xh
+        if hp & high:
+            score += 1
+        elif hn & high:
+            score -= 1
+        # Distancia global: la fila 0 crece uno por columna
+        hp = ((hp << 1) | 1) & full
+        hn = (hn << 1) & full
+        vp = (hn | ~(xv | hp)) & full
+        vn = hp & xv
+        if limit is not None and score - (n - position - 1) > limit:
+            return limit + 1
+    return score
+
+
+class MatchResult:
+    """Resultado de comparar una respuesta escrita"""
+
+    __slots__ = ("verdict", "expected", "distance")
+
+    def __init__(self, verdict, expected, distance=0):
+        self.verdict = verdict
+        # Respuesta aceptada más parecida a lo escrito
+        self.expected = expected
+        self.distance = distance
+
+    @property
+    def correct(self):
+        return self.verdict != WRONG
+
+    def __repr__(self):
+        return f"MatchResult({self.verdict!r}, {self.expected!r}, {self.distance})"
+
+
+class AcceptedAnswer:
+    """Respuestas aceptadas de una palabra con sus formas precalculadas"""
+
+    __slots__ = ("answers", "forms", "masks")
+
+    def __init__(self, answers):
+        self.answers = tuple(answers)
+        # forma normalizada -> respuesta original que la produjo
+        self.forms = {}
+        for answer in self.answers:
+            for form in variants(answer):
+                self.forms.setdefault(form, answer)
+        self.masks = {form: pattern_masks(form) for form in self.forms}
+
+
+class AnswerMatcher:
+    """Compara respuestas escritas con las traducciones aceptadas.
+
+    Las formas normalizadas de cada palabra se calculan la primera vez que
+    se pregunta por ella y se guardan en una caché LRU, de modo que cada
+    comprobación (incluida la de cada pulsación) solo normaliza lo escrito y
+    calcula distancias acotadas contra unas pocas formas cortas.
+    """
+
+    def __init__(self, cache_size=DEFAULT_CACHE_SIZE):
+        self.cache_size = cache_size
+        self._prepared = OrderedDict()
+
+    def prepare(self, answers):
+        """Devuelve las formas aceptadas de una respuesta o lista de respuestas"""
+        key = (answers,) if isinstance(answers, str) else tuple(answers)
+        accepted = self._prepared.get(key)
+        if accepted is None:
+            accepted = self._prepared[key] = AcceptedAnswer(key)
+            if len(self._prepared) > self.cache_size:
+                self._prepared.popitem(last=False)
+        else:
+            self._prepared.move_to_end(key)
+        return accepted
+
+    def match(self, answers, given, known_forms=None):
+        """Compara lo escrito con la respuesta (o respuestas) aceptadas.
+
+        'known_forms' es el índice de respuestas del vocabulario (AnswerIndex
+        o ReverseIndex): si lo escrito es otra palabra del vocabulario que no
+        se acepta aquí, no se toma por una errata ("pear" no vale por "bear").
+        """
+        accepted = self.prepare(answers)
+        typed = normalize(given).replace(" ", "")
+        if not typed:
+            return MatchResult(WRONG, accepted.answers[0], None)
+
+        expected = accepted.forms.get(typed)
+        if expected is not None:
+            return MatchResult(EXACT, expected, 0)
+
+        best = None
+        for form, answer in accepted.forms.items():
+            limit = max_typos(len(form))
+            if best is not None:
+                limit = min(limit, best[0] - 1)
+            if limit < 0 or abs(len(form) - len(typed)) > limit:
+                continue
+            distance = edit_distance(form, typed, limit, accepted.masks[form])
+            if distance == 2 and edit_distance(form[:PREFIX_LETTERS],
+                                               typed[:PREFIX_LETTERS], 1) > 1:
+                # Las dos erratas al principio: es otra palabra, no un despiste
+                continue
+            if distance <= limit:
+                best = (distance, answer)
+                if distance == 1:
+                    break
+
+        if best is None:
+            return MatchResult(WRONG, accepted.answers[0], None)
+        if known_forms is not None and given in known_forms:
+            return MatchResult(WRONG, best[1], None)
+        return MatchResult(CLOSE, best[1], best[0])
+
+    def is_exact(self, answers, given):
+        """Comprobación rápida (sin distancias) para cada pulsación"""
+        return normalize(given).replace(" ", "") in self.prepare(answers).forms
+
+
+_default_matcher = None
+
+
+def get_matcher():
+    """Comparador compartido por todas las sesiones"""
+    global _default_matcher
+    if _default_matcher is None:
+        _default_matcher = AnswerMatcher()
+    return _default_matcher
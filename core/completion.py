@@ -0,0 +1,79 @@
+# core/completion.py - AUTOCOMPLETADO DE RESPUESTAS
+import heapq
+from array import array
+from bisect import bisect_left
+
+from .answer_matcher import normalize
+
+# Sugerencias que se muestran a la vez
+DEFAULT_LIMIT = 5
+
+
+def completion_key(text):
+    """Clave normalizada; atajo sin unicodedata para el caso ASCII habitual"""
+    key = text.strip().lower()
+    if key.isascii() and key.replace(" ", "").isalnum() and "  " not in key:
+        return key
+    return normalize(text)
+
+
+class CompletionIndex:
+    """Sugerencias por prefijo sobre las respuestas del vocabulario.
+
+    Las formas (ya únicas en AnswerIndex o ReverseIndex) se guardan en un
+    arreglo ordenado por su clave normalizada, así que las que empiezan por
+    un prefijo ocupan un rango contiguo que se localiza con dos búsquedas
+    binarias; "pla" encuentra "plátano" porque la clave no lleva acentos.
+
+    Dentro del rango se eligen las mejor clasificadas: primero las que
+    responden a más entradas del vocabulario y, a igualdad, las más cortas
+    (más fáciles).
+    """
+
+    def __init__(self, answers):
+        self.answers = answers
+        forms = answers.forms
+
+        # Entradas que acepta cada forma: frecuencia en el vocabulario
+        frequency = [0] * len(forms)
+        for form_id in answers.form_ids:
+            frequency[form_id] += 1
+
+        keys = [completion_key(form) for form in forms]
+        order = sorted(range(len(forms)), key=keys.__getitem__)
+        self.keys = [keys[form_id] for form_id in order]
+        self.form_ids = array("I", order)
+
+        # Puesto de cada forma en la clasificación (0 = la mejor)
+        ranking = sorted(range(len(forms)),
+                         key=lambda form_id: (-frequency[form_id], len(keys[form_id]),
+                                              keys[form_id]))
+        rank = array("I", [0]) * len(forms)
+        for position, form_id in enumerate(ranking):
+            rank[form_id] = position
+        self.ranks = array("I", (rank[form_id] for form_id in order))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def prefix_range(self, prefix):
+        """Rango (inicio, fin) del arreglo ordenado con ese prefijo normalizado"""
+        start = bisect_left(self.keys, prefix)
+        # '\U0010ffff' es mayor que cualquier carácter: cierra el rango del prefijo
+        end = bisect_left(self.keys, prefix + "\U0010ffff", start)
+        return start, end
+
+    def complete(self, text, limit=DEFAULT_LIMIT):
+        """Formas que empiezan por lo escrito, de la mejor a la peor clasificada"""
+        prefix = completion_key(text)
+        if not prefix:
+            return []
+        if text[-1:].isspace():
+            # "ice " completa "ice cream" pero no "iceberg"
+            prefix += " "
+        start, end = self.prefix_range(prefix)
+        if start >= end:
+            return []
+        forms = self.answers.forms
+        best = heapq.nsmallest(limit, range(start, end), key=self.ranks.__getitem__)
+        return [forms[self.form_ids[position]] for position in best]
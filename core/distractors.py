@@ -0,0 +1,117 @@
+# core/distractors.py - ÍNDICE DE RESPUESTAS INCORRECTAS
+import random
+
+from .answer_index import AnswerIndex, form_key
+
+# Intentos aleatorios antes de recurrir a un recorrido lineal
+MAX_ATTEMPTS = 24
+
+
+class DistractorIndex:
+    """Índice precalculado de respuestas incorrectas para el quiz.
+
+    Las formas únicas vienen del AnswerIndex, de modo que "cousin" u "orange"
+    no pueden aparecer como correcta y como distractor a la vez, y tampoco un
+    sinónimo o una alternativa aceptada ("ok" en la pregunta de "okay"). Las
+    formas principales se agrupan por categoría, longitud, prefijo y sufijo
+    para elegir opciones parecidas a la respuesta correcta.
+    """
+
+    def __init__(self, word_index, answers=None):
+        self.word_index = word_index
+        self.answers = answers if answers is not None else AnswerIndex(word_index)
+        self.forms = self.answers.forms
+        self.form_ids = self.answers.form_ids
+        self.group_ids = self.answers.group_ids
+        # Solo las respuestas principales se ofrecen como distractores
+        self.primary_count = self.answers.primary_count
+        self.by_category = {}
+        self.by_length = {}
+        self.by_prefix = {}
+        self.by_suffix = {}
+        self.build()
+
+    def build(self):
+        """Agrupa las formas principales por forma y por categoría"""
+        index = self.word_index
+        for form_id in range(self.primary_count):
+            key = form_key(self.forms[form_id])
+            self.by_length.setdefault(len(key), []).append(form_id)
+            self.by_prefix.setdefault(key[:2], []).append(form_id)
+            self.by_suffix.setdefault(key[-2:], []).append(form_id)
+
+        for category in index.categories:
+            start, end = index.category_slice(category)
+            if start < end:
+                # Formas sin repetir, en el orden en que aparecen
+                self.by_category[category] = list(dict.fromkeys(self.form_ids[start:end]))
+
+    def form_id(self, english):
+        """Devuelve el id de forma de una traducción, o None"""
+        return self.answers.form_id(english)
+
+    def candidate_buckets(self, form_id, category=None):
+        """Orden de grupos a probar: la categoría se alterna con la forma"""
+        key = form_key(self.forms[form_id])
+        category_bucket = self.by_category.get(category, ()) if category else ()
+        shape_buckets = [self.by_suffix.get(key[-2:], ()),
+                         self.by_prefix.get(key[:2], ()),
+                         self.by_length.get(len(key), ())]
+
+        rotation = []
+        for bucket in shape_buckets:
+            if len(category_bucket) > 1:
+                rotation.append(category_bucket)
+            if len(bucket) > 1:
+                rotation.append(bucket)
+        # None = cualquier forma del vocabulario
+        rotation.append(None)
+        return rotation
+
+    def pick_form_ids(self, form_id, category=None, k=3, rng=random, excluded_groups=()):
+        """Devuelve hasta k ids de forma distintos entre sí y de la correcta.
+
+        Se compara por grupo de sinónimos: nunca salen dos formas
+        equivalentes ni ninguna de 'excluded_groups' (las respuestas aceptadas).
+        """
+        chosen = []
+        group_ids = self.group_ids
+        excluded = set(excluded_groups)
+        excluded.add(group_ids[form_id])
+        total_forms = self.primary_count
+        if total_forms <= 1:
+            return chosen
+
+        rotation = self.candidate_buckets(form_id, category)
+        attempts = 0
+        while len(chosen) < k and attempts < MAX_ATTEMPTS:
+            bucket = rotation[attempts % len(rotation)]
+            if bucket is None:
+                candidate = int(rng.random() * total_forms)
+            else:
+                candidate = bucket[int(rng.random() * len(bucket))]
+
+            if group_ids[candidate] not in excluded:
+                excluded.add(group_ids[candidate])
+                chosen.append(candidate)
+            attempts += 1
+
+        # Vocabularios muy pequeños: completar recorriendo las formas
+        if len(chosen) < k:
+            start = int(rng.random() * total_forms)
+            for offset in range(total_forms):
+                candidate = (start + offset) % total_forms
+                if group_ids[candidate] not in excluded:
+                    excluded.add(group_ids[candidate])
+                    chosen.append(candidate)
+                    if len(chosen) == k:
+                        break
+
+        return chosen
+
+    def pick(self, correct, category=None, k=3, rng=random):
+        """Devuelve hasta k respuestas incorrectas plausibles para 'correct'"""
+        form_id = self.form_id(correct)
+        if form_id is None:
+            return []
+        return [self.forms[f] for f in self.pick_form_ids(form_id, category, k, rng)]
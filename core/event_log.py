@@ -0,0 +1,132 @@
+# core/event_log.py - DIARIO DE EVENTOS CON INSTANTÁNEAS
+import json
+import os
+from datetime import datetime
+
+# Eventos acumulados antes de compactar en una instantánea
+DEFAULT_COMPACT_EVERY = 200
+
+
+def write_json_atomic(path, data, indent=2):
+    """Escribe JSON en un archivo temporal y lo renombra sobre el destino"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=indent, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class EventLog:
+    """Diario de eventos de solo anexado con compactación periódica.
+
+    Cada evento (respuesta, puntos, subida de nivel) se añade como una línea
+    JSON numerada a ``<nombre>.log``. Cada cierto número de eventos el estado
+    completo se guarda en ``<nombre>.json`` de forma atómica y el diario se
+    vacía. Al arrancar se carga la instantánea y se reproducen los eventos
+    con número de secuencia posterior.
+    """
+
+    def __init__(self, data_dir="data", name="progress", compact_every=DEFAULT_COMPACT_EVERY,
+                 saver=None):
+        self.data_dir = data_dir
+        # SaveWorker opcional: las escrituras salen del hilo de la interfaz
+        self.saver = saver
+        self.snapshot_file = os.path.join(data_dir, f"{name}.json")
+        self.log_file = os.path.join(data_dir, f"{name}.log")
+        self.compact_every = compact_every
+        self.sequence = 0
+        self.pending = 0
+
+    def load(self):
+        """Devuelve (estado de la instantánea, eventos posteriores)"""
+        state = {}
+        events = []
+        snapshot_sequence = 0
+
+        try:
+            if os.path.exists(self.snapshot_file):
+                with open(self.snapshot_file, "r", encoding="utf-8") as f:
+                    state = json.load(f)
+                snapshot_sequence = state.get("seq", 0)
+        except Exception as e:
+            print(f"Error al cargar instantánea: {e}")
+            state = {}
+
+        try:
+            if os.path.exists(self.log_file):
+                with open(self.log_file, "r", encoding="utf-8") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            event = json.loads(line)
+                        except ValueError:
+                            # Última línea cortada por un cierre inesperado
+                            continue
+                        # Eventos ya incluidos en la instantánea se ignoran
+                        if event.get("seq", 0) > snapshot_sequence:
+                            events.append(event)
+        except Exception as e:
+            print(f"Error al cargar diario de eventos: {e}")
+
+        self.sequence = max([snapshot_sequence] + [e.get("seq", 0) for e in events])
+        self.pending = len(events)
+        return state, events
+
+    def append(self, event_type, **fields):
+        """Añade un evento al diario y devuelve el evento guardado"""
+        self.sequence += 1
+        event = {"seq": self.sequence, "type": event_type,
+                 "time": datetime.now().isoformat()}
+        event.update(fields)
+        line = json.dumps(event, ensure_ascii=False) + "\n"
+
+        def write():
+            try:
+                os.makedirs(self.data_dir, exist_ok=True)
+                with open(self.log_file, "a", encoding="utf-8") as f:
+                    f.write(line)
+            except Exception as e:
+                print(f"Error al guardar evento: {e}")
+
+        if self.saver is not None:
+            self.saver.enqueue(write)
+        else:
+            write()
+        self.pending += 1
+        return event
+
+    def needs_compaction(self):
+        """Indica si conviene escribir una instantánea"""
+        return self.pending >= self.compact_every
+
+    def compact(self, state):
+        """Guarda el estado completo y vacía el diario"""
+        snapshot = dict(state)
+        snapshot["seq"] = self.sequence
+        snapshot["saved"] = datetime.now().isoformat()
+
+        def write():
+            try:
+                os.makedirs(self.data_dir, exist_ok=True)
+                write_json_atomic(self.snapshot_file, snapshot)
+
+                # La instantánea ya cubre todos los eventos: vaciar el diario.
+                # Si falla aquí, los eventos viejos se ignoran por su secuencia.
+                tmp_log = self.log_file + ".tmp"
+                open(tmp_log, "w", encoding="utf-8").close()
+                os.replace(tmp_log, self.log_file)
+                return True
+            except Exception as e:
+                print(f"Error al compactar progreso: {e}")
+                return False
+
+        self.pending = 0
+        if self.saver is not None:
+            # Se ejecuta después de los eventos ya encolados; varias
+            # compactaciones seguidas se agrupan en una sola escritura
+            self.saver.submit(("snapshot", self.snapshot_file), write)
+            return True
+        return write()
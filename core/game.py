@@ -1,38 +1,164 @@
-import json
 import os
-import random
-from datetime import datetime
-from .vocabulary import vocabulary_data
+
+from .achievements import DEFAULT_RULES, AchievementEngine, category_rules
+from .event_log import EventLog
+from .scheduler import SpacedRepetitionScheduler
+from .reverse_index import ENGLISH_TO_SPANISH, SPANISH_TO_ENGLISH
+from .vocabulary import (find_spanish_answer, get_accepted_answers, get_answer_index,
+                         get_completion_index, get_reverse_index, get_vocabulary,
+                         get_word_count, get_word_index)
 
 class Game:
     
-    def __init__(self, base_dir=None):
-        self.vocabulary = vocabulary_data
+    def __init__(self, base_dir=None, storage=None, saver=None, data_dir=None):
+        self.vocabulary = get_vocabulary()
         self.score = 0
         self.level = 1
         self.current_category = None
+        # SaveWorker opcional: todas las escrituras pasan por su hilo
+        self.saver = saver
+        # Repasos y diario van junto a la base de datos (PathManager.get_data_dir)
+        if data_dir is None:
+            data_dir = os.path.dirname(storage.db_path) if storage is not None else "data"
+        self.data_dir = data_dir or "."
+        self.scheduler = SpacedRepetitionScheduler(self.data_dir, saver=saver)
+        # Con almacenamiento SQLite no se usa el diario de archivos
+        self.storage = storage
+        self.events = EventLog(self.data_dir, saver=saver) if storage is None else None
+        # Logros incrementales: cada evento actualiza sus contadores
+        self.achievements = AchievementEngine(DEFAULT_RULES + category_rules(self.vocabulary))
+        self.achievements.subscribe(self.on_achievement)
         self.load_progress()
     
     def load_progress(self):
+        """Carga la instantánea y reproduce los eventos posteriores"""
+        self.score = 0
+        self.level = 1
+        # Al reproducir no se emiten logros; se comprueban todos al final
+        self.achievements.pause()
+        try:
+            if self.storage is not None:
+                self.load_stored_progress()
+            else:
+                self.load_logged_progress()
+        finally:
+            self.achievements.set_counter("score", self.score)
+            self.achievements.set_counter("level", self.level)
+            self.achievements.resume()
+        self.achievements.check_all()
+    
+    def load_stored_progress(self):
+        """Carga el progreso y los contadores de logros desde SQLite"""
+        progress = self.storage.load_progress()
+        stats = self.storage.load_stats()
+        self.score = progress.get("score", 0)
+        self.level = progress.get("level", 1)
+        
+        mastered = {}
+        for category, spanish in self.storage.correct_words():
+            mastered.setdefault(category, []).append(spanish)
+        self.achievements.load_state({
+            "counters": {key: stats.get(key, 0)
+                         for key in ("total_games", "total_questions", "total_correct")},
+            "mastered": mastered,
+            "unlocked": self.storage.load_achievements()
+        })
+    
+    def load_logged_progress(self):
+        """Carga la instantánea y reproduce el diario de eventos"""
+        state, events = self.events.load()
         try:
-            if os.path.exists("data/progress.json"):
-                with open("data/progress.json", "r") as f:
-                    data = json.load(f)
-                    self.score = data.get("score", 0)
-                    self.level = data.get("level", 1)
-        except:
+            self.score = state.get("score", 0)
+            self.level = state.get("level", 1)
+            self.achievements.load_state(state.get("achievements", {}))
+            for event in events:
+                self.apply_event(event)
+        except Exception:
             self.score = 0
             self.level = 1
     
+    def apply_event(self, event):
+        """Aplica un evento del diario al estado en memoria"""
+        if event["type"] == "points":
+            self.score += event.get("points", 0)
+            self.achievements.set_counter("score", self.score)
+        elif event["type"] == "level_up":
+            self.level = max(self.level, event.get("level", self.level))
+            self.achievements.set_counter("level", self.level)
+        elif event["type"] == "answer":
+            self.achievements.record_answer(event["category"], event["spanish"],
+                                            event["correct"])
+        elif event["type"] == "game":
+            self.achievements.record_game(event["correct"], event["questions"])
+        elif event["type"] == "achievement":
+            self.achievements.restore(event["id"], event["unlocked"])
+    
     def save_progress(self):
-        """Guarda el progreso"""
-        os.makedirs("data", exist_ok=True)
-        with open("data/progress.json", "w") as f:
-            json.dump({
-                "score": self.score,
-                "level": self.level,
-                "saved": datetime.now().isoformat()
-            }, f, indent=2)
+        """Guarda el progreso (instantánea atómica y diario vacío)"""
+        if self.storage is not None:
+            progress = {"score": self.score, "level": self.level}
+            self.write("progress", lambda: self.storage.save_progress(progress))
+            return True
+        return self.events.compact({
+            "score": self.score,
+            "level": self.level,
+            "achievements": self.achievements.to_dict()
+        })
+    
+    def record_event(self, event_type, **fields):
+        """Añade un evento al diario y compacta cuando toca"""
+        if self.storage is not None:
+            event = dict(fields, type=event_type)
+            self.write(None, lambda: self.store_event(event))
+            self.apply_event(event)
+        else:
+            event = self.events.append(event_type, **fields)
+            self.apply_event(event)
+            if self.events.needs_compaction():
+                self.save_progress()
+        
+        # Una subida de nivel se escribe sin esperar la ventana de agrupado
+        if event_type == "level_up" and self.saver is not None:
+            self.saver.request_flush()
+        return event
+    
+    def write(self, key, task):
+        """Ejecuta una escritura: en segundo plano si hay SaveWorker"""
+        if self.saver is None:
+            task()
+        elif key is None:
+            self.saver.enqueue(task)
+        else:
+            self.saver.submit(key, task)
+    
+    def store_event(self, event):
+        """Traduce un evento a una sola escritura en SQLite"""
+        if event["type"] == "points":
+            self.storage.add_points(event["points"])
+        elif event["type"] == "level_up":
+            self.storage.set_level(event["level"])
+        elif event["type"] == "answer":
+            self.storage.record_attempt(event["category"], event["spanish"], event["correct"])
+        elif event["type"] == "game":
+            self.storage.record_game(event["game_type"], event["correct"],
+                                     event["questions"], event.get("category"))
+        elif event["type"] == "achievement":
+            self.storage.unlock_achievement(event["id"], event["unlocked"])
+    
+    def on_achievement(self, event):
+        """Guarda un logro recién desbloqueado como evento del diario"""
+        self.record_event("achievement", id=event["id"], name=event["name"],
+                          unlocked=event["time"])
+    
+    def record_answer(self, category, spanish, correct):
+        """Registra una respuesta en el diario"""
+        return self.record_event("answer", category=category, spanish=spanish,
+                                 correct=bool(correct))
+    
+    def record_game(self, game_type, correct, questions, category=None):
+        """Registra una partida terminada"""
+        return self.record_event("game", game_type=game_type, correct=correct,
+                                 questions=questions, category=category)
     
     def get_categories(self):
         return list(self.vocabulary.keys())
@@ -40,34 +166,51 @@ class Game:
     def get_category_words(self, category):
         return self.vocabulary.get(category, {})
     
+    def get_word_id(self, category, spanish):
+        """Id estable de una palabra (el del paquete de vocabulario), o None"""
+        index = get_word_index(self.vocabulary)
+        position = index.find_position(category, spanish)
+        return None if position is None else index.word_ids[position]
+    
+    def get_accepted_answers(self, category, spanish, direction=SPANISH_TO_ENGLISH):
+        """Respuestas aceptadas de una palabra: principal, alternativas y sinónimos"""
+        return get_accepted_answers(category, spanish, self.vocabulary, direction)
+    
+    def find_spanish_answer(self, category, spanish, text):
+        """Palabra española aceptada que coincide con lo escrito, o None"""
+        return find_spanish_answer(category, spanish, text, self.vocabulary)
+    
+    def get_answer_forms(self, direction=SPANISH_TO_ENGLISH):
+        """Todas las respuestas del vocabulario en un sentido (para descartar
+        como errata lo que en realidad es otra palabra)"""
+        if direction == ENGLISH_TO_SPANISH:
+            return get_reverse_index(self.vocabulary)
+        return get_answer_index(self.vocabulary)
+    
+    def complete_answer(self, text, direction=SPANISH_TO_ENGLISH, limit=5):
+        """Respuestas del vocabulario que empiezan por lo escrito"""
+        return get_completion_index(direction, self.vocabulary).complete(text, limit)
+    
     def get_random_word(self, category=None):
-        if category:
-            words = self.vocabulary.get(category, {})
-        else:
-            # Juntar todas las palabras de todas las categorías
-            words = {}
-            for cat_words in self.vocabulary.values():
-                words.update(cat_words)
-        
-        if not words:
-            return None, None
-        
-        spanish_word = random.choice(list(words.keys()))
-        english_word = words[spanish_word]
-        
-        return spanish_word, english_word
+        return get_word_index(self.vocabulary).random_word(category)
+    
+    def sample_words(self, k, category=None):
+        """Devuelve k palabras distintas como (categoría, español, inglés)"""
+        return get_word_index(self.vocabulary).sample(k, category)
     
     def add_points(self, points):
         """Añade puntos"""
-        self.score += points
+        self.record_event("points", points=points)
         # Subir nivel cada 100 puntos
         if self.score >= self.level * 100:
-            self.level += 1
-        self.save_progress()
+            self.set_level(self.level + 1)
+        return self.level
+    
+    def set_level(self, level):
+        """Sube al nivel indicado (nunca baja)"""
+        if level > self.level:
+            self.record_event("level_up", level=level)
         return self.level
     
     def get_word_count(self):
-        total = 0
-        for category in self.vocabulary.values():
-            total += len(category)
-        return total
\ No newline at end of file
+        return get_word_count(self.vocabulary)
\ No newline at end of file
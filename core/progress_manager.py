@@ -6,8 +6,10 @@ from datetime import datetime
 class ProgressManager:
     """Maneja el progreso del usuario"""
     
-    def __init__(self, data_dir="data"):
+    def __init__(self, data_dir="data", storage=None):
         self.data_dir = data_dir
+        # Almacenamiento SQLite compartido (core.storage); None = archivos JSON
+        self.storage = storage
         self.progress_file = os.path.join(data_dir, "progress.json")
         self.ensure_data_dir()
     
@@ -30,6 +32,13 @@ class ProgressManager:
         }
         
         try:
+            if self.storage is not None:
+                progress = self.storage.load_progress()
+                for key, value in default_progress.items():
+                    if key not in progress:
+                        progress[key] = value
+                return progress
+            
             if os.path.exists(self.progress_file):
                 with open(self.progress_file, 'r', encoding='utf-8') as f:
                     progress = json.load(f)
@@ -46,6 +55,13 @@ class ProgressManager:
     def save_progress(self, progress_data):
         """Guarda el progreso"""
         try:
+            if self.storage is not None:
+                # Solo se escriben las claves recibidas, en una transacción
+                progress_data = dict(progress_data)
+                progress_data['last_saved'] = datetime.now().isoformat()
+                self.storage.save_progress(progress_data)
+                return True
+            
             # Cargar progreso existente para preservar datos no proporcionados
             existing_progress = self.load_progress()
             
@@ -76,6 +92,10 @@ class ProgressManager:
                 "reset_date": datetime.now().isoformat()
             }
             
+            if self.storage is not None:
+                self.storage.save_progress(default_progress)
+                return True
+            
             with open(self.progress_file, 'w', encoding='utf-8') as f:
                 json.dump(default_progress, f, indent=2, ensure_ascii=False)
             
@@ -1,62 +1,233 @@
 import random
 
+from .distractors import DistractorIndex
+from .reverse_index import ENGLISH_TO_SPANISH, SPANISH_TO_ENGLISH
+from .vocabulary import get_answer_index, get_category_size, get_reverse_index, get_word_index
+from .word_index import iter_permutation
+
 class QuizGenerator:
-    
+
     def __init__(self, vocabulary):
         self.vocabulary = vocabulary
-    
-    def generate_multiple_choice(self, category=None, num_questions=10):
+        # Un índice de distractores por sentido (inglés o español)
+        self._distractors = {}
+
+    def get_distractor_index(self, direction=SPANISH_TO_ENGLISH):
+        """Devuelve el índice de distractores, reconstruido si cambió el vocabulario"""
+        word_index = get_word_index(self.vocabulary)
+        distractors = self._distractors.get(direction)
+        if distractors is None or distractors.word_index is not word_index:
+            if direction == ENGLISH_TO_SPANISH:
+                answers = get_reverse_index(self.vocabulary)
+            else:
+                answers = get_answer_index(self.vocabulary)
+            distractors = self._distractors[direction] = DistractorIndex(word_index, answers)
+        return distractors
+
+    def resolve_category(self, category=None, num_questions=10):
+        """Usa todas las categorías si la elegida no tiene suficientes palabras"""
+        if category and get_category_size(category, self.vocabulary) < num_questions:
+            return None
+        return category
+
+    def count_questions(self, category=None, num_questions=10):
+        """Número de preguntas que tendrá un quiz de num_questions"""
+        category = self.resolve_category(category, num_questions)
+        start, end = get_word_index(self.vocabulary).category_slice(category)
+        return min(num_questions, end - start)
+
+    def build_question(self, position, distractors=None, direction=SPANISH_TO_ENGLISH):
+        """Crea la pregunta de opción múltiple de una posición del índice.
+
+        En sentido inglés -> español se pregunta por la palabra inglesa y las
+        opciones son palabras españolas.
+        """
+        distractors = distractors or self.get_distractor_index(direction)
+        word_index = distractors.word_index
+        spanish, english = word_index.get_word(word_index.word_ids[position])
+        word_category = word_index.get_category(position)
+        form_id = distractors.form_ids[position]
+        if direction == ENGLISH_TO_SPANISH:
+            prompt, correct = english, spanish
+        else:
+            prompt, correct = spanish, english
+
+        # Tres respuestas incorrectas parecidas, distintas entre sí y que no
+        # sean sinónimos de ninguna respuesta aceptada
+        wrong_ids = distractors.pick_form_ids(
+            form_id, word_category, 3,
+            excluded_groups=distractors.answers.accepted_groups(position))
+
+        # Crear lista de opciones
+        options = [distractors.forms[f] for f in wrong_ids] + [correct]
+        random.shuffle(options)
+
+        return {
+            'category': word_category,
+            'spanish': spanish,
+            'prompt': prompt,
+            'correct': correct,
+            'options': options,
+            'direction': direction,
+            'type': 'multiple_choice'
+        }
+
+    def iter_multiple_choice(self, category=None, limit=None, direction=SPANISH_TO_ENGLISH):
+        """Genera preguntas una a una, sin repetir palabra hasta agotar el grupo.
+
+        Con limit=None el flujo es infinito: al agotar las palabras empieza
+        otra vuelta con un orden aleatorio nuevo. La memoria usada no crece
+        con la duración de la sesión.
+        """
+        if limit is not None:
+            category = self.resolve_category(category, limit)
+            limit = self.count_questions(category, limit)
+
+        produced = 0
+        last_position = None
+        while limit is None or produced < limit:
+            distractors = self.get_distractor_index(direction)
+            start, end = distractors.word_index.category_slice(category)
+            if start >= end:
+                return
+
+            for offset in iter_permutation(end - start):
+                position = start + offset
+                # Evitar repetir la misma palabra al cambiar de vuelta
+                if position == last_position and end - start > 1:
+                    continue
+                last_position = position
+                yield self.build_question(position, distractors, direction)
+                produced += 1
+                if limit is not None and produced >= limit:
+                    return
+
+    def iter_questions_for_words(self, words, direction=SPANISH_TO_ENGLISH):
+        """Genera preguntas para una lista de (categoría, español), p. ej. repasos"""
+        for category, spanish in words:
+            distractors = self.get_distractor_index(direction)
+            position = distractors.word_index.find_position(category, spanish)
+            # Palabras que ya no están en el vocabulario se omiten
+            if position is not None:
+                yield self.build_question(position, distractors, direction)
+
+    def generate_multiple_choice(self, category=None, num_questions=10,
+                                 direction=SPANISH_TO_ENGLISH):
         """Genera preguntas de opción múltiple"""
+        return list(self.iter_multiple_choice(category, limit=num_questions,
+                                              direction=direction))
+
+    def generate_exam_batch(self, num_exams, num_questions=10, category=None, seed=None):
+        """Genera muchos exámenes de opción múltiple de una vez con NumPy.
+
+        Devuelve un diccionario con la matriz de opciones (exámenes x
+        preguntas x 4, ids de forma inglesa), el índice de la respuesta
+        correcta y la semilla usada. Cada examen tiene su propio flujo
+        aleatorio derivado de la semilla, así que el examen i se reproduce
+        igual aunque cambie el número de exámenes.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise RuntimeError("Se necesita numpy para generar exámenes en lote")
+
+        distractors = self.get_distractor_index()
+        word_index = distractors.word_index
+
+        category = self.resolve_category(category, num_questions)
+        start, end = word_index.category_slice(category)
+        pool_size = end - start
+        num_questions = min(num_questions, pool_size)
+
+        form_ids = np.frombuffer(distractors.form_ids, dtype=np.uint32)
+        # Distractores tomados de las formas de las categorías del examen
+        pool_forms = np.unique(form_ids[start:end])
+        if len(pool_forms) < 4:
+            pool_forms = np.arange(distractors.primary_count, dtype=np.uint32)
+        if len(pool_forms) < 4:
+            raise ValueError("Se necesitan al menos 4 traducciones distintas")
+
+        seed_sequence = np.random.SeedSequence(seed)
+        positions = np.empty((num_exams, num_questions), dtype=np.int64)
+        draws = np.empty((num_exams, num_questions, 3))
+        slots = np.empty((num_exams, num_questions), dtype=np.int64)
+        for exam, child in enumerate(seed_sequence.spawn(num_exams)):
+            rng = np.random.Generator(np.random.PCG64(child))
+            positions[exam] = rng.choice(pool_size, num_questions, replace=False)
+            draws[exam] = rng.random((num_questions, 3))
+            slots[exam] = rng.integers(0, 4, num_questions)
+        positions += start
+
+        # Rango de la respuesta correcta dentro de las formas del examen
+        correct = np.searchsorted(pool_forms, form_ids[positions])
+        total = len(pool_forms)
+
+        # Rangos vetados en cada pregunta: todas las formas de los grupos que
+        # acepta la palabra (la correcta, sus alternativas y sus sinónimos),
+        # como en build_question. Se calculan una vez por palabra distinta y
+        # se rellenan con 'total', que nunca desplaza un sorteo.
+        group_ranks = {}
+        pool_groups = np.frombuffer(distractors.group_ids, dtype=np.uint32)[pool_forms]
+        for rank, group_id in enumerate(pool_groups.tolist()):
+            group_ranks.setdefault(group_id, []).append(rank)
+        unique_positions, inverse = np.unique(positions, return_inverse=True)
+        vetoed = [sorted(rank for group_id in distractors.answers.accepted_groups(position)
+                         for rank in group_ranks.get(group_id, ()))
+                  for position in unique_positions.tolist()]
+        width = max(len(ranks) for ranks in vetoed)
+        excluded = np.full((len(vetoed), width), total, dtype=np.int64)
+        for row, ranks in enumerate(vetoed):
+            excluded[row, :len(ranks)] = ranks
+        excluded = excluded[inverse.reshape(positions.shape)]
+        free = total - (excluded < total).sum(axis=-1)
+        if free.min() < 3:
+            raise ValueError("Se necesitan al menos 3 distractores que no sean sinónimos")
+
+        # Tres rangos distintos fuera de los vetados: cada sorteo se hace
+        # sobre los huecos libres y se desplaza por los ya elegidos (ordenados)
+        picked = np.empty(positions.shape + (0,), dtype=np.int64)
+        for i in range(3):
+            rank = (draws[..., i] * (free - i)).astype(np.int64)
+            taken = np.sort(np.concatenate([excluded, picked], axis=-1), axis=-1)
+            for j in range(taken.shape[-1]):
+                rank += rank >= taken[..., j]
+            picked = np.concatenate([picked, rank[..., None]], axis=-1)
+
+        # La correcta va al final y luego se intercambia con su hueco
+        options = pool_forms[np.concatenate([picked, correct[..., None]], axis=-1)]
+        columns = np.arange(4)
+        order = np.where(columns == slots[..., None], 3,
+                         np.where(columns == 3, slots[..., None], columns))
+        options = np.take_along_axis(options, order, axis=-1)
+
+        return {
+            'seed': seed_sequence.entropy,
+            'category': category,
+            'positions': positions,
+            'options': options,
+            'answers': slots
+        }
+
+    def exam_questions(self, batch, exam):
+        """Convierte un examen del lote en preguntas como generate_multiple_choice"""
+        distractors = self.get_distractor_index()
+        word_index = distractors.word_index
         questions = []
-        
-        # Determinar categorías a usar
-        if category:
-            categories = [category]
-        else:
-            categories = list(self.vocabulary.keys())
-        
-        # Si no hay suficientes palabras, usar todas las categorías
-        total_words = sum(len(self.vocabulary[cat]) for cat in categories)
-        if total_words < num_questions:
-            categories = list(self.vocabulary.keys())
-        
-        # Recolectar todas las palabras de las categorías seleccionadas
-        all_words = []
-        for cat in categories:
-            for spanish, english in self.vocabulary[cat].items():
-                all_words.append({
-                    'category': cat,
-                    'spanish': spanish,
-                    'english': english
-                })
-        
-        # Mezclar y seleccionar palabras
-        random.shuffle(all_words)
-        selected_words = all_words[:num_questions]
-        
-        # Crear preguntas
-        all_english_words = [word['english'] for word in all_words]
-        
-        for word_data in selected_words:
-            # Obtener todas las posibles respuestas incorrectas
-            wrong_answers = [w for w in all_english_words if w != word_data['english']]
-            
-            # Seleccionar 3 opciones incorrectas aleatorias
-            if len(wrong_answers) >= 3:
-                selected_wrong = random.sample(wrong_answers, 3)
-            else:
-                selected_wrong = wrong_answers
-            
-            # Crear lista de opciones
-            options = selected_wrong + [word_data['english']]
-            random.shuffle(options)
-            
+
+        for position, options, answer in zip(batch['positions'][exam],
+                                             batch['options'][exam],
+                                             batch['answers'][exam]):
+            position = int(position)
+            spanish, english = word_index.get_word(word_index.word_ids[position])
+            option_texts = [distractors.forms[int(f)] for f in options]
             questions.append({
-                'category': word_data['category'],
-                'spanish': word_data['spanish'],
-                'correct': word_data['english'],
-                'options': options,
+                'category': word_index.get_category(position),
+                'spanish': spanish,
+                'prompt': spanish,
+                'correct': option_texts[int(answer)],
+                'options': option_texts,
+                'direction': SPANISH_TO_ENGLISH,
                 'type': 'multiple_choice'
             })
-        
-        return questions
\ No newline at end of file
+
+        return questions
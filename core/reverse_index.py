@@ -0,0 +1,105 @@
+# core/reverse_index.py - ÍNDICE INGLÉS → ESPAÑOL
+from array import array
+
+from .answer_index import form_key
+from .answer_matcher import normalize
+
+# Sentido de las preguntas: se muestra la primera lengua y se responde en la segunda
+SPANISH_TO_ENGLISH = "es-en"
+ENGLISH_TO_SPANISH = "en-es"
+DIRECTIONS = (SPANISH_TO_ENGLISH, ENGLISH_TO_SPANISH)
+
+
+def folded_key(spanish):
+    """Clave sin acentos, mayúsculas ni signos: "¿Cómo estás?" -> "como estas" """
+    return normalize(spanish)
+
+
+class ReverseIndex:
+    """Respuestas en español para las preguntas en inglés.
+
+    Cada palabra española se interna una vez; una pregunta en inglés acepta
+    todas las entradas que comparten su traducción (o un sinónimo), así que
+    "cousin" admite "primo" y "prima". Lo escrito se busca primero tal cual y
+    después sin acentos ("platano" -> "plátano"), en ambos casos con una sola
+    consulta a un diccionario.
+
+    Expone los mismos atributos que AnswerIndex (forms, form_ids, group_ids,
+    primary_count, form_id, accepted_groups), de modo que DistractorIndex
+    sirve también para elegir distractores en español.
+    """
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.word_index = answers.word_index
+        self.forms = []
+        # Forma española de cada posición del índice
+        self.form_ids = array("I")
+        # En español cada forma es su propio grupo
+        self.group_ids = array("I")
+        self.primary_count = 0
+        self._form_lookup = {}
+        # clave sin acentos -> ids de forma ("papa" -> papa, papá)
+        self._folded = {}
+        self.build()
+
+    def build(self):
+        """Interna las palabras españolas y la tabla sin acentos"""
+        index = self.word_index
+        for position in range(len(index)):
+            spanish, _ = index.get_word(index.word_ids[position])
+            key = form_key(spanish)
+            form_id = self._form_lookup.get(key)
+            if form_id is None:
+                form_id = self._form_lookup[key] = len(self.forms)
+                self.forms.append(spanish)
+                self.group_ids.append(form_id)
+                self._folded.setdefault(folded_key(spanish), []).append(form_id)
+            self.form_ids.append(form_id)
+        self.primary_count = len(self.forms)
+
+    def form_id(self, spanish):
+        """Devuelve el id de forma de una palabra española, o None"""
+        return self._form_lookup.get(form_key(spanish))
+
+    def lookup(self, text):
+        """Ids de forma que coinciden con lo escrito, exacto o sin acentos"""
+        exact = self._form_lookup.get(form_key(text))
+        folded = self._folded.get(folded_key(text), ())
+        if exact is None:
+            return folded
+        return [exact] + [form_id for form_id in folded if form_id != exact]
+
+    def __contains__(self, text):
+        """Indica si lo escrito es alguna palabra española del vocabulario
+        (exacta o sin acentos)"""
+        return bool(self.lookup(text))
+
+    def accepted_form_ids(self, position):
+        """Formas españolas aceptadas al preguntar por el inglés de una posición"""
+        answers = self.answers
+        english = answers.forms[answers.form_ids[position]]
+        accepted = [self.form_ids[position]]
+        for other in answers.entries_for(english):
+            form_id = self.form_ids[other]
+            if form_id not in accepted:
+                accepted.append(form_id)
+        return accepted
+
+    def accepted_groups(self, position):
+        return set(self.accepted_form_ids(position))
+
+    def accepted_answers(self, position):
+        """Palabras españolas aceptadas; la de la propia entrada va primero"""
+        return [self.forms[form_id] for form_id in self.accepted_form_ids(position)]
+
+    def match(self, position, text):
+        """Palabra española aceptada que coincide con lo escrito, o None"""
+        candidates = self.lookup(text)
+        if not candidates:
+            return None
+        accepted = self.accepted_form_ids(position)
+        for form_id in candidates:
+            if form_id in accepted:
+                return self.forms[form_id]
+        return None
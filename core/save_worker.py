@@ -0,0 +1,149 @@
+# core/save_worker.py - GUARDADO EN SEGUNDO PLANO
+import itertools
+import threading
+import time
+from collections import OrderedDict
+
+# Ventana para agrupar guardados consecutivos (segundos)
+DEFAULT_DEBOUNCE = 0.5
+
+
+class SaveWorker:
+    """Hilo de persistencia que ejecuta las escrituras fuera del hilo de Tk.
+
+    Las tareas se ejecutan en el orden en que se enviaron. Una tarea con
+    clave (``submit``) que se reenvía dentro de la ventana de espera sustituye
+    a la anterior y pasa al final de la cola, de modo que varios guardados
+    seguidos se convierten en una sola escritura con el estado más reciente.
+    Las tareas sin clave (``enqueue``) nunca se agrupan.
+    """
+
+    def __init__(self, debounce=DEFAULT_DEBOUNCE):
+        self.debounce = debounce
+        self._queue = OrderedDict()
+        self._condition = threading.Condition()
+        self._ids = itertools.count()
+        self._busy = False
+        self._stopping = False
+
+        # Métricas
+        self.writes = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self._total_latency = 0.0
+
+        self._thread = threading.Thread(target=self._run, name="SaveWorker", daemon=True)
+        self._thread.start()
+
+    def submit(self, key, task, delay=None):
+        """Programa una escritura agrupable bajo 'key'"""
+        delay = self.debounce if delay is None else delay
+        with self._condition:
+            deadline = time.monotonic() + delay
+            previous = self._queue.pop(key, None)
+            if previous is not None:
+                # Conservar el plazo más antiguo para no aplazarla sin fin
+                deadline = min(deadline, previous[1])
+                self.coalesced += 1
+            self._queue[key] = (task, deadline)
+            self._condition.notify()
+
+    def enqueue(self, task):
+        """Programa una escritura inmediata que no se agrupa"""
+        self.submit(("task", next(self._ids)), task, delay=0)
+
+    def request_flush(self):
+        """Adelanta todas las escrituras pendientes sin esperar"""
+        with self._condition:
+            now = time.monotonic()
+            for key in list(self._queue):
+                self._queue[key] = (self._queue[key][0], now)
+            self._condition.notify()
+
+    def flush(self, timeout=5.0):
+        """Escribe todo lo pendiente y espera a que termine"""
+        self.request_flush()
+        end = time.monotonic() + timeout
+        with self._condition:
+            while self._queue or self._busy:
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def stop(self, timeout=5.0):
+        """Vacía la cola y detiene el hilo"""
+        flushed = self.flush(timeout)
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        return flushed
+
+    def in_worker(self):
+        """Indica si el código actual se ejecuta en el hilo de guardado"""
+        return threading.current_thread() is self._thread
+
+    def wait_idle(self, timeout=5.0):
+        """Antes de leer del disco: vacía la cola si hay escrituras pendientes"""
+        if self.in_worker():
+            return True
+        with self._condition:
+            idle = not self._queue and not self._busy
+        return idle or self.flush(timeout)
+
+    @property
+    def queue_depth(self):
+        """Número de escrituras pendientes"""
+        with self._condition:
+            return len(self._queue)
+
+    def get_stats(self):
+        """Métricas de la cola: profundidad, escrituras y latencias en ms"""
+        with self._condition:
+            average = self._total_latency / self.writes if self.writes else 0.0
+            return {
+                "queue_depth": len(self._queue),
+                "writes": self.writes,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "last_latency_ms": self.last_latency * 1000,
+                "avg_latency_ms": average * 1000,
+                "max_latency_ms": self.max_latency * 1000
+            }
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if self._stopping and not self._queue:
+                        return
+                    if self._queue:
+                        key, (task, deadline) = next(iter(self._queue.items()))
+                        wait = deadline - time.monotonic()
+                        if wait <= 0:
+                            del self._queue[key]
+                            self._busy = True
+                            break
+                        self._condition.wait(wait)
+                    else:
+                        self._condition.wait()
+
+            started = time.monotonic()
+            try:
+                task()
+            except Exception as e:
+                self.errors += 1
+                print(f"Error en guardado en segundo plano: {e}")
+            finished = time.monotonic()
+
+            with self._condition:
+                self._busy = False
+                self.writes += 1
+                self.last_latency = finished - started
+                self.max_latency = max(self.max_latency, self.last_latency)
+                self._total_latency += self.last_latency
+                self._condition.notify_all()
@@ -0,0 +1,271 @@
+# core/scheduler.py - REPASO ESPACIADO (SM-2)
+import heapq
+import json
+import os
+import random
+import time
+
+DAY_SECONDS = 24 * 60 * 60
+# Una tarjeta fallada vuelve a salir a los pocos minutos
+RELEARN_SECONDS = 10 * 60
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+# Compactar el diario cuando tenga más líneas que N veces las tarjetas
+COMPACT_RATIO = 4
+# Reconstruir los montículos cuando las entradas antiguas superen N veces las tarjetas
+STALE_RATIO = 2
+
+
+class CardState:
+    """Estado de memoria de una palabra"""
+
+    __slots__ = ("category", "spanish", "ease", "interval", "repetitions",
+                 "due", "lapses", "version")
+
+    def __init__(self, category, spanish, ease=DEFAULT_EASE, interval=0.0,
+                 repetitions=0, due=0.0, lapses=0):
+        self.category = category
+        self.spanish = spanish
+        self.ease = ease
+        self.interval = interval
+        self.repetitions = repetitions
+        self.due = due
+        self.lapses = lapses
+        self.version = 0
+
+    @property
+    def key(self):
+        return self.category, self.spanish
+
+    def to_dict(self):
+        return {
+            "c": self.category,
+            "w": self.spanish,
+            "e": round(self.ease, 4),
+            "i": round(self.interval, 4),
+            "r": self.repetitions,
+            "d": round(self.due, 3),
+            "l": self.lapses
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["c"], data["w"], data.get("e", DEFAULT_EASE),
+                   data.get("i", 0.0), data.get("r", 0), data.get("d", 0.0),
+                   data.get("l", 0))
+
+
+class SpacedRepetitionScheduler:
+    """Programa repasos con SM-2 y un índice de vencimientos en montículo.
+
+    Cada repaso se añade como una línea al diario ``reviews.jsonl`` en vez de
+    reescribir todo el mazo; al cargar se reproduce el diario. Los montículos
+    (global y por categoría) usan borrado perezoso: las entradas antiguas de
+    una tarjeta se descartan al salir si su versión no coincide, y los
+    montículos se reconstruyen al compactar o cuando esas entradas superan
+    STALE_RATIO veces las tarjetas, así que su tamaño sigue a las tarjetas y
+    no al número total de repasos.
+    """
+
+    def __init__(self, data_dir="data", saver=None):
+        self.data_dir = data_dir
+        # SaveWorker opcional: las escrituras salen del hilo de la interfaz
+        self.saver = saver
+        self.journal_file = os.path.join(data_dir, "reviews.jsonl")
+        self.cards = {}
+        self._heap = []
+        self._category_heaps = {}
+        self._journal_lines = 0
+        self._sequence = 0
+        self.load()
+
+    # --- Persistencia ---
+
+    def load(self):
+        """Reconstruye el estado reproduciendo el diario de repasos"""
+        self.cards = {}
+        self._journal_lines = 0
+        try:
+            if os.path.exists(self.journal_file):
+                with open(self.journal_file, "r", encoding="utf-8") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            card = CardState.from_dict(json.loads(line))
+                        except (ValueError, KeyError):
+                            # Línea incompleta (p. ej. corte de luz): ignorar
+                            continue
+                        self.cards[card.key] = card
+                        self._journal_lines += 1
+        except Exception as e:
+            print(f"Error al cargar repasos: {e}")
+
+        self._rebuild_heaps()
+
+    def _write(self, task):
+        if self.saver is not None:
+            self.saver.enqueue(task)
+        else:
+            task()
+
+    def _append_journal(self, card):
+        line = json.dumps(card.to_dict(), ensure_ascii=False) + "\n"
+
+        def append():
+            try:
+                os.makedirs(self.data_dir, exist_ok=True)
+                with open(self.journal_file, "a", encoding="utf-8") as f:
+                    f.write(line)
+            except Exception as e:
+                print(f"Error al guardar repaso: {e}")
+
+        self._write(append)
+        self._journal_lines += 1
+        if self._journal_lines > COMPACT_RATIO * max(len(self.cards), 64):
+            self.compact()
+
+    def compact(self):
+        """Reescribe el diario con una línea por tarjeta (archivo temporal + rename)"""
+        lines = [json.dumps(card.to_dict(), ensure_ascii=False) + "\n"
+                 for card in self.cards.values()]
+
+        def rewrite():
+            try:
+                os.makedirs(self.data_dir, exist_ok=True)
+                tmp_file = self.journal_file + ".tmp"
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    f.writelines(lines)
+                os.replace(tmp_file, self.journal_file)
+            except Exception as e:
+                print(f"Error al compactar repasos: {e}")
+
+        self._write(rewrite)
+        self._journal_lines = len(lines)
+        self._rebuild_heaps()
+
+    # --- Índice de vencimientos ---
+
+    def _rebuild_heaps(self):
+        self._heap = []
+        self._category_heaps = {}
+        for card in self.cards.values():
+            entry = (card.due, self._next_sequence(), card.version, card.key)
+            self._heap.append(entry)
+            self._category_heaps.setdefault(card.category, []).append(entry)
+        heapq.heapify(self._heap)
+        for heap in self._category_heaps.values():
+            heapq.heapify(heap)
+
+    def _next_sequence(self):
+        self._sequence += 1
+        return self._sequence
+
+    def _push(self, card):
+        entry = (card.due, self._next_sequence(), card.version, card.key)
+        heapq.heappush(self._heap, entry)
+        heapq.heappush(self._category_heaps.setdefault(card.category, []), entry)
+        if len(self._heap) - len(self.cards) > STALE_RATIO * max(len(self.cards), 64):
+            self._rebuild_heaps()
+
+    def _heap_for(self, category):
+        if category is None:
+            return self._heap
+        return self._category_heaps.get(category, [])
+
+    def _discard_stale(self, heap):
+        # Quitar de la cima las entradas de versiones antiguas
+        while heap:
+            _, _, version, key = heap[0]
+            card = self.cards.get(key)
+            if card is not None and card.version == version:
+                return heap[0]
+            heapq.heappop(heap)
+        return None
+
+    def next_due(self, category=None, now=None):
+        """Devuelve (categoría, español) de la próxima tarjeta vencida, o None"""
+        now = time.time() if now is None else now
+        top = self._discard_stale(self._heap_for(category))
+        if top is None or top[0] > now:
+            return None
+        return top[3]
+
+    def due_cards(self, category=None, limit=10, now=None):
+        """Devuelve hasta 'limit' tarjetas vencidas, de la más atrasada a la menos"""
+        now = time.time() if now is None else now
+        heap = self._heap_for(category)
+        popped = []
+        cards = []
+        while len(cards) < limit:
+            top = self._discard_stale(heap)
+            if top is None or top[0] > now:
+                break
+            popped.append(heapq.heappop(heap))
+            cards.append(top[3])
+        for entry in popped:
+            heapq.heappush(heap, entry)
+        return cards
+
+    def due_count(self, category=None, now=None):
+        """Número de tarjetas vencidas (recorre las tarjetas)"""
+        now = time.time() if now is None else now
+        return sum(1 for card in self.cards.values()
+                   if card.due <= now and (category is None or card.category == category))
+
+    # --- Repasos ---
+
+    def get_card(self, category, spanish):
+        """Devuelve el estado de una palabra, o None si nunca se repasó"""
+        return self.cards.get((category, spanish))
+
+    def review(self, category, spanish, quality, now=None):
+        """Registra un repaso con calidad 0-5 (SM-2) y lo guarda en el diario"""
+        now = time.time() if now is None else now
+        quality = max(0, min(5, int(quality)))
+
+        card = self.cards.get((category, spanish))
+        if card is None:
+            card = self.cards[(category, spanish)] = CardState(category, spanish)
+
+        if quality < 3:
+            card.repetitions = 0
+            card.interval = 0.0
+            card.lapses += 1
+            card.due = now + RELEARN_SECONDS
+        else:
+            if card.repetitions == 0:
+                card.interval = 1.0
+            elif card.repetitions == 1:
+                card.interval = 6.0
+            else:
+                card.interval = card.interval * card.ease
+            card.repetitions += 1
+            card.due = now + card.interval * DAY_SECONDS
+
+        card.ease = max(MIN_EASE,
+                        card.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        card.version += 1
+
+        self._push(card)
+        self._append_journal(card)
+        return card
+
+    def order_deck(self, category, spanish_words, now=None, rng=random):
+        """Ordena un mazo: primero vencidas, luego nuevas y al final el resto"""
+        now = time.time() if now is None else now
+        due, new, later = [], [], []
+        for spanish in spanish_words:
+            card = self.cards.get((category, spanish))
+            if card is None:
+                new.append(spanish)
+            elif card.due <= now:
+                due.append((card.due, spanish))
+            else:
+                later.append((card.due, spanish))
+
+        due.sort()
+        later.sort()
+        rng.shuffle(new)
+        return [w for _, w in due] + new + [w for _, w in later]
@@ -0,0 +1,466 @@
+# core/session.py - SESIONES DE JUEGO SIN INTERFAZ
+import abc
+import random
+from collections import deque
+
+from .answer_matcher import CLOSE, EXACT, MatchResult, get_matcher
+from .quiz_generator import QuizGenerator
+from .reverse_index import ENGLISH_TO_SPANISH, SPANISH_TO_ENGLISH
+
+# Puntos por modo de juego
+QUIZ_ANSWER_POINTS = 10      # al acertar cada pregunta
+QUIZ_RESULT_POINTS = 10      # por acierto al terminar el quiz
+TRANSLATION_POINTS = 15      # por traducción correcta
+FLASHCARD_POINTS = 5         # por tarjeta revisada
+POINTS_PER_LEVEL = 100
+
+
+class EventEmitter:
+    """Lista de oyentes que reciben eventos ``{"type": ..., ...}``"""
+
+    def __init__(self):
+        self._listeners = []
+
+    def subscribe(self, listener):
+        """Registra una función que recibe cada evento"""
+        self._listeners.append(listener)
+        return listener
+
+    def unsubscribe(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def emit(self, event_type, **fields):
+        event = dict(fields, type=event_type)
+        for listener in list(self._listeners):
+            listener(event)
+        return event
+
+
+class Scoreboard(EventEmitter):
+    """Puntuación y nivel de la partida en curso.
+
+    Emite ``score`` (score, points) y ``level_up`` (level). Los puntos se
+    pasan a Game con ``save`` al terminar cada sesión.
+    """
+
+    def __init__(self, game):
+        super().__init__()
+        self.game = game
+        self.score = game.score
+        self.level = game.level
+
+    def add(self, points):
+        """Suma puntos y sube de nivel cada 100"""
+        if not points:
+            return self.score
+        self.score += points
+        self.emit("score", score=self.score, points=points)
+
+        new_level = self.score // POINTS_PER_LEVEL + 1
+        if new_level > self.level:
+            self.level = new_level
+            self.emit("level_up", level=self.level)
+        return self.score
+
+    def save(self):
+        """Guarda en Game los puntos ganados desde el último guardado"""
+        try:
+            # Solo se anexan eventos; la instantánea se escribe periódicamente
+            delta = self.score - self.game.score
+            if delta:
+                self.game.add_points(delta)
+            self.game.set_level(self.level)
+        except Exception as e:
+            print(f"Error guardando progreso: {e}")
+
+
+class GameSession(EventEmitter, abc.ABC):
+    """Base de una sesión de juego independiente de Tk.
+
+    Eventos emitidos:
+      - ``item``: nuevo elemento (item, position, total)
+      - ``answer``: resultado de una respuesta
+      - ``finished``: resumen final (game_type, correct, total, accuracy, points)
+
+    Una sesión se puede jugar entera sin interfaz: ``start()`` y después
+    ``answer(...)``/``next()`` hasta que ``finished`` sea verdadero.
+    """
+
+    game_type = None
+
+    def __init__(self, game, scoreboard=None):
+        super().__init__()
+        self.game = game
+        self.scoreboard = scoreboard if scoreboard is not None else Scoreboard(game)
+        self.position = 0
+        self.correct = 0
+        self.current = None
+        self.answered = False
+        self.finished = False
+        self.result = None
+
+    @property
+    def total(self):
+        return 0
+
+    def record_review(self, category, spanish, correct, grade=None):
+        """Registra el resultado de una palabra en el programador de repasos"""
+        if grade is None:
+            grade = 4 if correct else 1
+        try:
+            self.game.scheduler.review(category, spanish, grade)
+            self.game.record_answer(category, spanish, correct)
+        except Exception as e:
+            print(f"Error registrando repaso: {e}")
+
+    def emit_item(self):
+        return self.emit("item", item=self.current, position=self.position, total=self.total)
+
+    def advance(self):
+        # Pasa al siguiente elemento o termina la sesión
+        self.position += 1
+        self.answered = False
+        self.current = self.next_item()
+        if self.current is None:
+            return self.finish()
+        return self.emit_item()
+
+    @abc.abstractmethod
+    def next_item(self):
+        """Devuelve el siguiente elemento, o None si no quedan"""
+
+    @abc.abstractmethod
+    def upcoming(self, count):
+        """Palabras (categoría, español) del elemento actual y los siguientes"""
+
+    def next(self):
+        """Pasa al siguiente elemento (o termina si no quedan)"""
+        if self.finished:
+            return None
+        return self.advance()
+
+    @abc.abstractmethod
+    def summary(self):
+        """Devuelve (aciertos, preguntas, puntos) al terminar"""
+
+    def finish(self):
+        """Termina la sesión: suma los puntos, registra la partida y guarda"""
+        if self.finished:
+            return self.result
+        self.finished = True
+        self.current = None
+
+        correct, total, points = self.summary()
+        if total == 0:
+            # Se terminó sin llegar a jugar
+            self.result = None
+            self.emit("cancelled")
+            return None
+
+        self.scoreboard.add(points)
+        try:
+            self.game.record_game(self.game_type, correct, total, self.category)
+        except Exception as e:
+            print(f"Error registrando partida: {e}")
+        self.scoreboard.save()
+
+        self.result = self.emit("finished", game_type=self.game_type, correct=correct,
+                                total=total, accuracy=correct / total * 100,
+                                points=points, score=self.scoreboard.score)
+        return self.result
+
+
+class QuizSession(GameSession):
+    """Quiz de opción múltiple (normal, práctica infinita o repaso)"""
+
+    game_type = "quiz"
+
+    def __init__(self, game, generator=None, category=None, num_questions=10,
+                 endless=False, review=False, scoreboard=None, direction=SPANISH_TO_ENGLISH):
+        super().__init__(game, scoreboard)
+        self.generator = generator if generator is not None else QuizGenerator(game.vocabulary)
+        self.direction = direction
+        self.category = None if review else category
+        self.review_category = category
+        self.num_questions = num_questions
+        self.endless = endless
+        self.review = review
+        self.stream = None
+        # Preguntas ya generadas que aún no se han mostrado
+        self.lookahead = deque()
+        self.question_count = 0
+        self.selected_answer = None
+
+    @property
+    def total(self):
+        return self.question_count
+
+    def start(self):
+        """Prepara las preguntas; devuelve False si no hay ninguna"""
+        # Las preguntas se generan una a una bajo demanda
+        if self.review:
+            # Palabras vencidas según el programador de repasos
+            due_words = self.game.scheduler.due_cards(self.review_category, self.num_questions)
+            self.stream = self.generator.iter_questions_for_words(due_words, self.direction)
+            self.question_count = len(due_words)
+        else:
+            self.stream = self.generator.iter_multiple_choice(
+                category=self.category,
+                limit=None if self.endless else self.num_questions,
+                direction=self.direction
+            )
+            if self.endless:
+                self.question_count = 0
+            else:
+                self.question_count = self.generator.count_questions(self.category,
+                                                                     self.num_questions)
+
+        self.current = self.next_item()
+        if self.current is None:
+            self.finished = True
+            return False
+        self.emit_item()
+        return True
+
+    def next_item(self):
+        self.selected_answer = None
+        if self.lookahead:
+            return self.lookahead.popleft()
+        return next(self.stream, None)
+
+    def upcoming(self, count):
+        # Genera por adelantado las preguntas que falten para mirar el futuro
+        while self.stream is not None and len(self.lookahead) < count - 1:
+            question = next(self.stream, None)
+            if question is None:
+                break
+            self.lookahead.append(question)
+        questions = ([self.current] if self.current is not None else []) + list(self.lookahead)
+        return [(q['category'], q['spanish']) for q in questions[:count]]
+
+    def answer(self, index):
+        """Responde con el índice de una opción; devuelve el evento 'answer'"""
+        if self.current is None or self.answered:
+            return None
+        question = self.current
+        selected = question['options'][index]
+        is_correct = selected == question['correct']
+        self.answered = True
+        self.selected_answer = selected
+        self.record_review(question['category'], question['spanish'], is_correct)
+
+        if is_correct:
+            self.correct += 1
+        event = self.emit("answer", correct=is_correct, selected=index,
+                          correct_index=question['options'].index(question['correct']),
+                          answer=question['correct'])
+        if is_correct:
+            # Añadir puntos inmediatamente
+            self.scoreboard.add(QUIZ_ANSWER_POINTS)
+        return event
+
+    def summary(self):
+        if self.endless:
+            # Contar solo las preguntas que llegaron a mostrarse
+            self.question_count = self.position + (1 if self.answered else 0)
+            self.stream = None
+            self.lookahead.clear()
+        return self.correct, self.question_count, self.correct * QUIZ_RESULT_POINTS
+
+
+class TranslationSession(GameSession):
+    """Traducción escrita de palabras al inglés (o al español en sentido inverso)"""
+
+    game_type = "translation"
+
+    def __init__(self, game, category=None, num_words=10, review=False,
+                 scoreboard=None, rng=random, matcher=None, direction=SPANISH_TO_ENGLISH):
+        super().__init__(game, scoreboard)
+        # Comparador tolerante a mayúsculas, acentos y erratas pequeñas
+        self.matcher = matcher if matcher is not None else get_matcher()
+        self.direction = direction
+        self.category = None if review else category
+        self.review_category = category
+        self.num_words = num_words
+        self.review = review
+        self.rng = rng
+        self.words = []
+
+    @property
+    def total(self):
+        return len(self.words)
+
+    def start(self):
+        """Elige las palabras; devuelve False si no hay ninguna"""
+        if self.review:
+            # Palabras vencidas según el programador de repasos
+            self.words = []
+            for cat, esp in self.game.scheduler.due_cards(self.review_category, self.num_words):
+                eng = self.game.get_category_words(cat).get(esp)
+                if eng is not None:
+                    self.words.append(self.make_word(cat, esp, eng))
+        else:
+            # Muestra aleatoria sin recorrer todo el vocabulario
+            self.words = [self.make_word(cat, esp, eng)
+                          for cat, esp, eng in self.game.sample_words(self.num_words,
+                                                                      self.category)]
+
+        self.current = self.next_item()
+        if self.current is None:
+            self.finished = True
+            return False
+        self.emit_item()
+        return True
+
+    def make_word(self, category, spanish, english):
+        """Palabra de la sesión; 'prompt' es lo que se muestra para traducir"""
+        prompt = english if self.direction == ENGLISH_TO_SPANISH else spanish
+        return {"spanish": spanish, "english": english, "category": category, "prompt": prompt}
+
+    def next_item(self):
+        if self.position < len(self.words):
+            return self.words[self.position]
+        return None
+
+    def upcoming(self, count):
+        return [(word['category'], word['spanish'])
+                for word in self.words[self.position:self.position + count]]
+
+    def answer(self, text):
+        """Comprueba una traducción escrita; devuelve el evento 'answer'"""
+        if self.current is None or self.answered:
+            return None
+        word_data = self.current
+        result = self.match(word_data, text)
+        is_correct = result.correct
+        self.answered = True
+        # Una errata cuenta como acierto, pero la palabra se repasa antes
+        self.record_review(word_data['category'], word_data['spanish'], is_correct,
+                           grade=3 if result.verdict == CLOSE else None)
+
+        if is_correct:
+            self.correct += 1
+        return self.emit("answer", correct=is_correct, verdict=result.verdict,
+                         distance=result.distance, given=text, answer=result.expected)
+
+    def check(self, text):
+        """Indica si lo escrito ya es una respuesta exacta (para cada pulsación)"""
+        if self.current is None or self.answered:
+            return False
+        if self.direction == ENGLISH_TO_SPANISH:
+            return self.find_spanish(self.current, text) is not None
+        return self.matcher.is_exact(self.accepted_answers(self.current), text)
+
+    def suggest(self, text, limit=5):
+        """Sugerencias para lo escrito (modo de ayuda); no cuenta como respuesta"""
+        if self.current is None or self.answered:
+            return []
+        return self.game.complete_answer(text, self.direction, limit)
+
+    def match(self, word_data, text):
+        """Compara lo escrito con las respuestas aceptadas de una palabra"""
+        if self.direction == ENGLISH_TO_SPANISH:
+            # Exacta o sin acentos ("platano") con una consulta al índice inverso
+            expected = self.find_spanish(word_data, text)
+            if expected is not None:
+                return MatchResult(EXACT, expected, 0)
+        return self.matcher.match(self.accepted_answers(word_data), text,
+                                  self.game.get_answer_forms(self.direction))
+
+    def find_spanish(self, word_data, text):
+        return self.game.find_spanish_answer(word_data['category'], word_data['spanish'], text)
+
+    def accepted_answers(self, word_data):
+        """Respuestas aceptadas de la palabra (la principal primero)"""
+        answers = word_data.get('answers')
+        if answers is None:
+            answers = self.game.get_accepted_answers(word_data['category'],
+                                                     word_data['spanish'], self.direction)
+            if not answers:
+                answers = [word_data['spanish' if self.direction == ENGLISH_TO_SPANISH
+                                     else 'english']]
+            word_data['answers'] = answers
+        return answers
+
+    def hint(self):
+        """Pista: primera letra y algunas letras al azar"""
+        correct_answer = self.accepted_answers(self.current)[0]
+        hint = ""
+        for i, char in enumerate(correct_answer):
+            if i == 0:
+                hint += char.upper()
+            elif i < len(correct_answer) - 1 and self.rng.random() > 0.5:
+                hint += char
+            else:
+                hint += "_"
+        return hint
+
+    def summary(self):
+        return self.correct, len(self.words), self.correct * TRANSLATION_POINTS
+
+
+class FlashcardSession(GameSession):
+    """Mazo de tarjetas de una categoría ordenado por el programador de repasos"""
+
+    game_type = "flashcards"
+
+    def __init__(self, game, category, scoreboard=None, direction=SPANISH_TO_ENGLISH):
+        super().__init__(game, scoreboard)
+        self.category = category
+        self.direction = direction
+        self.cards = []
+        self.revealed = False
+
+    @property
+    def total(self):
+        return len(self.cards)
+
+    def start(self):
+        """Ordena el mazo; devuelve False si la categoría está vacía"""
+        category_words = self.game.get_category_words(self.category)
+        # Primero las vencidas, luego las nuevas y al final el resto
+        order = self.game.scheduler.order_deck(self.category, category_words.keys())
+        self.cards = [(spanish, category_words[spanish]) for spanish in order]
+
+        self.current = self.next_item()
+        if self.current is None:
+            self.finished = True
+            return False
+        self.emit_item()
+        return True
+
+    def next_item(self):
+        self.revealed = False
+        if self.position < len(self.cards):
+            return self.cards[self.position]
+        return None
+
+    def upcoming(self, count):
+        return [(self.category, spanish)
+                for spanish, _ in self.cards[self.position:self.position + count]]
+
+    def faces(self):
+        """(anverso, reverso) de la tarjeta actual según el sentido"""
+        spanish, english = self.current
+        if self.direction == ENGLISH_TO_SPANISH:
+            return english, spanish
+        return spanish, english
+
+    def reveal(self):
+        """Muestra la traducción de la tarjeta actual"""
+        if self.current is None:
+            return None
+        self.revealed = True
+        return self.emit("reveal", answer=self.faces()[1])
+
+    def next(self, remembered=True):
+        """Registra si se recordaba la tarjeta y pasa a la siguiente"""
+        if self.finished:
+            return None
+        self.record_review(self.category, self.current[0], remembered)
+        return self.advance()
+
+    def summary(self):
+        reviewed = min(self.position, len(self.cards))
+        return reviewed, reviewed, reviewed * FLASHCARD_POINTS
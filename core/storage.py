@@ -0,0 +1,436 @@
+# core/storage.py - ALMACENAMIENTO SQLITE COMPARTIDO
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from .event_log import EventLog
+
+DEFAULT_DB_PATH = os.path.join("data", "english_adventure.db")
+DEFAULT_PLAYER_NAME = "Explorador"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL DEFAULT 0,
+    level INTEGER NOT NULL DEFAULT 1,
+    created TEXT NOT NULL,
+    updated TEXT
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    game_type TEXT NOT NULL,
+    category TEXT,
+    started TEXT NOT NULL,
+    ended TEXT,
+    questions INTEGER NOT NULL DEFAULT 0,
+    correct INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_profile_type ON sessions(profile_id, game_type);
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY,
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    session_id INTEGER REFERENCES sessions(id),
+    category TEXT NOT NULL,
+    spanish TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    answered_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_attempts_word ON attempts(profile_id, category, spanish);
+CREATE INDEX IF NOT EXISTS idx_attempts_session ON attempts(session_id);
+CREATE TABLE IF NOT EXISTS aggregates (
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    key TEXT NOT NULL,
+    value,
+    PRIMARY KEY (profile_id, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS achievements (
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    id TEXT NOT NULL,
+    unlocked TEXT NOT NULL,
+    PRIMARY KEY (profile_id, id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value
+) WITHOUT ROWID;
+"""
+
+# Sentencias fijas: sqlite3 las prepara una vez y las reutiliza de su caché
+SQL_ADD_POINTS = "UPDATE profiles SET score = score + ?, updated = ? WHERE id = ?"
+SQL_SET_LEVEL = "UPDATE profiles SET level = MAX(level, ?), updated = ? WHERE id = ?"
+SQL_SET_PROGRESS = "UPDATE profiles SET score = ?, level = ?, updated = ? WHERE id = ?"
+SQL_INSERT_ATTEMPT = ("INSERT INTO attempts (profile_id, session_id, category, spanish, "
+                      "correct, answered_at) VALUES (?, ?, ?, ?, ?, ?)")
+SQL_INSERT_SESSION = ("INSERT INTO sessions (profile_id, game_type, category, started, "
+                      "ended, questions, correct) VALUES (?, ?, ?, ?, ?, ?, ?)")
+SQL_FINISH_SESSION = "UPDATE sessions SET ended = ?, questions = ?, correct = ? WHERE id = ?"
+SQL_UPSERT_AGGREGATE = ("INSERT INTO aggregates (profile_id, key, value) VALUES (?, ?, ?) "
+                        "ON CONFLICT(profile_id, key) DO UPDATE SET value = excluded.value")
+SQL_INCREMENT_AGGREGATE = ("INSERT INTO aggregates (profile_id, key, value) VALUES (?, ?, ?) "
+                           "ON CONFLICT(profile_id, key) DO UPDATE SET value = value + excluded.value")
+
+# Claves de progreso guardadas en la fila del perfil
+PROFILE_COLUMNS = ("score", "level")
+STATS_PREFIX = "stats."
+# Secciones que DataManager guarda en caché
+SECTIONS = ("progress", "stats")
+
+
+class Storage:
+    """Capa de almacenamiento única en SQLite (modo WAL).
+
+    Guarda perfiles, sesiones, intentos por palabra y agregados en tablas
+    indexadas. Una sola conexión se comparte entre Game, DataManager,
+    ProgressManager y la interfaz; registrar una respuesta es un INSERT.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.is_new = not os.path.exists(db_path)
+        self._lock = threading.RLock()
+        self._depth = 0
+        # Escrituras propias en cada sección cacheada (ver section_version)
+        self._section_changes = dict.fromkeys(SECTIONS, 0)
+        # Modo autocommit: las transacciones se abren explícitamente
+        self.conn = sqlite3.connect(db_path, check_same_thread=False,
+                                    isolation_level=None, cached_statements=128)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+
+        self.profile_id = self._load_active_profile()
+
+    # --- Transacciones ---
+
+    @contextmanager
+    def transaction(self):
+        """Agrupa varias escrituras en una transacción (anidable)"""
+        with self._lock:
+            outermost = self._depth == 0
+            if outermost:
+                self.conn.execute("BEGIN")
+            self._depth += 1
+            try:
+                yield self.conn
+            except Exception:
+                self._depth -= 1
+                if outermost:
+                    self.conn.execute("ROLLBACK")
+                raise
+            else:
+                self._depth -= 1
+                if outermost:
+                    self.conn.execute("COMMIT")
+
+    def _execute(self, sql, params=()):
+        with self._lock:
+            return self.conn.execute(sql, params)
+
+    def _query_one(self, sql, params=()):
+        with self._lock:
+            return self.conn.execute(sql, params).fetchone()
+
+    def _query_all(self, sql, params=()):
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def _touch(self, *sections):
+        with self._lock:
+            for section in sections:
+                self._section_changes[section] += 1
+
+    def section_version(self, section):
+        """Firma de una sección ("progress" o "stats").
+
+        PRAGMA data_version solo cambia con commits de otras conexiones, así
+        que se combina con el contador de escrituras propias de esa sección:
+        registrar intentos o sesiones no invalida la caché del progreso.
+        """
+        with self._lock:
+            external = self.conn.execute("PRAGMA data_version").fetchone()[0]
+            return external, self._section_changes[section]
+
+    def close(self):
+        """Cierra la conexión"""
+        with self._lock:
+            self.conn.close()
+
+    # --- Perfiles ---
+
+    def _load_active_profile(self):
+        row = self._query_one("SELECT value FROM settings WHERE key = 'active_profile'")
+        if row is not None:
+            return int(row[0])
+        return self.create_profile(DEFAULT_PLAYER_NAME, activate=True)
+
+    def create_profile(self, name, activate=False):
+        """Crea un perfil y devuelve su id"""
+        with self.transaction():
+            cursor = self.conn.execute(
+                "INSERT INTO profiles (name, created) VALUES (?, ?)",
+                (name, datetime.now().isoformat()))
+            profile_id = cursor.lastrowid
+            if activate:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO settings (key, value) VALUES ('active_profile', ?)",
+                    (profile_id,))
+        if activate:
+            self.profile_id = profile_id
+            self._touch(*SECTIONS)
+        return profile_id
+
+    def set_active_profile(self, profile_id):
+        """Cambia el perfil activo"""
+        self._execute("INSERT OR REPLACE INTO settings (key, value) VALUES ('active_profile', ?)",
+                      (profile_id,))
+        self.profile_id = profile_id
+        self._touch(*SECTIONS)
+
+    def list_profiles(self):
+        """Devuelve [(id, nombre)] de todos los perfiles"""
+        return self._query_all("SELECT id, name FROM profiles ORDER BY id")
+
+    def get_player_name(self):
+        """Nombre del perfil activo"""
+        row = self._query_one("SELECT name FROM profiles WHERE id = ?", (self.profile_id,))
+        return row[0] if row else DEFAULT_PLAYER_NAME
+
+    def set_player_name(self, name):
+        """Cambia el nombre del perfil activo"""
+        self._execute("UPDATE profiles SET name = ?, updated = ? WHERE id = ?",
+                      (name, datetime.now().isoformat(), self.profile_id))
+
+    # --- Progreso ---
+
+    def load_progress(self):
+        """Devuelve el progreso del perfil activo como diccionario"""
+        progress = {}
+        row = self._query_one("SELECT score, level FROM profiles WHERE id = ?",
+                              (self.profile_id,))
+        if row is not None:
+            progress["score"], progress["level"] = row
+        for key, value in self._query_all(
+                "SELECT key, value FROM aggregates WHERE profile_id = ? AND key NOT LIKE ?",
+                (self.profile_id, STATS_PREFIX + "%")):
+            progress[key] = _decode_value(value)
+        return progress
+
+    def save_progress(self, progress_data):
+        """Guarda las claves de progreso indicadas en una transacción"""
+        now = datetime.now().isoformat()
+        self._touch("progress")
+        with self.transaction():
+            if "score" in progress_data or "level" in progress_data:
+                current = self.load_progress()
+                self.conn.execute(SQL_SET_PROGRESS, (
+                    progress_data.get("score", current.get("score", 0)),
+                    progress_data.get("level", current.get("level", 1)),
+                    now, self.profile_id))
+            self.conn.executemany(SQL_UPSERT_AGGREGATE, [
+                (self.profile_id, key, _encode_value(value))
+                for key, value in progress_data.items() if key not in PROFILE_COLUMNS
+            ])
+
+    def add_points(self, points):
+        """Suma puntos al perfil activo"""
+        self._execute(SQL_ADD_POINTS, (points, datetime.now().isoformat(), self.profile_id))
+        self._touch("progress")
+
+    def set_level(self, level):
+        """Sube el nivel del perfil activo (nunca baja)"""
+        self._execute(SQL_SET_LEVEL, (level, datetime.now().isoformat(), self.profile_id))
+        self._touch("progress")
+
+    # --- Sesiones e intentos ---
+
+    def start_session(self, game_type, category=None):
+        """Abre una sesión de juego y devuelve su id"""
+        cursor = self._execute(SQL_INSERT_SESSION, (
+            self.profile_id, game_type, category, datetime.now().isoformat(), None, 0, 0))
+        return cursor.lastrowid
+
+    def finish_session(self, session_id, questions, correct):
+        """Cierra una sesión con su resultado"""
+        self._execute(SQL_FINISH_SESSION,
+                      (datetime.now().isoformat(), questions, correct, session_id))
+
+    def record_attempt(self, category, spanish, correct, session_id=None, answered_at=None):
+        """Registra la respuesta a una palabra (un solo INSERT)"""
+        answered_at = time.time() if answered_at is None else answered_at
+        self._execute(SQL_INSERT_ATTEMPT, (self.profile_id, session_id, category, spanish,
+                                           1 if correct else 0, answered_at))
+
+    def record_attempts(self, attempts, session_id=None):
+        """Registra muchas respuestas [(categoría, español, correcta)] en un lote"""
+        now = time.time()
+        with self.transaction():
+            self.conn.executemany(SQL_INSERT_ATTEMPT, [
+                (self.profile_id, session_id, category, spanish, 1 if correct else 0, now)
+                for category, spanish, correct in attempts
+            ])
+
+    def word_accuracy(self, category, spanish):
+        """Devuelve (intentos, aciertos) de una palabra"""
+        row = self._query_one(
+            "SELECT COUNT(*), COALESCE(SUM(correct), 0) FROM attempts "
+            "WHERE profile_id = ? AND category = ? AND spanish = ?",
+            (self.profile_id, category, spanish))
+        return row[0], row[1]
+
+    # --- Estadísticas ---
+
+    def load_stats(self):
+        """Devuelve las estadísticas del perfil activo como diccionario"""
+        stats = {"games": {}}
+        for key, value in self._query_all(
+                "SELECT key, value FROM aggregates WHERE profile_id = ? AND key LIKE ?",
+                (self.profile_id, STATS_PREFIX + "%")):
+            path = key[len(STATS_PREFIX):].split(".")
+            target = stats
+            for part in path[:-1]:
+                target = target.setdefault(part, {})
+            target[path[-1]] = _decode_value(value)
+        return stats
+
+    def save_stats(self, stats_data):
+        """Guarda las estadísticas aplanadas en la tabla de agregados"""
+        rows = [(self.profile_id, STATS_PREFIX + key, _encode_value(value))
+                for key, value in _flatten(stats_data)]
+        self._touch("stats")
+        with self.transaction():
+            self.conn.executemany(SQL_UPSERT_AGGREGATE, rows)
+
+    def record_game(self, game_type, correct_answers, total_questions, category=None):
+        """Registra una partida terminada y actualiza los agregados en un lote"""
+        now = datetime.now().isoformat()
+        base = f"{STATS_PREFIX}games.{game_type}."
+        self._touch("stats")
+        with self.transaction():
+            self.conn.execute(SQL_INSERT_SESSION, (
+                self.profile_id, game_type, category, now, now,
+                total_questions, correct_answers))
+            self.conn.executemany(SQL_INCREMENT_AGGREGATE, [
+                (self.profile_id, STATS_PREFIX + "total_games", 1),
+                (self.profile_id, STATS_PREFIX + "total_questions", total_questions),
+                (self.profile_id, STATS_PREFIX + "total_correct", correct_answers),
+                (self.profile_id, base + "played", 1),
+                (self.profile_id, base + "questions", total_questions),
+                (self.profile_id, base + "correct", correct_answers),
+            ])
+            self.conn.execute(SQL_UPSERT_AGGREGATE,
+                              (self.profile_id, STATS_PREFIX + "last_play", now))
+            self.conn.execute("INSERT OR IGNORE INTO aggregates (profile_id, key, value) "
+                              "VALUES (?, ?, ?)",
+                              (self.profile_id, STATS_PREFIX + "first_play", now))
+            questions, correct = self.conn.execute(
+                "SELECT "
+                "(SELECT value FROM aggregates WHERE profile_id = ?1 AND key = ?2), "
+                "(SELECT value FROM aggregates WHERE profile_id = ?1 AND key = ?3)",
+                (self.profile_id, STATS_PREFIX + "total_questions",
+                 STATS_PREFIX + "total_correct")).fetchone()
+            if questions:
+                self.conn.execute(SQL_UPSERT_AGGREGATE, (
+                    self.profile_id, STATS_PREFIX + "overall_accuracy",
+                    (correct / questions) * 100))
+
+    # --- Logros ---
+
+    def load_achievements(self):
+        """Devuelve {id de logro: fecha de desbloqueo} del perfil activo"""
+        return dict(self._query_all(
+            "SELECT id, unlocked FROM achievements WHERE profile_id = ?", (self.profile_id,)))
+
+    def unlock_achievement(self, achievement_id, unlocked):
+        """Guarda un logro desbloqueado (la primera fecha se conserva)"""
+        self._execute("INSERT OR IGNORE INTO achievements (profile_id, id, unlocked) "
+                      "VALUES (?, ?, ?)", (self.profile_id, achievement_id, unlocked))
+
+    def correct_words(self):
+        """Devuelve las palabras (categoría, español) acertadas alguna vez"""
+        return self._query_all(
+            "SELECT DISTINCT category, spanish FROM attempts "
+            "WHERE profile_id = ? AND correct = 1", (self.profile_id,))
+
+    # --- Migración ---
+
+    def import_json_files(self, data_dir="data"):
+        """Importa progress.json/.log, stats.json y player.json de versiones anteriores"""
+        state, events = EventLog(data_dir).load()
+        progress = {k: v for k, v in state.items() if k not in ("seq", "saved", "achievements")}
+        unlocked = dict(state.get("achievements", {}).get("unlocked", {}))
+        for event in events:
+            if event["type"] == "points":
+                progress["score"] = progress.get("score", 0) + event.get("points", 0)
+            elif event["type"] == "level_up":
+                progress["level"] = max(progress.get("level", 1), event.get("level", 1))
+            elif event["type"] == "achievement":
+                unlocked.setdefault(event["id"], event["unlocked"])
+
+        stats = _read_json(os.path.join(data_dir, "stats.json"))
+        player = _read_json(os.path.join(data_dir, "player.json"))
+
+        with self.transaction():
+            if progress:
+                self.save_progress(progress)
+            if stats:
+                self.save_stats(stats)
+            if player.get("name"):
+                self.set_player_name(player["name"])
+            for achievement_id, when in unlocked.items():
+                self.unlock_achievement(achievement_id, when)
+
+
+def _flatten(data, prefix=""):
+    for key, value in data.items():
+        if isinstance(value, dict):
+            yield from _flatten(value, f"{prefix}{key}.")
+        else:
+            yield f"{prefix}{key}", value
+
+
+def _encode_value(value):
+    # Números y textos se guardan tal cual; el resto como JSON
+    if value is None or isinstance(value, (int, float, str)):
+        return value
+    return "json:" + json.dumps(value, ensure_ascii=False)
+
+
+def _decode_value(value):
+    if isinstance(value, str) and value.startswith("json:"):
+        return json.loads(value[5:])
+    return value
+
+
+def _read_json(path):
+    try:
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+    except Exception as e:
+        print(f"Error al leer {path}: {e}")
+    return {}
+
+
+_storage = None
+
+
+def get_storage(db_path=None):
+    """Abre (una sola vez) y devuelve el almacenamiento compartido"""
+    global _storage
+    if _storage is None:
+        db_path = db_path or DEFAULT_DB_PATH
+        _storage = Storage(db_path)
+        if _storage.is_new:
+            _storage.import_json_files(os.path.dirname(db_path) or ".")
+    return _storage
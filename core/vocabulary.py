@@ -1,3 +1,12 @@
+import os
+import sys
+
+from .answer_index import AnswerIndex
+from .completion import CompletionIndex
+from .reverse_index import ENGLISH_TO_SPANISH, SPANISH_TO_ENGLISH, ReverseIndex
+from .vocabulary_pack import VocabularyPack, VocabularyPackError
+from .word_index import WordIndex
+
 # Diccionario completo de vocabulario español-inglés
 vocabulary_data = {
     "Saludos": {
@@ -107,37 +116,229 @@ vocabulary_data = {
     }
 }
 
+# Otras traducciones aceptadas de una entrada, además de la principal
+alternative_answers = {
+    "Saludos": {
+        "bien": ["fine", "well"],
+        "regular": ["so-so"],
+        "buenas noches": ["good evening"],
+        "lo siento": ["sorry"],
+        "mucho gusto": ["pleased to meet you"]
+    },
+    "Colores": {
+        "celeste": ["sky blue"]
+    },
+    "Números": {
+        "cien": ["a hundred"]
+    }
+}
+
+# Traducciones inglesas equivalentes en cualquier entrada
+synonym_groups = [
+    ("okay", "ok"),
+    ("hello", "hi"),
+    ("goodbye", "bye"),
+    ("mother", "mom"),
+    ("father", "dad")
+]
+
+# Vocabulario activo: paquete compilado si existe, si no el diccionario integrado
+VOCABULARY_PACK_NAME = "vocabulary.pack"
+
+
+def default_pack_path():
+    """data/vocabulary.pack junto al ejecutable (o en la raíz en desarrollo).
+
+    Se resuelve como PathManager.get_app_path y no desde el directorio
+    actual, que cambia al abrir el juego desde un acceso directo.
+    """
+    if getattr(sys, "frozen", False):
+        base_dir = os.path.dirname(sys.executable)
+    else:
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, "data", VOCABULARY_PACK_NAME)
+
+
+DEFAULT_PACK_PATH = default_pack_path()
+
+_active_vocabulary = None
+_vocabulary_version = 0
+_word_index = None
+_answer_index = None
+_reverse_index = None
+# Autocompletado por sentido, ligado al índice de respuestas de su versión
+_completion_indexes = {}
+# Alternativas y sinónimos de un diccionario activado con set_vocabulary
+_answer_data = None
+
+
+def load_vocabulary_pack(pack_path):
+    """Activa un paquete de vocabulario compilado"""
+    set_vocabulary(VocabularyPack(pack_path))
+    return _active_vocabulary
+
+
+def set_vocabulary(vocabulary, alternatives=None, synonyms=None):
+    """Cambia el vocabulario activo (diccionario o VocabularyPack).
+
+    Un diccionario puede traer sus respuestas alternativas
+    ({categoría: {español: [inglés, ...]}}) y grupos de sinónimos; un
+    paquete ya los lleva dentro.
+    """
+    global _active_vocabulary, _answer_data
+    previous = _active_vocabulary
+    _active_vocabulary = vocabulary
+    _answer_data = (vocabulary, alternatives or {}, synonyms or ())
+    mark_vocabulary_changed()
+    if isinstance(previous, VocabularyPack) and previous is not vocabulary:
+        previous.close()
+
+
+def mark_vocabulary_changed():
+    """Invalida los índices derivados tras modificar el vocabulario"""
+    global _vocabulary_version
+    _vocabulary_version += 1
+
+
+def get_word_index(vocabulary=None):
+    """Devuelve el índice plano del vocabulario, reconstruido solo si cambió"""
+    global _word_index
+    vocabulary = get_vocabulary() if vocabulary is None else vocabulary
+    index = _word_index
+    if (index is None or index.vocabulary is not vocabulary
+            or index.version != _vocabulary_version):
+        index = _word_index = WordIndex(vocabulary, _vocabulary_version)
+    return index
+
+
+def get_answer_data(word_index):
+    """Devuelve ({id de palabra: [alternativas]}, grupos de sinónimos) de un índice"""
+    vocabulary = word_index.vocabulary
+    if isinstance(vocabulary, VocabularyPack):
+        return dict(vocabulary.iter_alternatives()), vocabulary.synonym_groups()
+
+    if vocabulary is vocabulary_data:
+        alternatives, synonyms = alternative_answers, synonym_groups
+    elif _answer_data is not None and _answer_data[0] is vocabulary:
+        alternatives, synonyms = _answer_data[1], _answer_data[2]
+    else:
+        return {}, ()
+
+    by_word_id = {}
+    for category, words in alternatives.items():
+        for spanish, extra in words.items():
+            position = word_index.find_position(category, spanish)
+            if position is not None:
+                by_word_id[word_index.word_ids[position]] = list(extra)
+    return by_word_id, synonyms
+
+
+def get_answer_index(vocabulary=None):
+    """Devuelve las respuestas aceptadas del vocabulario, reconstruidas solo si cambió"""
+    global _answer_index
+    word_index = get_word_index(vocabulary)
+    answers = _answer_index
+    if answers is None or answers.word_index is not word_index:
+        alternatives, synonyms = get_answer_data(word_index)
+        answers = _answer_index = AnswerIndex(word_index, alternatives, synonyms)
+    return answers
+
+
+def get_reverse_index(vocabulary=None):
+    """Devuelve el índice inglés -> español, construido al jugar en ese sentido"""
+    global _reverse_index
+    answers = get_answer_index(vocabulary)
+    reverse = _reverse_index
+    if reverse is None or reverse.answers is not answers:
+        reverse = _reverse_index = ReverseIndex(answers)
+    return reverse
+
+
+def get_completion_index(direction=SPANISH_TO_ENGLISH, vocabulary=None):
+    """Devuelve el autocompletado de las respuestas en un sentido.
+
+    Se construye la primera vez que se pide y se reutiliza mientras no
+    cambie el vocabulario (el índice de respuestas sería otro).
+    """
+    if direction == ENGLISH_TO_SPANISH:
+        answers = get_reverse_index(vocabulary)
+    else:
+        answers = get_answer_index(vocabulary)
+    completion = _completion_indexes.get(direction)
+    if completion is None or completion.answers is not answers:
+        completion = _completion_indexes[direction] = CompletionIndex(answers)
+    return completion
+
+
+def get_accepted_answers(category, spanish, vocabulary=None, direction=SPANISH_TO_ENGLISH):
+    """Respuestas aceptadas de una palabra (la principal primero), o [].
+
+    En sentido inglés -> español son las palabras españolas que comparten
+    la traducción de la entrada.
+    """
+    if direction == ENGLISH_TO_SPANISH:
+        answers = get_reverse_index(vocabulary)
+    else:
+        answers = get_answer_index(vocabulary)
+    position = answers.word_index.find_position(category, spanish)
+    if position is None:
+        return []
+    return answers.accepted_answers(position)
+
+
+def find_spanish_answer(category, spanish, text, vocabulary=None):
+    """Palabra española aceptada para el inglés de una entrada que coincide
+    con lo escrito (exacta o sin acentos), o None"""
+    reverse = get_reverse_index(vocabulary)
+    position = reverse.word_index.find_position(category, spanish)
+    if position is None:
+        return None
+    return reverse.match(position, text)
+
+
+def get_vocabulary():
+    """Devuelve el vocabulario activo"""
+    global _active_vocabulary
+    if _active_vocabulary is None:
+        _active_vocabulary = vocabulary_data
+        if os.path.exists(DEFAULT_PACK_PATH):
+            try:
+                _active_vocabulary = VocabularyPack(DEFAULT_PACK_PATH)
+            except (OSError, VocabularyPackError) as e:
+                print(f"⚠️ No se pudo abrir el paquete de vocabulario: {e}")
+    return _active_vocabulary
+
+
+def get_category_size(category, vocabulary=None):
+    """Número de palabras de una categoría sin decodificar el paquete"""
+    vocabulary = get_vocabulary() if vocabulary is None else vocabulary
+    if isinstance(vocabulary, VocabularyPack):
+        return vocabulary.category_size(category)
+    return len(vocabulary.get(category, {}))
+
+
 def get_categories():
     """Devuelve la lista de categorías disponibles"""
-    return list(vocabulary_data.keys())
+    return list(get_vocabulary().keys())
 
 def get_words_by_category(category):
     """Devuelve las palabras de una categoría específica"""
-    return vocabulary_data.get(category, {})
+    return get_vocabulary().get(category, {})
 
 def get_random_word(category=None):
     """Devuelve una palabra aleatoria, opcionalmente de una categoría específica"""
-    import random
-    
-    if category:
-        words = vocabulary_data.get(category, {})
-    else:
-        # Juntar todas las palabras de todas las categorías
-        words = {}
-        for cat_words in vocabulary_data.values():
-            words.update(cat_words)
-    
-    if not words:
-        return None, None
-    
-    spanish_word = random.choice(list(words.keys()))
-    english_word = words[spanish_word]
-    
-    return spanish_word, english_word
-
-def get_word_count():
+    return get_word_index().random_word(category)
+
+def sample_words(k, category=None):
+    """Devuelve k palabras distintas como tuplas (categoría, español, inglés)"""
+    return get_word_index().sample(k, category)
+
+def get_word_count(vocabulary=None):
     """Devuelve el número total de palabras en el vocabulario"""
+    vocabulary = get_vocabulary() if vocabulary is None else vocabulary
+    if isinstance(vocabulary, VocabularyPack):
+        return vocabulary.word_count()
     total = 0
-    for category in vocabulary_data.values():
+    for category in vocabulary.values():
         total += len(category)
     return total
@@ -0,0 +1,334 @@
+# core/vocabulary_pack.py - PAQUETES DE VOCABULARIO COMPILADOS
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Mapping
+from functools import lru_cache
+
+# Formato binario (little-endian):
+#   cabecera    -> magic, versión, flags, nº cadenas, nº categorías, nº entradas, tamaño del blob
+#   cadenas     -> (nº cadenas + 1) offsets uint32 dentro del blob UTF-8
+#   categorías  -> (id cadena nombre, primera entrada, nº entradas) uint32
+#   entradas    -> (id cadena español, id cadena inglés) uint32
+#   blob        -> texto UTF-8 de todas las cadenas (sin duplicados)
+# Con FLAG_ANSWERS, tras el blob:
+#   respuestas  -> nº ids alternativos, nº grupos de sinónimos (uint32)
+#                  (nº entradas + 1) offsets y los ids de cadena alternativos
+#                  (nº grupos + 1) offsets y los ids de cadena de cada grupo
+# Los lectores que no conocen el flag ignoran esa sección y ven solo la
+# traducción principal.
+PACK_MAGIC = b"EAVP"
+PACK_VERSION = 1
+FLAG_ANSWERS = 1
+
+_HEADER = struct.Struct("<4sHHIIII")
+_OFFSET = struct.Struct("<I")
+_CATEGORY = struct.Struct("<III")
+_ENTRY = struct.Struct("<II")
+_ANSWERS = struct.Struct("<II")
+
+
+class VocabularyPackError(Exception):
+    """Error al leer o escribir un paquete de vocabulario"""
+
+
+def compile_vocabulary_pack(vocabulary, pack_path, alternatives=None, synonym_groups=None):
+    """Compila un diccionario {categoría: {español: inglés}} a un paquete binario.
+
+    'alternatives' ({categoría: {español: [inglés, ...]}}) añade respuestas
+    aceptadas a cada entrada y 'synonym_groups' (listas de traducciones
+    equivalentes) se guarda tal cual. Un valor inglés que sea una lista se
+    toma como [principal, alternativas...].
+    """
+    alternatives = alternatives or {}
+    strings = []
+    string_ids = {}
+
+    def intern(text):
+        sid = string_ids.get(text)
+        if sid is None:
+            sid = string_ids[text] = len(strings)
+            strings.append(text)
+        return sid
+
+    categories = []
+    entries = []
+    extra_ids = []
+    for category, words in vocabulary.items():
+        categories.append((intern(category), len(entries), len(words)))
+        category_alternatives = alternatives.get(category, {})
+        for spanish, english in words.items():
+            extra = list(category_alternatives.get(spanish, ()))
+            if isinstance(english, (list, tuple)):
+                english, extra = english[0], list(english[1:]) + extra
+            entries.append((intern(spanish), intern(english)))
+            extra_ids.append([intern(text) for text in extra])
+    groups = [[intern(text) for text in group] for group in synonym_groups or ()]
+    has_answers = any(extra_ids) or bool(groups)
+
+    # Blob de texto y sus offsets
+    blob = bytearray()
+    offsets = [0]
+    for text in strings:
+        blob += text.encode("utf-8")
+        offsets.append(len(blob))
+
+    flags = FLAG_ANSWERS if has_answers else 0
+    header = _HEADER.pack(PACK_MAGIC, PACK_VERSION, flags, len(strings),
+                          len(categories), len(entries), len(blob))
+
+    # Escritura atómica: archivo temporal + rename
+    tmp_path = pack_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        for category in categories:
+            f.write(_CATEGORY.pack(*category))
+        for entry in entries:
+            f.write(_ENTRY.pack(*entry))
+        f.write(blob)
+        if has_answers:
+            f.write(_ANSWERS.pack(sum(map(len, extra_ids)), len(groups)))
+            for lists in (extra_ids, groups):
+                offsets = [0]
+                for ids in lists:
+                    offsets.append(offsets[-1] + len(ids))
+                flat = [sid for ids in lists for sid in ids]
+                f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+                f.write(struct.pack(f"<{len(flat)}I", *flat))
+    os.replace(tmp_path, pack_path)
+
+    return len(entries)
+
+
+class VocabularyPack(Mapping):
+    """Vocabulario de solo lectura servido desde un paquete mapeado en memoria.
+
+    Se comporta como el diccionario ``{categoría: {español: inglés}}`` pero
+    solo decodifica la categoría que se consulta. Cada entrada tiene un id de
+    palabra estable (su posición en el paquete) y, si el paquete las trae,
+    respuestas alternativas y grupos de sinónimos como ids de cadena.
+    """
+
+    def __init__(self, pack_path):
+        self.pack_path = pack_path
+        self._file = open(pack_path, "rb")
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise VocabularyPackError(f"Paquete vacío: {pack_path}")
+
+        try:
+            (magic, version, flags, self._num_strings, num_categories,
+             self._num_entries, blob_size) = _HEADER.unpack_from(self._data, 0)
+        except struct.error:
+            self.close()
+            raise VocabularyPackError(f"Cabecera inválida: {pack_path}")
+
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self.close()
+            raise VocabularyPackError(f"Formato de paquete no soportado: {pack_path}")
+
+        self._offsets_pos = _HEADER.size
+        self._categories_pos = self._offsets_pos + (self._num_strings + 1) * _OFFSET.size
+        self._entries_pos = self._categories_pos + num_categories * _CATEGORY.size
+        self._blob_pos = self._entries_pos + self._num_entries * _ENTRY.size
+
+        if self._blob_pos + blob_size > len(self._data):
+            self.close()
+            raise VocabularyPackError(f"Paquete truncado: {pack_path}")
+
+        self._alternatives_pos = None
+        self._num_groups = 0
+        if flags & FLAG_ANSWERS:
+            self._read_answers_header(self._blob_pos + blob_size)
+
+        # La tabla de categorías es pequeña: se lee completa al abrir
+        self._category_names = []
+        self._category_ranges = {}
+        self._category_starts = []
+        for i in range(num_categories):
+            name_sid, first, count = _CATEGORY.unpack_from(
+                self._data, self._categories_pos + i * _CATEGORY.size)
+            name = self.get_string(name_sid)
+            self._category_names.append(name)
+            self._category_ranges[name] = (first, count)
+            self._category_starts.append(first)
+
+        self._decode_category = lru_cache(maxsize=8)(self._read_category)
+
+    def _read_answers_header(self, position):
+        try:
+            num_alternatives, self._num_groups = _ANSWERS.unpack_from(self._data, position)
+        except struct.error:
+            self.close()
+            raise VocabularyPackError(f"Paquete truncado: {self.pack_path}")
+        self._alternatives_pos = position + _ANSWERS.size
+        self._alternative_ids_pos = (self._alternatives_pos
+                                     + (self._num_entries + 1) * _OFFSET.size)
+        self._groups_pos = self._alternative_ids_pos + num_alternatives * _OFFSET.size
+        self._group_ids_pos = self._groups_pos + (self._num_groups + 1) * _OFFSET.size
+        end = self._group_ids_pos
+        if end <= len(self._data):
+            # El último offset de los grupos es el nº total de ids agrupados
+            end += _OFFSET.unpack_from(
+                self._data, self._groups_pos + self._num_groups * _OFFSET.size)[0] * _OFFSET.size
+        if end > len(self._data):
+            self.close()
+            raise VocabularyPackError(f"Paquete truncado: {self.pack_path}")
+
+    # --- Acceso de bajo nivel ---
+
+    def get_string(self, string_id):
+        """Devuelve la cadena con el id indicado"""
+        start, end = struct.unpack_from("<II", self._data,
+                                        self._offsets_pos + string_id * _OFFSET.size)
+        return self._data[self._blob_pos + start:self._blob_pos + end].decode("utf-8")
+
+    def get_entry_ids(self, word_id):
+        """Devuelve los ids de cadena (español, inglés) de una palabra"""
+        if not 0 <= word_id < self._num_entries:
+            raise IndexError(word_id)
+        return _ENTRY.unpack_from(self._data, self._entries_pos + word_id * _ENTRY.size)
+
+    def english_ids(self):
+        """Ids de cadena de la traducción principal de todas las entradas"""
+        entries = array("I")
+        entries.frombytes(self._data[self._entries_pos:self._blob_pos])
+        if sys.byteorder != "little":
+            entries.byteswap()
+        return entries[1::2]
+
+    def get_entry(self, word_id):
+        """Devuelve la pareja (español, inglés) de una palabra"""
+        spanish_sid, english_sid = self.get_entry_ids(word_id)
+        return self.get_string(spanish_sid), self.get_string(english_sid)
+
+    def get_alternative_ids(self, word_id):
+        """Ids de cadena de las respuestas alternativas de una palabra"""
+        if not 0 <= word_id < self._num_entries:
+            raise IndexError(word_id)
+        if self._alternatives_pos is None:
+            return ()
+        start, end = struct.unpack_from("<II", self._data,
+                                        self._alternatives_pos + word_id * _OFFSET.size)
+        return struct.unpack_from(f"<{end - start}I", self._data,
+                                  self._alternative_ids_pos + start * _OFFSET.size)
+
+    def get_alternatives(self, word_id):
+        """Respuestas inglesas aceptadas además de la principal"""
+        return [self.get_string(sid) for sid in self.get_alternative_ids(word_id)]
+
+    def iter_alternatives(self):
+        """Recorre (id de palabra, [alternativas]) de las palabras que tienen"""
+        if self._alternatives_pos is None:
+            return
+        offsets = array("I")
+        offsets.frombytes(self._data[self._alternatives_pos:self._alternative_ids_pos])
+        if sys.byteorder != "little":
+            offsets.byteswap()
+        for word_id in range(self._num_entries):
+            if offsets[word_id] != offsets[word_id + 1]:
+                yield word_id, self.get_alternatives(word_id)
+
+    def synonym_groups(self):
+        """Grupos de traducciones inglesas equivalentes (lista de tuplas)"""
+        if self._alternatives_pos is None or not self._num_groups:
+            return []
+        offsets = struct.unpack_from(f"<{self._num_groups + 1}I", self._data, self._groups_pos)
+        groups = []
+        for start, end in zip(offsets, offsets[1:]):
+            ids = struct.unpack_from(f"<{end - start}I", self._data,
+                                     self._group_ids_pos + start * _OFFSET.size)
+            groups.append(tuple(self.get_string(sid) for sid in ids))
+        return groups
+
+    def get_entry_category(self, word_id):
+        """Devuelve la categoría a la que pertenece una palabra"""
+        if not 0 <= word_id < self._num_entries:
+            raise IndexError(word_id)
+        index = bisect_right(self._category_starts, word_id) - 1
+        # Saltar categorías vacías que comparten la misma posición inicial
+        while self._category_ranges[self._category_names[index]][1] == 0:
+            index -= 1
+        return self._category_names[index]
+
+    def category_range(self, category):
+        """Devuelve (primera entrada, nº entradas) de una categoría"""
+        return self._category_ranges.get(category, (0, 0))
+
+    def category_size(self, category):
+        """Número de palabras de una categoría sin decodificarla"""
+        return self.category_range(category)[1]
+
+    def word_count(self):
+        """Número total de entradas del paquete"""
+        return self._num_entries
+
+    def _read_category(self, category):
+        first, count = self._category_ranges[category]
+        words = {}
+        for word_id in range(first, first + count):
+            spanish, english = self.get_entry(word_id)
+            words[spanish] = english
+        return words
+
+    # --- Protocolo Mapping ---
+
+    def __getitem__(self, category):
+        if category not in self._category_ranges:
+            raise KeyError(category)
+        return self._decode_category(category)
+
+    def __iter__(self):
+        return iter(self._category_names)
+
+    def __len__(self):
+        return len(self._category_names)
+
+    def __contains__(self, category):
+        return category in self._category_ranges
+
+    def keys(self):
+        # Lista simple para que list(vocabulary.keys()) no decodifique nada
+        return list(self._category_names)
+
+    def close(self):
+        """Libera el mapeo y el archivo"""
+        data = getattr(self, "_data", None)
+        if data is not None:
+            data.close()
+            self._data = None
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def main(argv=None):
+    """Compila un vocabulario JSON: python -m core.vocabulary_pack origen.json destino.pack"""
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        print("Uso: python -m core.vocabulary_pack origen.json destino.pack")
+        return 1
+
+    source, destination = argv
+    with open(source, "r", encoding="utf-8") as f:
+        vocabulary = json.load(f)
+
+    total = compile_vocabulary_pack(vocabulary, destination)
+    print(f"✅ Paquete creado: {destination} ({total} palabras, {len(vocabulary)} categorías)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
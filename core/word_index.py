@@ -0,0 +1,134 @@
+# core/word_index.py - ÍNDICE PLANO DE PALABRAS
+import random
+from array import array
+
+from .vocabulary_pack import VocabularyPack
+
+
+class WordIndex:
+    """Índice plano del vocabulario para sorteos aleatorios en O(1).
+
+    Guarda arreglos paralelos (id de palabra, id de categoría) agrupados por
+    categoría, de modo que una palabra presente en varias categorías (por
+    ejemplo "naranja") conserva una entrada por cada una.
+    """
+
+    def __init__(self, vocabulary, version=0):
+        self.vocabulary = vocabulary
+        self.version = version
+        self.categories = []
+        self.word_ids = array("I")
+        self.category_ids = array("H")
+        self._category_slices = {}
+        self._entries = None
+        self._positions = None
+        self.build()
+
+    def build(self):
+        """Construye los arreglos a partir del vocabulario"""
+        self.categories = list(self.vocabulary.keys())
+        self.word_ids = array("I")
+        self.category_ids = array("H")
+        self._category_slices = {}
+        self._positions = None
+
+        if isinstance(self.vocabulary, VocabularyPack):
+            # En un paquete las entradas ya están agrupadas por categoría
+            self._entries = None
+            for category_id, category in enumerate(self.categories):
+                first, count = self.vocabulary.category_range(category)
+                start = len(self.word_ids)
+                self.word_ids.extend(range(first, first + count))
+                self.category_ids.extend([category_id] * count)
+                self._category_slices[category] = (start, len(self.word_ids))
+        else:
+            self._entries = []
+            for category_id, category in enumerate(self.categories):
+                start = len(self.word_ids)
+                for spanish, english in self.vocabulary[category].items():
+                    self.word_ids.append(len(self._entries))
+                    self._entries.append((spanish, english))
+                self.category_ids.extend([category_id] * (len(self.word_ids) - start))
+                self._category_slices[category] = (start, len(self.word_ids))
+
+    def __len__(self):
+        return len(self.word_ids)
+
+    def get_word(self, word_id):
+        """Devuelve la pareja (español, inglés) de un id de palabra"""
+        if self._entries is None:
+            return self.vocabulary.get_entry(word_id)
+        return self._entries[word_id]
+
+    def get_category(self, position):
+        """Devuelve la categoría de una posición del índice"""
+        return self.categories[self.category_ids[position]]
+
+    def find_position(self, category, spanish):
+        """Posición de (categoría, español) en el índice, o None"""
+        if self._positions is None:
+            # Tabla inversa construida solo cuando se necesita
+            self._positions = {}
+            for position in range(len(self.word_ids)):
+                word = self.get_word(self.word_ids[position])[0]
+                self._positions[(self.get_category(position), word)] = position
+        return self._positions.get((category, spanish))
+
+    def category_slice(self, category=None):
+        """Devuelve el rango (inicio, fin) de posiciones de una categoría"""
+        if category is None:
+            return 0, len(self.word_ids)
+        return self._category_slices.get(category, (0, 0))
+
+    def random_position(self, category=None, rng=random):
+        """Posición aleatoria del índice, o None si no hay palabras"""
+        start, end = self.category_slice(category)
+        if start >= end:
+            return None
+        return start + int(rng.random() * (end - start))
+
+    def random_word(self, category=None, rng=random):
+        """Devuelve (español, inglés) aleatorio, opcionalmente de una categoría"""
+        position = self.random_position(category, rng)
+        if position is None:
+            return None, None
+        return self.get_word(self.word_ids[position])
+
+    def sample_positions(self, k, category=None, rng=random):
+        """Devuelve k posiciones distintas (o todas si hay menos)"""
+        start, end = self.category_slice(category)
+        return rng.sample(range(start, end), min(k, end - start))
+
+    def sample(self, k, category=None, rng=random):
+        """Devuelve k palabras distintas como tuplas (categoría, español, inglés)"""
+        words = []
+        for position in self.sample_positions(k, category, rng):
+            spanish, english = self.get_word(self.word_ids[position])
+            words.append((self.get_category(position), spanish, english))
+        return words
+
+
+def iter_permutation(n, rng=random):
+    """Recorre range(n) en orden aleatorio sin repetir, con memoria constante.
+
+    Usa un generador congruencial de periodo completo sobre la potencia de
+    dos siguiente, mezclado con un xorshift, y descarta los valores >= n.
+    """
+    if n <= 0:
+        return
+    bits = max(n - 1, 1).bit_length()
+    modulus = 1 << bits
+    mask = modulus - 1
+
+    # a ≡ 1 (mod 4) y c impar garantizan el periodo completo
+    multiplier = (int(rng.random() * (modulus >> 2)) << 2) + 1
+    increment = (int(rng.random() * (modulus >> 1)) << 1) + 1
+    key = int(rng.random() * modulus)
+    shift = (bits + 1) // 2
+    state = int(rng.random() * modulus)
+
+    for _ in range(modulus):
+        state = (multiplier * state + increment) & mask
+        value = (state ^ (state >> shift)) ^ key
+        if value < n:
+            yield value
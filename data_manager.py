@@ -1,13 +1,44 @@
+import contextlib
+import copy
 import json
 import os
+import threading
 from datetime import datetime
 
+from core.achievements import evaluate
+from core.event_log import write_json_atomic
+
+# Secciones que se guardan en memoria y se escriben por separado
+SECTIONS = ("progress", "stats")
+
 class DataManager:
-    def __init__(self, data_dir="data"):
+    """Progreso y estadísticas servidos desde memoria.
+    
+    Cada sección se lee del disco (o de SQLite) una sola vez. Las escrituras
+    modifican la copia en memoria y marcan sus claves como pendientes; solo
+    las secciones con cambios se escriben. Antes de servir una sección se
+    compara la firma del archivo (mtime y tamaño, o ``section_version`` en
+    SQLite) con la del último acceso, de modo que una edición externa
+    invalida la caché.
+    """
+    
+    def __init__(self, data_dir="data", storage=None, saver=None, achievements=None):
         self.data_dir = data_dir
+        # Almacenamiento SQLite compartido (core.storage); None = archivos JSON
+        self.storage = storage
+        # SaveWorker opcional (core.save_worker): escrituras en segundo plano
+        self.saver = saver
+        # AchievementEngine opcional (core.achievements) con los logros ya desbloqueados
+        self.achievements = achievements
         self.progress_file = os.path.join(data_dir, "progress.json")
         self.stats_file = os.path.join(data_dir, "stats.json")
         
+        # Caché: sección -> datos, firma del origen y claves sin guardar
+        self._lock = threading.RLock()
+        self._cache = {}
+        self._versions = {}
+        self._dirty = {}
+        
         self.ensure_data_dir()
     
     def ensure_data_dir(self):
@@ -17,53 +48,203 @@ class DataManager:
         except Exception as e:
             print(f"Error al crear directorio de datos: {e}")
     
-    def load_progress(self):
-        default_progress = {
+    def _write(self, task, key=None):
+        # Sin SaveWorker la escritura es síncrona y devuelve su resultado
+        if self.saver is None:
+            return task()
+        if key is None:
+            self.saver.enqueue(task)
+        else:
+            self.saver.submit(key, task)
+        return True
+    
+    # --- Caché ---
+    
+    def _default_progress(self):
+        return {
             "score": 0,
             "level": 1,
             "games_played": 0,
             "words_learned": 0,
             "last_played": None
         }
+    
+    def _default_stats(self):
+        return {
+            "total_games": 0,
+            "total_questions": 0,
+            "total_correct": 0,
+            "overall_accuracy": 0,
+            "games": {},
+            "first_play": datetime.now().isoformat(),
+            "last_play": None
+        }
+    
+    def _file_for(self, section):
+        return self.progress_file if section == "progress" else self.stats_file
+    
+    def _signature(self, section):
+        # Firma del origen: cambia cuando alguien más escribe
+        if self.storage is not None:
+            return self.storage.section_version(section)
+        try:
+            info = os.stat(self._file_for(section))
+        except OSError:
+            return None
+        return info.st_mtime_ns, info.st_size
+    
+    def _read_section(self, section):
+        # Lee una sección del origen completando las claves por defecto
+        if section == "progress":
+            data = self._default_progress()
+        else:
+            data = self._default_stats()
         
         try:
-            if os.path.exists(self.progress_file):
-                with open(self.progress_file, 'r', encoding='utf-8') as f:
-                    progress = json.load(f)
-                    for key, value in default_progress.items():
-                        if key not in progress:
-                            progress[key] = value
-                    return progress
+            if self.storage is not None:
+                if section == "progress":
+                    data.update(self.storage.load_progress())
+                else:
+                    data.update(self.storage.load_stats())
+                return data
+            
+            path = self._file_for(section)
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    data.update(json.load(f))
         except Exception as e:
-            print(f"Error al cargar progreso: {e}")
+            name = "progreso" if section == "progress" else "estadísticas"
+            print(f"Error al cargar {name}: {e}")
         
-        return default_progress
+        return data
     
-    def save_progress(self, progress_data):
-        try:
-            # Cargar progreso existente para preservar datos no proporcionados
-            existing_progress = self.load_progress()
+    def _get(self, section):
+        # Devuelve la sección en memoria, recargándola si cambió fuera
+        with self._lock:
+            if section in self._cache:
+                if section in self._dirty:
+                    # Los cambios propios sin guardar tienen prioridad
+                    return self._cache[section]
+                if self._signature(section) == self._versions.get(section):
+                    return self._cache[section]
             
-            # Actualizar con nuevos datos
-            existing_progress.update(progress_data)
+            version = self._signature(section)
+            self._cache[section] = self._read_section(section)
+            self._versions[section] = version
+            return self._cache[section]
+    
+    def _mark_dirty(self, section, keys):
+        # Anota las claves cambiadas y programa la escritura de la sección
+        with self._lock:
+            self._dirty.setdefault(section, set()).update(keys)
+        return self._write(lambda: self._flush_section(section),
+                           key=(self.data_dir, section))
+    
+    def _flush_section(self, section):
+        # Escribe una sección pendiente. Se ejecuta en el hilo de guardado;
+        # el disco se toca fuera del candado para no bloquear las lecturas.
+        with self._lock:
+            keys = self._dirty.pop(section, None)
+            if keys is None:
+                return True
+            data = copy.deepcopy(self._cache[section])
+            expected = self._versions.get(section)
+        
+        try:
+            data, version = self._persist(section, data, keys, expected)
+        except Exception as e:
+            name = "progreso" if section == "progress" else "estadísticas"
+            print(f"Error al guardar {name}: {e}")
+            with self._lock:
+                self._dirty.setdefault(section, set()).update(keys)
+            return False
+        
+        with self._lock:
+            # Conservar lo que se cambió mientras se escribía
+            current = self._cache.get(section, {})
+            for key in self._dirty.get(section, ()):
+                data[key] = current[key]
+            self._cache[section] = data
+            self._versions[section] = version
+        return True
+    
+    def _persist(self, section, data, keys, expected):
+        # En SQLite la comprobación y la escritura van en una transacción
+        if self.storage is not None:
+            guard = self.storage.transaction()
+        else:
+            guard = contextlib.nullcontext()
+        
+        with guard:
+            if self._signature(section) != expected:
+                # Alguien escribió desde la última lectura: aplicar solo
+                # nuestras claves sobre el contenido actual
+                fresh = self._read_section(section)
+                for key in keys:
+                    fresh[key] = data[key]
+                data = fresh
             
-            # Añadir fecha de guardado
-            existing_progress['last_saved'] = datetime.now().isoformat()
+            if self.storage is not None:
+                if section == "progress":
+                    self.storage.save_progress(data)
+                else:
+                    self.storage.save_stats(data)
+                return data, self.storage.section_version(section)
             
-            # Guardar en archivo
-            with open(self.progress_file, 'w', encoding='utf-8') as f:
-                json.dump(existing_progress, f, indent=2, ensure_ascii=False)
+            write_json_atomic(self._file_for(section), data)
+            return data, self._signature(section)
+    
+    def flush(self):
+        """Escribe ya todas las secciones con cambios pendientes"""
+        with self._lock:
+            sections = list(self._dirty)
+        return all([self._flush_section(section) for section in sections])
+    
+    def invalidate(self):
+        """Descarta la caché de las secciones sin cambios pendientes"""
+        with self._lock:
+            for section in SECTIONS:
+                if section not in self._dirty:
+                    self._cache.pop(section, None)
+    
+    def is_dirty(self, section=None):
+        """Indica si hay cambios sin guardar (en una sección o en cualquiera)"""
+        with self._lock:
+            if section is None:
+                return bool(self._dirty)
+            return section in self._dirty
+    
+    # --- Progreso ---
+    
+    def load_progress(self):
+        with self._lock:
+            return dict(self._get("progress"))
+    
+    def save_progress(self, progress_data):
+        with self._lock:
+            progress = self._get("progress")
+            progress.update(progress_data)
             
-            return True
-        except Exception as e:
-            print(f"Error al guardar progreso: {e}")
-            return False
+            # Añadir fecha de guardado
+            progress['last_saved'] = datetime.now().isoformat()
+        
+        return self._mark_dirty("progress", list(progress_data) + ['last_saved'])
+    
+    def reset_progress(self):
+        with self._lock:
+            default_progress = self._default_progress()
+            default_progress["reset_date"] = datetime.now().isoformat()
+            self._get("progress")
+            self._cache["progress"] = default_progress
+        
+        return self._mark_dirty("progress", default_progress)
+    
+    # --- Estadísticas ---
     
     def update_stats(self, game_type, correct_answers, total_questions):
         # Actualiza las estadísticas del usuario
-        try:
-            # Cargar estadísticas existentes
-            stats = self.load_stats()
+        with self._lock:
+            stats = self._get("stats")
             
             # Actualizar estadísticas generales
             stats['total_games'] = stats.get('total_games', 0) + 1
@@ -86,102 +267,70 @@ class DataManager:
             if stats['total_questions'] > 0:
                 stats['overall_accuracy'] = (stats['total_correct'] / stats['total_questions']) * 100
             
-            # Guardar estadísticas actualizadas
-            self.save_stats(stats)
+            # Actualizar fecha de última jugada
+            stats['last_play'] = datetime.now().isoformat()
+        
+        if self.storage is not None:
+            # En SQLite la partida se registra como sesión con sus contadores
+            return self._write(lambda: self._record_game_now(
+                game_type, correct_answers, total_questions))
+        
+        return self._mark_dirty("stats", ['total_games', 'total_questions', 'total_correct',
+                                          'games', 'overall_accuracy', 'last_play'])
+    
+    def _record_game_now(self, game_type, correct_answers, total_questions):
+        try:
+            with self._lock:
+                expected = self._versions.get("stats")
+            
+            with self.storage.transaction():
+                changed = self.storage.section_version("stats") != expected
+                # Una sesión y los contadores en una sola transacción
+                self.storage.record_game(game_type, correct_answers, total_questions)
+                version = self.storage.section_version("stats")
             
+            with self._lock:
+                if changed:
+                    # Hubo escrituras ajenas: recargar en la próxima lectura
+                    if "stats" not in self._dirty:
+                        self._cache.pop("stats", None)
+                else:
+                    self._versions["stats"] = version
             return True
         except Exception as e:
             print(f"Error al actualizar estadísticas: {e}")
             return False
     
     def load_stats(self):
-        default_stats = {
-            "total_games": 0,
-            "total_questions": 0,
-            "total_correct": 0,
-            "overall_accuracy": 0,
-            "games": {},
-            "first_play": datetime.now().isoformat(),
-            "last_play": None
-        }
-        
-        try:
-            if os.path.exists(self.stats_file):
-                with open(self.stats_file, 'r', encoding='utf-8') as f:
-                    stats = json.load(f)
-                    # Asegurar que todas las claves existan
-                    for key, value in default_stats.items():
-                        if key not in stats:
-                            stats[key] = value
-                    return stats
-        except Exception as e:
-            print(f"Error al cargar estadísticas: {e}")
-        
-        return default_stats
+        with self._lock:
+            return copy.deepcopy(self._get("stats"))
     
     def save_stats(self, stats_data):
-        try:
-            # Actualizar fecha de última jugada
-            stats_data['last_play'] = datetime.now().isoformat()
+        with self._lock:
+            self._get("stats")
+            stats = copy.deepcopy(stats_data)
             
-            # Guardar en archivo
-            with open(self.stats_file, 'w', encoding='utf-8') as f:
-                json.dump(stats_data, f, indent=2, ensure_ascii=False)
-            
-            return True
-        except Exception as e:
-            print(f"Error al guardar estadísticas: {e}")
-            return False
+            # Actualizar fecha de última jugada
+            stats['last_play'] = datetime.now().isoformat()
+            self._cache["stats"] = stats
+        
+        return self._mark_dirty("stats", stats)
+    
+    # --- Logros ---
     
     def get_achievements(self):
-        progress = self.load_progress()
-        stats = self.load_stats()
-        
-        achievements = []
+        if self.achievements is not None:
+            return self.achievements.get_names()
         
-        # Logros basados en puntuación
-        if progress['score'] >= 100:
-            achievements.append("Primeros 100 puntos")
-        if progress['score'] >= 500:
-            achievements.append("500 puntos")
-        if progress['score'] >= 1000:
-            achievements.append("Maestro del inglés (1000 puntos)")
-        
-        # Logros basados en nivel
-        if progress['level'] >= 5:
-            achievements.append("Nivel 5 alcanzado")
-        if progress['level'] >= 10:
-            achievements.append("Nivel 10 alcanzado")
-        
-        # Logros basados en juegos jugados
-        if stats.get('total_games', 0) >= 10:
-            achievements.append("10 juegos completados")
-        if stats.get('total_games', 0) >= 50:
-            achievements.append("50 juegos completados")
-        
-        # Logros basados en precisión
-        if stats.get('overall_accuracy', 0) >= 80:
-            achievements.append("Precisión del 80%")
-        if stats.get('overall_accuracy', 0) >= 95:
-            achievements.append("Precisión experta (95%)")
-        
-        return achievements
-    
-    def reset_progress(self):
-        try:
-            default_progress = {
-                "score": 0,
-                "level": 1,
-                "games_played": 0,
-                "words_learned": 0,
-                "last_played": None,
-                "reset_date": datetime.now().isoformat()
+        # Sin motor de logros: evaluar las reglas con los datos en memoria
+        with self._lock:
+            progress = self._get("progress")
+            stats = self._get("stats")
+            counters = {
+                "score": progress.get("score", 0),
+                "level": progress.get("level", 1),
+                "total_games": stats.get("total_games", 0),
+                "total_questions": stats.get("total_questions", 0),
+                "total_correct": stats.get("total_correct", 0)
             }
-            
-            with open(self.progress_file, 'w', encoding='utf-8') as f:
-                json.dump(default_progress, f, indent=2, ensure_ascii=False)
-            
-            return True
-        except Exception as e:
-            print(f"Error al reiniciar progreso: {e}")
-            return False
\ No newline at end of file
+        return evaluate(counters)
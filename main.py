@@ -1,5 +1,9 @@
 import sys
 import os
+import time
+
+# Inicio del proceso para la traza de arranque
+START_TIME = time.perf_counter()
 
 def setup_paths():
     if getattr(sys, 'frozen', False):
@@ -18,17 +22,56 @@ def setup_paths():
     
     return base_dir
 
+def load_bundled_vocabulary(path_manager):
+    """Activa el vocabulario compilado junto al ejecutable, si lo hay"""
+    from core.vocabulary import DEFAULT_PACK_PATH, VOCABULARY_PACK_NAME, load_vocabulary_pack
+    
+    # Un paquete en data/ (generado por el usuario) tiene preferencia
+    pack_path = path_manager.get_app_path(VOCABULARY_PACK_NAME)
+    if os.path.exists(DEFAULT_PACK_PATH) or not os.path.exists(pack_path):
+        return False
+    try:
+        load_vocabulary_pack(pack_path)
+        return True
+    except Exception as e:
+        print(f"⚠️ No se pudo abrir el vocabulario compilado: {e}")
+        return False
+
 def main():
     """Función principal"""
     try:
         base_dir = setup_paths()
         print("🌟 Iniciando Aventura de Inglés...")
         
+        from utils.startup_trace import StartupTrace
+        trace = StartupTrace(START_TIME)
+        
         from core.game import Game
+        from core.save_worker import SaveWorker
+        from core.storage import get_storage
         from ui.app import EnglishApp  
+        from utils.paths import PathManager
+        trace.mark("imports")
+        
+        # Las builds optimizadas traen el vocabulario ya compilado
+        load_bundled_vocabulary(PathManager)
+        
+        # Todos los datos del jugador en un mismo directorio
+        data_dir = PathManager.get_data_dir()
+        
+        # Almacenamiento SQLite compartido; si falla, se usan archivos JSON
+        try:
+            storage = get_storage(os.path.join(data_dir, "english_adventure.db"))
+        except Exception as e:
+            print(f"⚠️ Base de datos no disponible, usando archivos: {e}")
+            storage = None
         
-        game = Game()
-        app = EnglishApp(game)
+        # Hilo que hace todas las escrituras fuera de la interfaz
+        saver = SaveWorker()
+        game = Game(storage=storage, saver=saver, data_dir=data_dir)
+        trace.mark("game_loaded")
+        app = EnglishApp(game, trace=trace)
+        trace.mark("window_built")
         
         app.run()
         
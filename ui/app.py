@@ -2,19 +2,43 @@ import tkinter as tk
 from tkinter import ttk, messagebox, font, simpledialog
 import random
 import json
-from datetime import datetime
-import pygame
 import os
 
-from core.vocabulary import vocabulary_data
+from core.vocabulary import get_vocabulary, get_category_size, get_word_count, get_word_index
 from core.quiz_generator import QuizGenerator
+from core.reverse_index import ENGLISH_TO_SPANISH, SPANISH_TO_ENGLISH
+from core.session import FlashcardSession, QuizSession, Scoreboard, TranslationSession
 from utils.sound_manager import SoundManager
+from ui.widgets import LETTERS, VirtualWordList
+
+# Pronunciaciones que se precargan por delante de la tarjeta actual
+PREFETCH_AHEAD = 3
+# Espera antes de pronunciar para no tapar el sonido de acierto/fallo (ms)
+PRONUNCIATION_DELAY = 350
+# Sugerencias visibles en el modo de ayuda de la traducción
+SUGGESTION_COUNT = 5
+
+# Textos según el sentido de las preguntas
+DIRECTION_LABELS = {
+    SPANISH_TO_ENGLISH: "Español → Inglés",
+    ENGLISH_TO_SPANISH: "Inglés → Español"
+}
+QUESTION_LABELS = {
+    SPANISH_TO_ENGLISH: "¿Cómo se dice en inglés?",
+    ENGLISH_TO_SPANISH: "¿Cómo se dice en español?"
+}
+TRANSLATE_LABELS = {
+    SPANISH_TO_ENGLISH: "Traduce al inglés:",
+    ENGLISH_TO_SPANISH: "Traduce al español:"
+}
 
 class EnglishApp:
-    def __init__(self, game):
+    def __init__(self, game, trace=None):
         self.game = game
-        self.vocabulary = vocabulary_data
-        self.quiz_generator = QuizGenerator(vocabulary_data)
+        # Traza de arranque (utils.startup_trace), opcional
+        self.trace = trace
+        self.vocabulary = get_vocabulary()
+        self.quiz_generator = QuizGenerator(self.vocabulary)
         self.player_name = "Explorador"
         
         # Cargar nombre guardado si existe
@@ -43,36 +67,84 @@ class EnglishApp:
         # Estado del juego
         self.current_category = None
         self.current_mode = None
-        self.current_question = 0
-        self.total_questions = 10
-        self.correct_answers = 0
-        self.quiz_questions = []
-        self.current_score = self.game.score
-        self.current_level = self.game.level
-        
-        # Variables para juego de traducción
-        self.translation_words = []
-        self.current_translation_index = 0
-        self.translation_score = 0
+        # Sentido de las preguntas en todos los modos
+        self.direction = SPANISH_TO_ENGLISH
+        
+        # Sesiones de juego (core.session): la interfaz solo escucha sus eventos
+        self.scoreboard = Scoreboard(self.game)
+        self.scoreboard.subscribe(self.on_score_event)
+        self.quiz = None
+        self.translation = None
+        self.flashcards = None
+        # Lista virtualizada de la pantalla de categoría, si está abierta
+        self.word_list = None
+        
+        # Pantallas de juego reutilizables (ver show_cached_screen)
+        self.screens = {}
+        self.option_buttons = []
         
         # Configurar ventana
         self.root = tk.Tk()
         self.setup_fonts()
         self.setup_window()
         
-        # Configurar sonidos
+        # Configurar sonidos: pygame y los archivos se cargan después de
+        # pintar el menú; hasta entonces los sonidos se encolan
         try:
-            self.sound_manager = SoundManager(enabled=True)
+            self.sound_manager = SoundManager(enabled=True, deferred=True)
         except:
             self.sound_manager = None
             print("⚠️ Sonidos desactivados")
         
+        # Avisar de los logros nuevos
+        self.game.achievements.subscribe(self.on_achievement)
+        
         # Mostrar pantalla de inicio
         self.show_main_menu()
+        self.root.after_idle(self.on_first_paint)
+    
+    def on_first_paint(self):
+        """Tras la primera pintura: anotar el tiempo y cargar los sonidos"""
+        if self.trace is not None:
+            elapsed = self.trace.mark("first_paint")
+            print(f"⏱️ Primera pintura en {elapsed:.0f} ms")
+            if self.trace.exit_after_paint():
+                # Modo medición: guardar la traza y salir
+                self.trace.save()
+                self.root.after(0, self.root.destroy)
+                return
+        
+        if self.sound_manager:
+            self.sound_manager.load_in_background(on_ready=self.on_sounds_ready)
+    
+    def on_sounds_ready(self):
+        """Se llama desde el hilo de carga cuando los sonidos están listos"""
+        if self.trace is not None:
+            self.trace.mark("sounds_ready")
+            self.trace.save()
+    
+    @property
+    def current_score(self):
+        return self.scoreboard.score
+    
+    @property
+    def current_level(self):
+        return self.scoreboard.level
+    
+    def on_achievement(self, event):
+        """Muestra un logro recién desbloqueado sin interrumpir la pantalla actual"""
+        def notify():
+            if hasattr(self, 'sound_manager') and self.sound_manager:
+                self.sound_manager.play('level_up')
+            messagebox.showinfo("🏅 ¡Nuevo logro!", event["name"])
+        self.root.after(0, notify)
     
     def load_player_name(self):
         """Carga el nombre del jugador desde archivo"""
         try:
+            if self.game.storage is not None:
+                self.player_name = self.game.storage.get_player_name()
+                return
             if os.path.exists("data/player.json"):
                 with open("data/player.json", "r", encoding="utf-8") as f:
                     data = json.load(f)
@@ -82,12 +154,20 @@ class EnglishApp:
     
     def save_player_name(self):
         """Guarda el nombre del jugador"""
-        try:
-            os.makedirs("data", exist_ok=True)
-            with open("data/player.json", "w", encoding="utf-8") as f:
-                json.dump({"name": self.player_name}, f, indent=2, ensure_ascii=False)
-        except:
-            pass
+        name = self.player_name
+        
+        def write():
+            try:
+                if self.game.storage is not None:
+                    self.game.storage.set_player_name(name)
+                    return
+                os.makedirs("data", exist_ok=True)
+                with open("data/player.json", "w", encoding="utf-8") as f:
+                    json.dump({"name": name}, f, indent=2, ensure_ascii=False)
+            except:
+                pass
+        
+        self.game.write("player", write)
     
     def change_player_name(self):
         """Permite al jugador cambiar su nombre"""
@@ -189,6 +269,7 @@ class EnglishApp:
     def on_canvas_configure(self, event):
         """Ajusta el tamaño del frame interno cuando cambia el canvas"""
         self.canvas.itemconfig(self.canvas_window, width=event.width)
+        self.fit_word_list()
     
     def bind_mousewheel(self, event):
         """Habilita scroll con mousewheel"""
@@ -313,7 +394,7 @@ class EnglishApp:
         
         # Estadísticas en grid 2x2
         stats_data = [
-            ("📊 Palabras Totales", str(sum(len(cat) for cat in self.vocabulary.values()))),
+            ("📊 Palabras Totales", str(get_word_count(self.vocabulary))),
             ("🎮 Categorías", str(len(self.vocabulary))),
             ("🏆 Tu Puntaje", str(self.current_score)),
             ("⭐ Tu Nivel", str(self.current_level))
@@ -425,6 +506,27 @@ class EnglishApp:
                     fg=self.colors['text'],
                     wraplength=200,
                     justify=tk.CENTER).pack()
+        
+        # Sentido de las preguntas (se aplica a todos los modos)
+        tk.Button(modes_section,
+                 text=f"🔁 {DIRECTION_LABELS[self.direction]}",
+                 font=self.button_font,
+                 bg=self.colors['highlight'],
+                 fg=self.colors['text'],
+                 padx=20,
+                 pady=5,
+                 cursor="hand2",
+                 command=self.toggle_direction).pack(pady=(20, 0))
+    
+    def toggle_direction(self):
+        """Cambia entre preguntar en español o en inglés"""
+        if self.direction == SPANISH_TO_ENGLISH:
+            self.direction = ENGLISH_TO_SPANISH
+        else:
+            self.direction = SPANISH_TO_ENGLISH
+        if self.sound_manager:
+            self.sound_manager.play('click')
+        self.show_main_menu()
     
     # ==============================
     # MODO QUIZ - COMPLETO
@@ -454,7 +556,11 @@ class EnglishApp:
             ("🔀 Aleatorio", lambda: self.start_quiz(category=None),
              "Preguntas de todas las categorías"),
             ("🏆 Desafío", lambda: self.start_quiz(category=None, num_questions=20),
-             "20 preguntas difíciles")
+             "20 preguntas difíciles"),
+            ("♾️ Práctica Infinita", lambda: self.start_quiz(category=None, endless=True),
+             "Preguntas sin fin, sin repetir palabras hasta verlas todas"),
+            ("🧠 Repaso", lambda: self.start_quiz(category=None, review=True),
+             "Las palabras que toca repasar hoy")
         ]
         
         for i, (title, command, desc) in enumerate(quiz_options):
@@ -518,94 +624,123 @@ class EnglishApp:
                  cursor="hand2",
                  command=self.show_quiz_selection).pack(pady=20)
     
-    def start_quiz(self, category=None, num_questions=10):
+    def start_quiz(self, category=None, num_questions=10, endless=False, review=False):
         """Inicia el juego de quiz"""
         self.clear_content_frame()
         self.show_back_button()
         
-        # Generar preguntas
-        self.quiz_questions = self.quiz_generator.generate_multiple_choice(
-            category=category, 
-            num_questions=num_questions
-        )
-        
-        if not self.quiz_questions:
-            messagebox.showinfo("Sin palabras", "No hay suficientes palabras para el quiz.")
+        # Las preguntas se generan una a una bajo demanda
+        self.quiz = QuizSession(self.game, self.quiz_generator,
+                                category=category,
+                                num_questions=num_questions,
+                                endless=endless,
+                                review=review,
+                                scoreboard=self.scoreboard,
+                                direction=self.direction)
+        self.quiz.subscribe(self.on_quiz_event)
+        
+        # La primera pregunta llega como evento 'item'
+        if not self.quiz.start():
+            if review:
+                messagebox.showinfo("¡Al día!", "No tienes palabras pendientes de repaso.")
+            else:
+                messagebox.showinfo("Sin palabras", "No hay suficientes palabras para el quiz.")
+            self.show_quiz_selection()
+    
+    def on_quiz_event(self, event):
+        """Dibuja los eventos de la sesión de quiz"""
+        if event['type'] == 'item':
+            self.show_quiz_question()
+            self.prefetch_pronunciations(self.quiz)
+        elif event['type'] == 'answer':
+            self.show_quiz_answer(event)
+        elif event['type'] == 'finished':
+            self.show_quiz_results(event)
+        elif event['type'] == 'cancelled':
             self.show_quiz_selection()
-            return
-        
-        # Inicializar estado del quiz
-        self.current_question = 0
-        self.total_questions = len(self.quiz_questions)
-        self.correct_answers = 0
-        self.selected_answer = None
-        
-        # Mostrar primera pregunta
-        self.show_quiz_question()
     
     def show_quiz_question(self):
         """Muestra una pregunta del quiz"""
-        self.clear_content_frame()
-        
-        if self.current_question >= len(self.quiz_questions):
-            self.show_quiz_results()
-            return
-        
-        question = self.quiz_questions[self.current_question]
-        
-        container = tk.Frame(self.content_frame, bg=self.colors['card_bg'])
-        container.pack(expand=True, fill=tk.BOTH, padx=30, pady=30)
+        quiz = self.quiz
+        question = quiz.current
+        screen = self.show_cached_screen('quiz', self.build_quiz_screen)
+        
+        # Actualizar la pantalla en su sitio
+        screen['category'].config(text=f"📚 {question['category']}")
+        if quiz.endless:
+            progress_text = f"Pregunta {quiz.position + 1} ♾️"
+        else:
+            progress_text = f"Pregunta {quiz.position + 1} de {quiz.total}"
+        screen['progress'].config(text=progress_text)
+        screen['question'].config(text=QUESTION_LABELS[question['direction']])
+        screen['spanish'].config(text=f"\"{question['prompt']}\"")
+        
+        # Opciones de respuesta: un botón por índice
+        while len(self.option_buttons) < len(question['options']):
+            self.option_buttons.append(self.create_option_button(screen['options'],
+                                                                 len(self.option_buttons)))
+        for i, btn in enumerate(self.option_buttons):
+            if i < len(question['options']):
+                btn.config(text=f"{chr(65+i)}) {question['options'][i]}",
+                          state=tk.NORMAL,
+                          bg=self.colors['button'],
+                          fg='white')
+                if not btn.winfo_manager():
+                    btn.pack(pady=10)
+            else:
+                btn.pack_forget()
+        
+        # El botón de continuar aparece al responder
+        screen['next'].pack_forget()
+        # En práctica infinita el jugador decide cuándo terminar
+        if quiz.endless:
+            if not screen['finish'].winfo_manager():
+                screen['finish'].pack()
+        else:
+            screen['finish'].pack_forget()
+    
+    def build_quiz_screen(self):
+        """Construye una sola vez la pantalla de preguntas del quiz"""
+        screen = {}
+        container = screen['container'] = tk.Frame(self.content_frame, bg=self.colors['card_bg'])
         
         # Información del quiz
         info_frame = tk.Frame(container, bg=self.colors['card_bg'])
         info_frame.pack(fill=tk.X, pady=(0, 20))
         
-        tk.Label(info_frame, 
-                text=f"📚 {question['category']}",
-                font=self.heading_font,
-                bg=self.colors['card_bg'],
-                fg=self.colors['accent']).pack(side=tk.LEFT)
+        screen['category'] = tk.Label(info_frame,
+                                      font=self.heading_font,
+                                      bg=self.colors['card_bg'],
+                                      fg=self.colors['accent'])
+        screen['category'].pack(side=tk.LEFT)
         
-        tk.Label(info_frame,
-                text=f"Pregunta {self.current_question + 1} de {self.total_questions}",
-                font=self.normal_font,
-                bg=self.colors['card_bg'],
-                fg=self.colors['text']).pack(side=tk.RIGHT)
+        screen['progress'] = tk.Label(info_frame,
+                                      font=self.normal_font,
+                                      bg=self.colors['card_bg'],
+                                      fg=self.colors['text'])
+        screen['progress'].pack(side=tk.RIGHT)
         
         # Pregunta
         question_frame = tk.Frame(container, bg=self.colors['bg_secondary'],
                                  relief='ridge', bd=3, padx=30, pady=30)
         question_frame.pack(fill=tk.X, pady=20)
         
-        tk.Label(question_frame, text="¿Cómo se dice en inglés?",
-                font=self.game_font,
-                bg=self.colors['bg_secondary'],
-                fg=self.colors['text']).pack()
+        screen['question'] = tk.Label(question_frame,
+                                      font=self.game_font,
+                                      bg=self.colors['bg_secondary'],
+                                      fg=self.colors['text'])
+        screen['question'].pack()
         
-        tk.Label(question_frame, text=f"\"{question['spanish']}\"",
-                font=('Comic Sans MS', 36, 'bold'),
-                bg=self.colors['bg_secondary'],
-                fg=self.colors['accent']).pack(pady=20)
+        screen['spanish'] = tk.Label(question_frame,
+                                     font=('Comic Sans MS', 36, 'bold'),
+                                     bg=self.colors['bg_secondary'],
+                                     fg=self.colors['accent'])
+        screen['spanish'].pack(pady=20)
         
         # Opciones de respuesta
-        options_frame = tk.Frame(container, bg=self.colors['card_bg'])
-        options_frame.pack(pady=30)
-        
-        self.option_buttons = []
-        for i, option in enumerate(question['options']):
-            btn = tk.Button(options_frame,
-                          text=f"{chr(65+i)}) {option}",
-                          font=self.button_font,
-                          bg=self.colors['button'],
-                          fg='white',
-                          width=30,
-                          height=2,
-                          padx=10,
-                          pady=5,
-                          cursor="hand2",
-                          command=lambda opt=option: self.check_quiz_answer(opt, question['correct']))
-            btn.pack(pady=10)
-            self.option_buttons.append(btn)
+        screen['options'] = tk.Frame(container, bg=self.colors['card_bg'])
+        screen['options'].pack(pady=30)
+        self.option_buttons = [self.create_option_button(screen['options'], i) for i in range(4)]
         
         # Botón para saltar pregunta
         tk.Button(container, text="⏭️ Saltar Pregunta",
@@ -616,69 +751,93 @@ class EnglishApp:
                  pady=10,
                  cursor="hand2",
                  command=self.next_quiz_question).pack(pady=20)
+        
+        screen['finish'] = tk.Button(container, text="🏁 Terminar",
+                                     font=self.button_font,
+                                     bg=self.colors['incorrect'],
+                                     fg='white',
+                                     padx=20,
+                                     pady=10,
+                                     cursor="hand2",
+                                     command=lambda: self.quiz.finish())
+        
+        # Botón para continuar (se muestra tras responder)
+        screen['next'] = tk.Button(container, text="➡️ Siguiente Pregunta",
+                                   font=self.button_font,
+                                   bg=self.colors['accent'],
+                                   fg='white',
+                                   padx=20,
+                                   pady=10,
+                                   cursor="hand2",
+                                   command=self.next_quiz_question)
+        return screen
+    
+    def create_option_button(self, parent, index):
+        """Crea el botón de la opción 'index' del quiz"""
+        btn = tk.Button(parent,
+                      font=self.button_font,
+                      bg=self.colors['button'],
+                      fg='white',
+                      width=30,
+                      height=2,
+                      padx=10,
+                      pady=5,
+                      cursor="hand2",
+                      command=lambda: self.check_quiz_answer(index))
+        btn.pack(pady=10)
+        return btn
+    
+    def check_quiz_answer(self, index):
+        """Envía la opción elegida al quiz; el resultado llega como evento"""
+        self.quiz.answer(index)
     
-    def check_quiz_answer(self, selected, correct):
-        """Verifica la respuesta del quiz"""
+    def show_quiz_answer(self, event):
+        """Muestra el resultado de una respuesta del quiz"""
         # Deshabilitar todos los botones
         for btn in self.option_buttons:
             btn.config(state=tk.DISABLED)
         
-        # Encontrar el botón seleccionado
-        for btn in self.option_buttons:
-            if btn.cget('text').endswith(selected):
-                if selected == correct:
-                    # Respuesta correcta
-                    btn.config(bg=self.colors['correct'], fg='white')
-                    if self.sound_manager:
-                        self.sound_manager.play('correct')
-                    self.correct_answers += 1
-                    # Añadir puntos inmediatamente
-                    self.current_score += 10
-                    self.update_score()
-                else:
-                    # Respuesta incorrecta
-                    btn.config(bg=self.colors['incorrect'], fg='white')
-                    if self.sound_manager:
-                        self.sound_manager.play('incorrect')
-                    # Resaltar la correcta
-                    for btn2 in self.option_buttons:
-                        if btn2.cget('text').endswith(correct):
-                            btn2.config(bg=self.colors['correct'], fg='white')
+        btn = self.option_buttons[event['selected']]
+        if event['correct']:
+            # Respuesta correcta
+            btn.config(bg=self.colors['correct'], fg='white')
+            if self.sound_manager:
+                self.sound_manager.play('correct')
+        else:
+            # Respuesta incorrecta
+            btn.config(bg=self.colors['incorrect'], fg='white')
+            if self.sound_manager:
+                self.sound_manager.play('incorrect')
+            # Resaltar la correcta
+            self.option_buttons[event['correct_index']].config(bg=self.colors['correct'], fg='white')
+        
+        # Escuchar la respuesta correcta
+        question = self.quiz.current
+        self.root.after(PRONUNCIATION_DELAY,
+                        lambda: self.play_pronunciation(question['category'], question['spanish']))
         
         # Botón para continuar
-        container = self.content_frame.winfo_children()[0]
-        tk.Button(container, text="➡️ Siguiente Pregunta",
-                 font=self.button_font,
-                 bg=self.colors['accent'],
-                 fg='white',
-                 padx=20,
-                 pady=10,
-                 cursor="hand2",
-                 command=self.next_quiz_question).pack(pady=20)
+        self.screens['quiz']['next'].pack(pady=20)
     
     def next_quiz_question(self):
         """Pasa a la siguiente pregunta del quiz"""
         if self.sound_manager:
             self.sound_manager.play('click')
         
-        self.current_question += 1
-        self.show_quiz_question()
+        self.quiz.next()
     
-    def show_quiz_results(self):
-        """Muestra resultados del quiz"""
+    def show_quiz_results(self, result):
+        """Muestra resultados del quiz (la sesión ya sumó y guardó los puntos)"""
         if self.sound_manager:
-            if self.correct_answers == self.total_questions:
+            if result['correct'] == result['total']:
                 self.sound_manager.play('level_up')
-            elif self.correct_answers >= self.total_questions / 2:
+            elif result['correct'] >= result['total'] / 2:
                 self.sound_manager.play('correct')
             else:
                 self.sound_manager.play('incorrect')
         
-        # Calcular puntaje final
-        accuracy = (self.correct_answers / self.total_questions) * 100
-        points_earned = self.correct_answers * 10
-        self.current_score += points_earned
-        self.update_score()
+        accuracy = result['accuracy']
+        points_earned = result['points']
         
         self.clear_content_frame()
         container = tk.Frame(self.content_frame, bg=self.colors['card_bg'])
@@ -710,7 +869,7 @@ class EnglishApp:
         result_text = f"""
         📊 RESULTADOS DEL QUIZ
         
-        ✅ Respuestas correctas: {self.correct_answers}/{self.total_questions}
+        ✅ Respuestas correctas: {result['correct']}/{result['total']}
         📈 Precisión: {accuracy:.1f}%
         ✨ Puntos ganados: +{points_earned}
         🏆 Puntuación total: {self.current_score}
@@ -744,9 +903,6 @@ class EnglishApp:
                  pady=10,
                  cursor="hand2",
                  command=self.show_main_menu).pack(side=tk.LEFT, padx=10)
-        
-        # Guardar progreso
-        self.save_progress()
     
     # ==============================
     # MODO TRADUCCIÓN - COMPLETO
@@ -776,7 +932,9 @@ class EnglishApp:
             ("🔀 Aleatorio", lambda: self.start_translation_game(category=None),
              "Palabras de todas las categorías"),
             ("🏆 Desafío Largo", lambda: self.start_translation_game(category=None, num_words=20),
-             "20 palabras para traducir")
+             "20 palabras para traducir"),
+            ("🧠 Repaso", lambda: self.start_translation_game(category=None, review=True),
+             "Las palabras que toca repasar hoy")
         ]
         
         for i, (title, command, desc) in enumerate(translation_options):
@@ -840,81 +998,94 @@ class EnglishApp:
                  cursor="hand2",
                  command=self.show_translation_selection).pack(pady=20)
     
-    def start_translation_game(self, category=None, num_words=10):
+    def start_translation_game(self, category=None, num_words=10, review=False):
         """Inicia el juego de traducción"""
         self.clear_content_frame()
         self.show_back_button()
         
-        # Obtener palabras
-        if category:
-            # Palabras de una categoría específica
-            category_words = self.vocabulary.get(category, {})
-            words_list = [{"spanish": esp, "english": eng, "category": category} 
-                         for esp, eng in category_words.items()]
-        else:
-            # Todas las palabras mezcladas
-            words_list = []
-            for cat, words in self.vocabulary.items():
-                for esp, eng in words.items():
-                    words_list.append({"spanish": esp, "english": eng, "category": cat})
-        
-        if not words_list:
-            messagebox.showinfo("Sin palabras", "No hay palabras para traducir.")
+        self.translation = TranslationSession(self.game,
+                                              category=category,
+                                              num_words=num_words,
+                                              review=review,
+                                              scoreboard=self.scoreboard,
+                                              direction=self.direction)
+        self.translation.subscribe(self.on_translation_event)
+        
+        # La primera palabra llega como evento 'item'
+        if not self.translation.start():
+            if review:
+                messagebox.showinfo("¡Al día!", "No tienes palabras pendientes de repaso.")
+            else:
+                messagebox.showinfo("Sin palabras", "No hay palabras para traducir.")
+            self.show_translation_selection()
+    
+    def on_translation_event(self, event):
+        """Dibuja los eventos de la sesión de traducción"""
+        if event['type'] == 'item':
+            self.show_translation_word()
+        elif event['type'] == 'answer':
+            self.show_translation_answer(event)
+        elif event['type'] == 'finished':
+            self.show_translation_results(event)
+        elif event['type'] == 'cancelled':
             self.show_translation_selection()
-            return
-        
-        # Mezclar y seleccionar palabras
-        random.shuffle(words_list)
-        self.translation_words = words_list[:num_words]
-        self.current_translation_index = 0
-        self.translation_score = 0
-        
-        # Mostrar primera palabra
-        self.show_translation_word()
     
     def show_translation_word(self):
         """Muestra una palabra para traducir"""
-        self.clear_content_frame()
-        
-        if self.current_translation_index >= len(self.translation_words):
-            self.show_translation_results()
-            return
-        
-        word_data = self.translation_words[self.current_translation_index]
-        
-        container = tk.Frame(self.content_frame, bg=self.colors['card_bg'])
-        container.pack(expand=True, fill=tk.BOTH, padx=30, pady=30)
+        translation = self.translation
+        word_data = translation.current
+        screen = self.show_cached_screen('translation', self.build_translation_screen)
+        
+        # Actualizar la pantalla en su sitio
+        screen['category'].config(text=f"📚 {word_data['category']}")
+        screen['progress'].config(
+            text=f"Palabra {translation.position + 1} de {translation.total}")
+        screen['instruction'].config(text=TRANSLATE_LABELS[translation.direction])
+        screen['spanish'].config(text=f"\"{word_data['prompt']}\"")
+        
+        self.translation_entry.config(state=tk.NORMAL, bg='white')
+        self.translation_entry.delete(0, tk.END)
+        self.translation_entry.focus()
+        self.update_suggestions()
+        screen['feedback'].pack_forget()
+    
+    def build_translation_screen(self):
+        """Construye una sola vez la pantalla del juego de traducción"""
+        screen = {}
+        container = screen['container'] = tk.Frame(self.content_frame, bg=self.colors['card_bg'])
         
         # Información
         info_frame = tk.Frame(container, bg=self.colors['card_bg'])
         info_frame.pack(fill=tk.X, pady=(0, 20))
         
-        tk.Label(info_frame, 
-                text=f"📚 {word_data['category']}",
-                font=self.heading_font,
-                bg=self.colors['card_bg'],
-                fg=self.colors['accent']).pack(side=tk.LEFT)
+        screen['category'] = tk.Label(info_frame,
+                                      font=self.heading_font,
+                                      bg=self.colors['card_bg'],
+                                      fg=self.colors['accent'])
+        screen['category'].pack(side=tk.LEFT)
         
-        tk.Label(info_frame,
-                text=f"Palabra {self.current_translation_index + 1} de {len(self.translation_words)}",
-                font=self.normal_font,
-                bg=self.colors['card_bg'],
-                fg=self.colors['text']).pack(side=tk.RIGHT)
+        screen['progress'] = tk.Label(info_frame,
+                                      font=self.normal_font,
+                                      bg=self.colors['card_bg'],
+                                      fg=self.colors['text'])
+        screen['progress'].pack(side=tk.RIGHT)
         
         # Palabra a traducir
         word_frame = tk.Frame(container, bg=self.colors['bg_secondary'],
                              relief='ridge', bd=3, padx=30, pady=30)
         word_frame.pack(fill=tk.X, pady=20)
         
-        tk.Label(word_frame, text="Traduce al inglés:",
-                font=self.game_font,
-                bg=self.colors['bg_secondary'],
-                fg=self.colors['text']).pack()
+        screen['instruction'] = tk.Label(word_frame,
+                                         font=self.game_font,
+                                         bg=self.colors['bg_secondary'],
+                                         fg=self.colors['text'])
+        screen['instruction'].pack()
         
-        tk.Label(word_frame, text=f"\"{word_data['spanish']}\"",
-                font=('Comic Sans MS', 36, 'bold'),
-                bg=self.colors['bg_secondary'],
-                fg=self.colors['accent']).pack(pady=20)
+        screen['spanish'] = tk.Label(word_frame,
+                                     font=('Comic Sans MS', 36, 'bold'),
+                                     bg=self.colors['bg_secondary'],
+                                     fg=self.colors['accent'])
+        screen['spanish'].pack(pady=20)
         
         # Entrada de traducción
         input_frame = tk.Frame(container, bg=self.colors['card_bg'])
@@ -932,11 +1103,36 @@ class EnglishApp:
                                         relief='ridge',
                                         justify='center')
         self.translation_entry.pack(pady=10)
-        self.translation_entry.focus()
         
         # Bind Enter key para enviar respuesta
-        self.translation_entry.bind('<Return>', 
-                                  lambda e: self.check_translation(word_data['english']))
+        self.translation_entry.bind('<Return>', lambda e: self.check_translation())
+        # Marcar en verde en cuanto lo escrito sea correcto
+        self.translation_entry.bind('<KeyRelease>', self.on_translation_key)
+        # Tab acepta la primera sugerencia
+        self.translation_entry.bind('<Tab>', lambda e: self.use_suggestion(0))
+        
+        # Modo de ayuda: sugerencias del vocabulario mientras se escribe
+        screen['assist'] = tk.BooleanVar(value=False)
+        tk.Checkbutton(input_frame, text="✨ Sugerencias",
+                      variable=screen['assist'],
+                      font=self.normal_font,
+                      bg=self.colors['card_bg'],
+                      fg=self.colors['text'],
+                      cursor="hand2",
+                      command=self.update_suggestions).pack()
+        
+        screen['suggestions'] = tk.Frame(input_frame, bg=self.colors['card_bg'])
+        screen['suggestions'].pack(pady=(5, 0))
+        screen['suggestion_buttons'] = [
+            tk.Button(screen['suggestions'],
+                     font=self.normal_font,
+                     bg=self.colors['highlight'],
+                     fg=self.colors['text'],
+                     padx=10,
+                     cursor="hand2",
+                     command=lambda i=i: self.use_suggestion(i))
+            for i in range(SUGGESTION_COUNT)
+        ]
         
         # Botones
         btn_frame = tk.Frame(container, bg=self.colors['card_bg'])
@@ -949,7 +1145,7 @@ class EnglishApp:
                  padx=20,
                  pady=10,
                  cursor="hand2",
-                 command=lambda: self.check_translation(word_data['english'])).pack(side=tk.LEFT, padx=10)
+                 command=self.check_translation).pack(side=tk.LEFT, padx=10)
         
         tk.Button(btn_frame, text="⏭️ Saltar",
                  font=self.button_font,
@@ -967,83 +1163,117 @@ class EnglishApp:
                  padx=20,
                  pady=10,
                  cursor="hand2",
-                 command=lambda: self.show_hint(word_data['english'])).pack(side=tk.LEFT, padx=10)
+                 command=self.show_hint).pack(side=tk.LEFT, padx=10)
+        
+        # Resultado (se muestra tras verificar)
+        screen['feedback'] = tk.Frame(container, bg=self.colors['card_bg'])
+        screen['result'] = tk.Label(screen['feedback'],
+                                    font=self.heading_font,
+                                    bg=self.colors['card_bg'])
+        screen['result'].pack()
+        screen['answer'] = tk.Label(screen['feedback'],
+                                    font=self.game_font,
+                                    bg=self.colors['card_bg'],
+                                    fg=self.colors['text'])
+        tk.Button(screen['feedback'], text="➡️ Siguiente Palabra",
+                 font=self.button_font,
+                 bg=self.colors['accent'],
+                 fg='white',
+                 padx=20,
+                 pady=10,
+                 cursor="hand2",
+                 command=self.next_translation_word).pack(side=tk.BOTTOM, pady=20)
+        return screen
     
-    def check_translation(self, correct_answer):
-        """Verifica la traducción del usuario"""
-        user_answer = self.translation_entry.get().strip().lower()
-        correct_answer_lower = correct_answer.lower()
-        
-        # Verificar respuesta
-        is_correct = (user_answer == correct_answer_lower)
-        
-        # Mostrar feedback
-        feedback_frame = tk.Frame(self.content_frame.winfo_children()[0], 
-                                 bg=self.colors['card_bg'])
-        feedback_frame.pack(pady=20)
-        
-        if is_correct:
-            tk.Label(feedback_frame, text="✅ ¡CORRECTO!",
-                    font=self.heading_font,
-                    bg=self.colors['card_bg'],
-                    fg=self.colors['correct']).pack()
-            self.translation_score += 1
+    def check_translation(self):
+        """Envía la traducción escrita; el resultado llega como evento"""
+        # Enter sobre una palabra ya verificada no cuenta dos veces
+        self.translation.answer(self.translation_entry.get())
+    
+    def on_translation_key(self, event):
+        """Colorea la entrada mientras se escribe (sin contar como respuesta)"""
+        if self.translation is None or self.translation.answered:
+            return
+        exact = self.translation.check(self.translation_entry.get())
+        self.translation_entry.config(bg='#E8FBE8' if exact else 'white')
+        self.update_suggestions()
+    
+    def update_suggestions(self):
+        """Muestra las respuestas que empiezan por lo escrito (modo de ayuda)"""
+        screen = self.screens['translation']
+        suggestions = []
+        if screen['assist'].get() and self.translation is not None:
+            # Búsqueda binaria sobre un índice precalculado: cabe en un fotograma
+            suggestions = self.translation.suggest(self.translation_entry.get(),
+                                                   SUGGESTION_COUNT)
+        for i, btn in enumerate(screen['suggestion_buttons']):
+            if i < len(suggestions):
+                btn.config(text=suggestions[i])
+                if not btn.winfo_manager():
+                    btn.pack(side=tk.LEFT, padx=5)
+            else:
+                btn.pack_forget()
+    
+    def use_suggestion(self, index):
+        """Copia una sugerencia en la entrada"""
+        btn = self.screens['translation']['suggestion_buttons'][index]
+        if not btn.winfo_manager() or self.translation.answered:
+            # Sin sugerencia, Tab conserva su comportamiento normal
+            return None
+        self.translation_entry.delete(0, tk.END)
+        self.translation_entry.insert(0, btn.cget('text'))
+        self.translation_entry.focus()
+        self.on_translation_key(None)
+        return 'break'
+    
+    def show_translation_answer(self, event):
+        """Muestra si la traducción era correcta"""
+        screen = self.screens['translation']
+        
+        if event['verdict'] == 'close':
+            # Acierto con una errata: se enseña cómo se escribe
+            screen['result'].config(text="✅ ¡CASI PERFECTO!", fg=self.colors['correct'])
+            screen['answer'].config(text=f"Se escribe: \"{event['answer']}\"")
+            screen['answer'].pack(pady=10)
+            if self.sound_manager:
+                self.sound_manager.play('correct')
+        elif event['correct']:
+            screen['result'].config(text="✅ ¡CORRECTO!", fg=self.colors['correct'])
+            screen['answer'].pack_forget()
             if self.sound_manager:
                 self.sound_manager.play('correct')
         else:
-            tk.Label(feedback_frame, text="❌ ¡INCORRECTO!",
-                    font=self.heading_font,
-                    bg=self.colors['card_bg'],
-                    fg=self.colors['incorrect']).pack()
-            tk.Label(feedback_frame, text=f"La respuesta correcta es: \"{correct_answer}\"",
-                    font=self.game_font,
-                    bg=self.colors['card_bg'],
-                    fg=self.colors['text']).pack(pady=10)
+            screen['result'].config(text="❌ ¡INCORRECTO!", fg=self.colors['incorrect'])
+            screen['answer'].config(text=f"La respuesta correcta es: \"{event['answer']}\"")
+            screen['answer'].pack(pady=10)
             if self.sound_manager:
                 self.sound_manager.play('incorrect')
         
         # Deshabilitar entrada
         self.translation_entry.config(state=tk.DISABLED)
+        self.update_suggestions()
         
         # Botón para continuar
-        tk.Button(feedback_frame, text="➡️ Siguiente Palabra",
-                 font=self.button_font,
-                 bg=self.colors['accent'],
-                 fg='white',
-                 padx=20,
-                 pady=10,
-                 cursor="hand2",
-                 command=self.next_translation_word).pack(pady=20)
+        screen['feedback'].pack(pady=20)
     
-    def show_hint(self, correct_answer):
+    def show_hint(self):
         """Muestra una pista para la palabra"""
-        hint = ""
-        for i, char in enumerate(correct_answer):
-            if i == 0:
-                hint += char.upper()
-            elif i < len(correct_answer) - 1 and random.random() > 0.5:
-                hint += char
-            else:
-                hint += "_"
+        hint = self.translation.hint()
         
         messagebox.showinfo("💡 Pista", 
-                          f"Pista: {hint}\n\nLa palabra tiene {len(correct_answer)} letras.")
+                          f"Pista: {hint}\n\nLa palabra tiene {len(hint)} letras.")
     
     def next_translation_word(self):
         """Pasa a la siguiente palabra"""
         if self.sound_manager:
             self.sound_manager.play('click')
         
-        self.current_translation_index += 1
-        self.show_translation_word()
+        self.translation.next()
     
-    def show_translation_results(self):
+    def show_translation_results(self, result):
         """Muestra resultados del juego de traducción"""
-        # Calcular puntaje final
-        accuracy = (self.translation_score / len(self.translation_words)) * 100
-        points_earned = self.translation_score * 15  # Más puntos por traducción
-        self.current_score += points_earned
-        self.update_score()
+        accuracy = result['accuracy']
+        points_earned = result['points']  # Más puntos por traducción
         
         if self.sound_manager:
             if accuracy == 100:
@@ -1081,7 +1311,7 @@ class EnglishApp:
         result_text = f"""
         🔤 RESULTADOS DE TRADUCCIÓN
         
-        ✅ Traducciones correctas: {self.translation_score}/{len(self.translation_words)}
+        ✅ Traducciones correctas: {result['correct']}/{result['total']}
         📈 Precisión: {accuracy:.1f}%
         ✨ Puntos ganados: +{points_earned}
         🏆 Puntuación total: {self.current_score}
@@ -1117,9 +1347,6 @@ class EnglishApp:
                  pady=10,
                  cursor="hand2",
                  command=self.show_main_menu).pack(side=tk.LEFT, padx=10)
-        
-        # Guardar progreso
-        self.save_progress()
     
     # ==============================
     # FUNCIONES COMUNES (sin cambios)
@@ -1145,7 +1372,8 @@ class EnglishApp:
         ⭐ Nivel actual: {self.current_level}
         
         📚 Palabras aprendidas: {self.current_score // 10}
-        🎮 Partidas jugadas: {self.current_level - 1}
+        🎮 Partidas jugadas: {self.game.achievements.counters.get('total_games', 0)}
+        🏅 Logros: {len(self.game.achievements.unlocked)} de {len(self.game.achievements.rules)}
         
         ¡Sigue así! Cada palabra que aprendes te acerca más a ser un experto.
         """
@@ -1156,6 +1384,13 @@ class EnglishApp:
                 fg=self.colors['text'],
                 justify=tk.LEFT).pack(expand=True)
         
+        # Últimos logros desbloqueados
+        for rule, when in self.game.achievements.get_unlocked()[-5:]:
+            tk.Label(container, text=f"🏅 {rule.name}  ({when[:10]})",
+                    font=self.normal_font,
+                    bg=self.colors['card_bg'],
+                    fg=self.colors['accent']).pack()
+        
         tk.Button(container, text="⬅️ Volver",
                  font=self.button_font,
                  bg=self.colors['button'],
@@ -1225,46 +1460,68 @@ class EnglishApp:
     
     def start_flashcards_game(self):
         """Inicia el juego de flashcards"""
-        words = list(self.vocabulary[self.current_category].items())
-        random.shuffle(words)
+        self.flashcards = FlashcardSession(self.game, self.current_category,
+                                           scoreboard=self.scoreboard,
+                                           direction=self.direction)
+        self.flashcards.subscribe(self.on_flashcard_event)
         
-        if not words:
+        # La primera tarjeta llega como evento 'item'
+        if not self.flashcards.start():
             messagebox.showinfo("Sin palabras", "No hay palabras en esta categoría.")
             self.show_main_menu()
-            return
-        
-        self.flashcards_words = words
-        self.current_flashcard = 0
-        self.show_flashcard()
+    
+    def on_flashcard_event(self, event):
+        """Dibuja los eventos de la sesión de flashcards"""
+        if event['type'] == 'item':
+            self.show_flashcard()
+            self.prefetch_pronunciations(self.flashcards)
+        elif event['type'] == 'reveal':
+            self.english_label.config(text=event['answer'], fg=self.colors['correct'])
+            spanish = self.flashcards.current[0]
+            if self.sound_manager and self.sound_manager.has_word(
+                    self.game.get_word_id(self.current_category, spanish)):
+                self.screens['flashcards']['listen'].pack(pady=(0, 20))
+                self.root.after(PRONUNCIATION_DELAY,
+                                lambda: self.play_pronunciation(self.current_category, spanish))
+        elif event['type'] == 'finished':
+            self.show_flashcards_results(event)
+        elif event['type'] == 'cancelled':
+            self.show_main_menu()
     
     def show_flashcard(self):
         """Muestra una flashcard"""
-        self.clear_content_frame()
-        
-        if self.current_flashcard >= len(self.flashcards_words):
-            self.show_flashcards_results()
-            return
-        
-        spanish, english = self.flashcards_words[self.current_flashcard]
-        
-        container = tk.Frame(self.content_frame, bg=self.colors['card_bg'])
-        container.pack(expand=True, fill=tk.BOTH, padx=30, pady=30)
+        flashcards = self.flashcards
+        front, _ = flashcards.faces()
+        screen = self.show_cached_screen('flashcards', self.build_flashcard_screen)
+        
+        # Actualizar la tarjeta en su sitio
+        screen['category'].config(text=f"📚 {self.current_category}")
+        screen['progress'].config(
+            text=f"Tarjeta {flashcards.position + 1} de {flashcards.total}")
+        screen['spanish'].config(text=front)
+        self.english_label.config(text="???", fg=self.colors['shadow'])
+        screen['listen'].pack_forget()
+    
+    def build_flashcard_screen(self):
+        """Construye una sola vez la pantalla de flashcards"""
+        screen = {}
+        container = screen['container'] = tk.Frame(self.content_frame, bg=self.colors['card_bg'])
         
         # Información
         info_frame = tk.Frame(container, bg=self.colors['card_bg'])
         info_frame.pack(fill=tk.X, pady=(0, 20))
         
-        tk.Label(info_frame, 
-                text=f"📚 {self.current_category}",
-                font=self.heading_font,
-                bg=self.colors['card_bg'],
-                fg=self.colors['accent']).pack(side=tk.LEFT)
+        screen['category'] = tk.Label(info_frame,
+                                      font=self.heading_font,
+                                      bg=self.colors['card_bg'],
+                                      fg=self.colors['accent'])
+        screen['category'].pack(side=tk.LEFT)
         
-        tk.Label(info_frame,
-                text=f"Tarjeta {self.current_flashcard + 1} de {len(self.flashcards_words)}",
-                font=self.normal_font,
-                bg=self.colors['card_bg'],
-                fg=self.colors['text']).pack(side=tk.RIGHT)
+        screen['progress'] = tk.Label(info_frame,
+                                      font=self.normal_font,
+                                      bg=self.colors['card_bg'],
+                                      fg=self.colors['text'])
+        screen['progress'].pack(side=tk.RIGHT)
         
         # Flashcard
         flashcard = tk.Frame(container, bg=self.colors['bg_secondary'],
@@ -1272,10 +1529,11 @@ class EnglishApp:
         flashcard.pack(expand=True, fill=tk.BOTH, padx=50, pady=20)
         
         # Palabra en español
-        tk.Label(flashcard, text=spanish,
-                font=('Comic Sans MS', 48, 'bold'),
-                bg=self.colors['bg_secondary'],
-                fg=self.colors['accent']).pack(expand=True)
+        screen['spanish'] = tk.Label(flashcard,
+                                     font=('Comic Sans MS', 48, 'bold'),
+                                     bg=self.colors['bg_secondary'],
+                                     fg=self.colors['accent'])
+        screen['spanish'].pack(expand=True)
         
         # Separador
         tk.Frame(flashcard, height=2, bg=self.colors['accent']).pack(fill=tk.X, padx=50, pady=20)
@@ -1287,6 +1545,17 @@ class EnglishApp:
                                      fg=self.colors['shadow'])
         self.english_label.pack(expand=True)
         
+        # Repetir la pronunciación (se muestra al revelar si hay audio)
+        screen['listen'] = tk.Button(flashcard, text="🔊 Escuchar",
+                                     font=self.button_font,
+                                     bg=self.colors['button'],
+                                     fg='white',
+                                     padx=15,
+                                     pady=5,
+                                     cursor="hand2",
+                                     command=lambda: self.play_pronunciation(
+                                         self.current_category, self.flashcards.current[0]))
+        
         # Botones
         btn_frame = tk.Frame(container, bg=self.colors['card_bg'])
         btn_frame.pack(pady=30)
@@ -1298,7 +1567,7 @@ class EnglishApp:
                  padx=20,
                  pady=10,
                  cursor="hand2",
-                 command=lambda: self.reveal_translation(english)).pack(side=tk.LEFT, padx=10)
+                 command=self.reveal_translation).pack(side=tk.LEFT, padx=10)
         
         tk.Button(btn_frame, text="➡️ Siguiente",
                  font=self.button_font,
@@ -1309,6 +1578,15 @@ class EnglishApp:
                  cursor="hand2",
                  command=self.next_flashcard).pack(side=tk.LEFT, padx=10)
         
+        tk.Button(btn_frame, text="🔁 Repasar",
+                 font=self.button_font,
+                 bg=self.colors['highlight'],
+                 fg=self.colors['text'],
+                 padx=20,
+                 pady=10,
+                 cursor="hand2",
+                 command=lambda: self.next_flashcard(remembered=False)).pack(side=tk.LEFT, padx=10)
+        
         tk.Button(btn_frame, text="🏁 Terminar",
                  font=self.button_font,
                  bg=self.colors['incorrect'],
@@ -1316,32 +1594,30 @@ class EnglishApp:
                  padx=20,
                  pady=10,
                  cursor="hand2",
-                 command=self.show_flashcards_results).pack(side=tk.LEFT, padx=10)
+                 command=lambda: self.flashcards.finish()).pack(side=tk.LEFT, padx=10)
+        return screen
     
-    def reveal_translation(self, english):
+    def reveal_translation(self):
         """Revela la traducción"""
         if hasattr(self, 'sound_manager') and self.sound_manager:
             self.sound_manager.play('correct')
         
-        self.english_label.config(text=english, fg=self.colors['correct'])
+        self.flashcards.reveal()
     
-    def next_flashcard(self):
+    def next_flashcard(self, remembered=True):
         """Siguiente flashcard"""
         if hasattr(self, 'sound_manager') and self.sound_manager:
             self.sound_manager.play('click')
         
-        self.current_flashcard += 1
-        self.show_flashcard()
+        self.flashcards.next(remembered)
     
-    def show_flashcards_results(self):
+    def show_flashcards_results(self, result):
         """Muestra resultados de flashcards"""
         if hasattr(self, 'sound_manager') and self.sound_manager:
             self.sound_manager.play('level_up')
         
-        words_reviewed = min(self.current_flashcard, len(self.flashcards_words))
-        points_earned = words_reviewed * 5
-        self.current_score += points_earned
-        self.update_score()
+        words_reviewed = result['total']
+        points_earned = result['points']
         
         self.clear_content_frame()
         container = tk.Frame(self.content_frame, bg=self.colors['card_bg'])
@@ -1389,9 +1665,23 @@ class EnglishApp:
                  pady=10,
                  cursor="hand2",
                  command=self.show_main_menu).pack(side=tk.LEFT, padx=10)
+    
+    def fit_word_list(self):
+        """Da a la lista de palabras el alto libre de la ventana visible.
         
-        # Guardar progreso
-        self.save_progress()
+        El lienzo de contenido solo fija el ancho del marco interior, así que
+        la lista no recibe alto al empaquetarse: se calcula aquí y cada vez
+        que cambia el tamaño del lienzo.
+        """
+        word_list = self.word_list
+        if word_list is None or not word_list.winfo_exists():
+            return
+        container = word_list.master
+        container.update_idletasks()
+        others = container.winfo_reqheight() - word_list.winfo_reqheight()
+        # 60 = relleno vertical del contenedor (pady=30 arriba y abajo)
+        height = self.canvas.winfo_height() - others - 60
+        word_list.configure(height=max(height, word_list.row_height * 3))
     
     def select_category(self, category):
         """Selecciona una categoría para ver detalles"""
@@ -1413,53 +1703,35 @@ class EnglishApp:
                 fg=self.colors['accent']).pack(pady=(0, 20))
         
         # Información
-        word_count = len(self.vocabulary[self.current_category])
+        word_count = get_category_size(self.current_category, self.vocabulary)
         tk.Label(container, text=f"✨ {word_count} palabras para aprender ✨",
                 font=self.heading_font,
                 bg=self.colors['card_bg'],
                 fg=self.colors['text']).pack(pady=(0, 30))
         
-        # Lista de palabras
-        words_frame = tk.Frame(container, bg=self.colors['card_bg'])
-        words_frame.pack(expand=True, fill=tk.BOTH)
-        
-        # Canvas para scroll
-        words_canvas = tk.Canvas(words_frame, bg=self.colors['card_bg'],
-                                highlightthickness=0)
-        words_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        words_scrollbar = ttk.Scrollbar(words_frame, orient="vertical",
-                                       command=words_canvas.yview)
-        words_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        words_canvas.configure(yscrollcommand=words_scrollbar.set)
-        
-        words_inner = tk.Frame(words_canvas, bg=self.colors['card_bg'])
-        words_canvas.create_window((0, 0), window=words_inner, anchor="nw")
-        
-        # Mostrar palabras
-        for spanish, english in self.vocabulary[self.current_category].items():
-            word_card = tk.Frame(words_inner, bg=self.colors['bg_secondary'],
-                                relief='ridge', bd=1)
-            word_card.pack(fill=tk.X, pady=5, padx=10)
-            
-            tk.Label(word_card, text=f"🇪🇸 {spanish}",
-                    font=self.game_font,
-                    bg=self.colors['bg_secondary'],
-                    fg=self.colors['accent']).pack(side=tk.LEFT, padx=20, pady=10)
-            
-            tk.Label(word_card, text="➡️",
-                    font=self.game_font,
-                    bg=self.colors['bg_secondary'],
-                    fg=self.colors['text']).pack(side=tk.LEFT, padx=10)
-            
-            tk.Label(word_card, text=f"🇬🇧 {english}",
-                    font=self.game_font,
-                    bg=self.colors['bg_secondary'],
-                    fg=self.colors['text']).pack(side=tk.LEFT, padx=20, pady=10)
-        
-        words_inner.update_idletasks()
-        words_canvas.configure(scrollregion=words_canvas.bbox("all"))
+        # Saltar a una letra
+        letters_frame = tk.Frame(container, bg=self.colors['card_bg'])
+        letters_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        # Lista virtualizada: solo se crean las filas visibles
+        index = get_word_index(self.vocabulary)
+        start, _ = index.category_slice(self.current_category)
+        word_list = self.word_list = VirtualWordList(
+            container, word_count,
+            lambda row: index.get_word(index.word_ids[start + row]),
+            self.colors, self.game_font)
+        word_list.pack(expand=True, fill=tk.BOTH)
+        word_list.focus_set()
+        
+        for letter in LETTERS:
+            tk.Button(letters_frame, text=letter,
+                     font=self.normal_font,
+                     bg=self.colors['bg_secondary'],
+                     fg=self.colors['text'],
+                     relief='flat',
+                     padx=4,
+                     cursor="hand2",
+                     command=lambda l=letter: word_list.jump_to_letter(l)).pack(side=tk.LEFT, expand=True)
         
         # Botones
         btn_frame = tk.Frame(container, bg=self.colors['card_bg'])
@@ -1500,11 +1772,32 @@ class EnglishApp:
                  pady=10,
                  cursor="hand2",
                  command=self.show_main_menu).pack(side=tk.LEFT, padx=10)
+        
+        # Con todo colocado, la lista ocupa el alto que queda libre
+        self.fit_word_list()
     
     def clear_content_frame(self):
-        """Limpia el frame de contenido"""
+        """Limpia el frame de contenido (las pantallas en caché solo se ocultan)"""
+        cached = {screen['container'] for screen in self.screens.values()}
         for widget in self.content_frame.winfo_children():
-            widget.destroy()
+            if widget in cached:
+                widget.pack_forget()
+            else:
+                widget.destroy()
+    
+    def show_cached_screen(self, name, build):
+        """Muestra una pantalla de juego que se construye una sola vez.
+        
+        Entre una pregunta y la siguiente la pantalla no se destruye: los
+        textos se cambian con config() y se evita reconstruir los widgets.
+        """
+        screen = self.screens.get(name)
+        if screen is None:
+            screen = self.screens[name] = build()
+        if not screen['container'].winfo_manager():
+            self.clear_content_frame()
+            screen['container'].pack(expand=True, fill=tk.BOTH, padx=30, pady=30)
+        return screen
     
     def show_back_button(self):
         """Muestra botón de volver"""
@@ -1516,30 +1809,53 @@ class EnglishApp:
         if hasattr(self, 'back_button'):
             self.back_button.pack_forget()
     
+    def play_pronunciation(self, category, spanish):
+        """Pronuncia en inglés una palabra; devuelve False si no hay audio"""
+        if not self.sound_manager:
+            return False
+        return self.sound_manager.play_word(self.game.get_word_id(category, spanish))
+    
+    def prefetch_pronunciations(self, session):
+        """Prepara el audio de la palabra actual y de las siguientes"""
+        if self.sound_manager and self.sound_manager.has_pronunciations():
+            self.sound_manager.prefetch_words(
+                [self.game.get_word_id(category, spanish)
+                 for category, spanish in session.upcoming(PREFETCH_AHEAD + 1)])
+    
     def update_score(self):
         """Actualiza display de puntaje"""
         if hasattr(self, 'score_label'):
             self.score_label.config(text=f"🏆 {self.current_score} Puntos")
         
-        # Subir nivel cada 100 puntos
-        new_level = (self.current_score // 100) + 1
-        if new_level > self.current_level:
-            self.current_level = new_level
-            if hasattr(self, 'sound_manager') and self.sound_manager:
-                self.sound_manager.play('level_up')
-        
         if hasattr(self, 'level_label'):
             self.level_label.config(text=f"⭐ Nivel {self.current_level}")
     
+    def on_score_event(self, event):
+        """Eventos del marcador: puntos ganados y subidas de nivel"""
+        if event['type'] == 'level_up':
+            if hasattr(self, 'sound_manager') and self.sound_manager:
+                self.sound_manager.play('level_up')
+        self.update_score()
+    
     def save_progress(self):
         """Guarda progreso"""
-        try:
-            self.game.score = self.current_score
-            self.game.level = self.current_level
-            self.game.save_progress()
-        except Exception as e:
-            print(f"Error guardando progreso: {e}")
+        self.scoreboard.save()
     
     def run(self):
         """Inicia la aplicación"""
-        self.root.mainloop()
\ No newline at end of file
+        self.root.mainloop()
+        # Al salir, compactar el diario en una instantánea
+        self.save_progress()
+        self.game.save_progress()
+        
+        # Esperar a que el hilo de guardado vacíe su cola
+        if self.game.saver is not None:
+            self.game.saver.stop()
+            stats = self.game.saver.get_stats()
+            print(f"💾 Guardados: {stats['writes']} escrituras "
+                  f"({stats['coalesced']} agrupadas), "
+                  f"latencia media {stats['avg_latency_ms']:.1f} ms, "
+                  f"máxima {stats['max_latency_ms']:.1f} ms")
+        
+        if self.sound_manager:
+            self.sound_manager.close()
\ No newline at end of file
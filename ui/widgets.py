@@ -0,0 +1,188 @@
+# ui/widgets.py - WIDGETS REUTILIZABLES
+import bisect
+import tkinter as tk
+from tkinter import ttk
+
+# Letras para saltar dentro de una lista
+LETTERS = "ABCDEFGHIJKLMNÑOPQRSTUVWXYZ"
+# Las vocales acentuadas cuentan como su letra base (la ñ no)
+_FOLD = str.maketrans("áéíóúü", "aeiouu")
+# Filas visibles si no se indica un alto
+DEFAULT_VISIBLE_ROWS = 8
+
+
+def initial_letter(word):
+    """Letra inicial de una palabra, en mayúscula y sin acento"""
+    word = word.strip().lower().translate(_FOLD)
+    return word[:1].upper()
+
+
+class VirtualWordList(tk.Frame):
+    """Lista virtualizada de parejas (español, inglés).
+
+    Solo existen los widgets de las filas visibles más unas pocas de margen
+    (``overscan``). Al desplazarse, las mismas filas se recolocan y se les
+    cambia el texto con ``config()``, de modo que abrir una categoría de
+    miles de palabras cuesta lo mismo que abrir una de diez.
+
+    ``get_row(i)`` devuelve la pareja de la fila ``i`` (0 <= i < count).
+
+    Las filas se colocan con ``place()``, que no pide tamaño al contenedor,
+    así que el alto de la lista es fijo: ``height`` en píxeles o, si no se
+    indica, ``DEFAULT_VISIBLE_ROWS`` filas.
+    """
+
+    def __init__(self, parent, count, get_row, colors, row_font,
+                 row_height=None, overscan=4, height=None, **kwargs):
+        super().__init__(parent, bg=colors['card_bg'], **kwargs)
+        self.count = count
+        self.get_row = get_row
+        self.colors = colors
+        self.row_font = row_font
+        self.overscan = overscan
+        # Alto de fila: línea de texto más el relleno de la tarjeta
+        self.row_height = row_height or row_font.metrics('linespace') + 34
+        # El marco conserva su alto aunque sus hijos no pidan ninguno
+        self.configure(height=height or self.row_height * DEFAULT_VISIBLE_ROWS)
+        self.pack_propagate(False)
+        self.top = 0.0
+        self._rows = []
+        self._letters = None
+        self._last_letter = None
+
+        self.body = tk.Frame(self, bg=colors['card_bg'])
+        self.body.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.body.bind('<Configure>', lambda e: self.render())
+        self.bind_scroll(self.body)
+        self.bind('<Key>', self.on_key)
+
+    # --- Desplazamiento ---
+
+    def bind_scroll(self, widget):
+        """Rueda del ratón (Windows/macOS y X11)"""
+        widget.bind('<MouseWheel>', lambda e: self.scroll(-1 if e.delta > 0 else 1, 'units'))
+        widget.bind('<Button-4>', lambda e: self.scroll(-1, 'units'))
+        widget.bind('<Button-5>', lambda e: self.scroll(1, 'units'))
+
+    def visible_rows(self):
+        """Número de filas que caben en el alto actual"""
+        return max(1, self.body.winfo_height() // self.row_height)
+
+    def max_top(self):
+        return max(0, self.count - self.visible_rows())
+
+    def yview(self, action, amount=None, unit=None):
+        """Comando de la barra: 'moveto fracción' o 'scroll n units|pages'"""
+        if action == 'moveto':
+            self.scroll_to(float(amount) * self.count)
+        elif action == 'scroll':
+            self.scroll(int(amount), unit)
+
+    def scroll(self, amount, unit='units'):
+        step = self.visible_rows() if unit == 'pages' else 1
+        self.scroll_to(self.top + amount * step)
+
+    def scroll_to(self, row):
+        """Coloca la fila 'row' (puede ser fraccionaria) arriba del todo"""
+        self.top = min(max(0.0, row), float(self.max_top()))
+        self.render()
+
+    # --- Dibujo ---
+
+    def create_row(self):
+        """Crea una fila reutilizable (tarjeta con tres etiquetas)"""
+        card = tk.Frame(self.body, bg=self.colors['bg_secondary'], relief='ridge', bd=1)
+        spanish = tk.Label(card, font=self.row_font,
+                           bg=self.colors['bg_secondary'],
+                           fg=self.colors['accent'])
+        spanish.pack(side=tk.LEFT, padx=20, pady=10)
+        tk.Label(card, text="➡️", font=self.row_font,
+                 bg=self.colors['bg_secondary'],
+                 fg=self.colors['text']).pack(side=tk.LEFT, padx=10)
+        english = tk.Label(card, font=self.row_font,
+                           bg=self.colors['bg_secondary'],
+                           fg=self.colors['text'])
+        english.pack(side=tk.LEFT, padx=20, pady=10)
+
+        for widget in (card,) + tuple(card.winfo_children()):
+            self.bind_scroll(widget)
+        # [tarjeta, etiqueta español, etiqueta inglés, fila mostrada]
+        return [card, spanish, english, None]
+
+    def render(self):
+        """Recoloca las filas visibles (más el margen) y actualiza su texto"""
+        visible = self.visible_rows()
+        first = max(0, int(self.top) - self.overscan)
+        last = min(self.count, int(self.top) + visible + 1 + self.overscan)
+
+        # Solo se crean filas nuevas si la ventana crece
+        if len(self._rows) < last - first:
+            for row in self._rows:
+                row[3] = None
+            while len(self._rows) < last - first:
+                self._rows.append(self.create_row())
+
+        # Cada fila de datos usa siempre el mismo hueco (índice módulo el
+        # tamaño del grupo): al desplazar una fila solo cambian las que entran
+        slots = len(self._rows)
+        for row in self._rows:
+            if row[3] is None or not first <= row[3] < last:
+                row[0].place_forget()
+                row[3] = None
+
+        for index in range(first, last):
+            row = self._rows[index % slots]
+            if row[3] != index:
+                spanish, english = self.get_row(index)
+                row[1].config(text=f"🇪🇸 {spanish}")
+                row[2].config(text=f"🇬🇧 {english}")
+                row[3] = index
+            y = int((index - self.top) * self.row_height)
+            row[0].place(x=10, y=y + 5, relwidth=1, width=-20, height=self.row_height - 10)
+
+        if self.count:
+            self.scrollbar.set(self.top / self.count,
+                               min(1.0, (self.top + visible) / self.count))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    # --- Saltar a una letra ---
+
+    def letter_index(self):
+        """Tabla letra -> filas que empiezan por ella (se crea al primer salto)"""
+        if self._letters is None:
+            self._letters = {}
+            for index in range(self.count):
+                letter = initial_letter(self.get_row(index)[0])
+                self._letters.setdefault(letter, []).append(index)
+        return self._letters
+
+    def jump_to_letter(self, letter):
+        """Muestra la primera palabra con esa letra; repetirla pasa a la siguiente"""
+        rows = self.letter_index().get(letter.upper())
+        if not rows:
+            return False
+        target = rows[0]
+        if letter.upper() == self._last_letter:
+            # Siguiente aparición después de la fila de arriba
+            position = bisect.bisect_right(rows, int(self.top))
+            target = rows[position] if position < len(rows) else rows[0]
+        self._last_letter = letter.upper()
+        self.scroll_to(target)
+        return True
+
+    def on_key(self, event):
+        if event.char and event.char.upper() in LETTERS:
+            self.jump_to_letter(event.char)
+        elif event.keysym == 'Next':
+            self.scroll(1, 'pages')
+        elif event.keysym == 'Prior':
+            self.scroll(-1, 'pages')
+        elif event.keysym == 'Down':
+            self.scroll(1)
+        elif event.keysym == 'Up':
+            self.scroll(-1)
@@ -1,9 +1,20 @@
 import sys
 import os
+import threading
+
+from .resource_pack import ResourcePack, ResourcePackError
+
+# Paquete único de recursos (utils.resource_pack) junto al ejecutable
+RESOURCE_PACK_NAME = "resources.pack"
 
 class PathManager:
     """Gestiona las rutas de archivos para funcionar en .exe y desarrollo"""
     
+    # Paquete abierto (False = aún sin buscar) y recursos ya resueltos
+    _resource_pack = False
+    _resolved = {}
+    _lock = threading.Lock()
+    
     @staticmethod
     def get_base_path():
         """Obtiene el directorio base de la aplicación"""
@@ -14,6 +25,14 @@ class PathManager:
             # Desarrollo normal
             return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     
+    @staticmethod
+    def get_app_path(filename):
+        """Ruta de un archivo junto al ejecutable (o en la raíz en desarrollo)"""
+        if getattr(sys, 'frozen', False):
+            # Fuera de _MEIPASS: en --onefile no se extrae en cada arranque
+            return os.path.join(os.path.dirname(sys.executable), filename)
+        return os.path.join(PathManager.get_base_path(), filename)
+    
     @staticmethod
     def get_resource_path(relative_path):
         """Obtiene la ruta absoluta a un recurso"""
@@ -26,8 +45,8 @@ class PathManager:
         return os.path.join(base_path, relative_path)
     
     @staticmethod
-    def get_data_path(filename):
-        """Obtiene la ruta para archivos de datos (se guardan en AppData)"""
+    def get_data_dir():
+        """Directorio de datos del jugador (AppData en el .exe, data/ en desarrollo)"""
         if getattr(sys, 'frozen', False):
             # En .exe, guardar en AppData
             app_name = "EnglishAdventure"
@@ -49,4 +68,88 @@ class PathManager:
         # Crear directorio si no existe
         os.makedirs(data_dir, exist_ok=True)
         
-        return os.path.join(data_dir, filename)
\ No newline at end of file
+        return data_dir
+    
+    @staticmethod
+    def get_data_path(filename):
+        """Obtiene la ruta para archivos de datos (se guardan en AppData)"""
+        return os.path.join(PathManager.get_data_dir(), filename)
+    
+    @staticmethod
+    def get_resource_pack():
+        """Abre (una sola vez) el paquete de recursos, o None si no hay"""
+        with PathManager._lock:
+            if PathManager._resource_pack is False:
+                PathManager._resource_pack = None
+                # En --onefile el paquete va junto al .exe para no extraerlo
+                candidates = [PathManager.get_app_path(RESOURCE_PACK_NAME),
+                              os.path.join(PathManager.get_base_path(), RESOURCE_PACK_NAME)]
+                for pack_path in candidates:
+                    if os.path.exists(pack_path):
+                        try:
+                            PathManager._resource_pack = ResourcePack(pack_path)
+                            break
+                        except (OSError, ResourcePackError) as e:
+                            print(f"⚠️ No se pudo abrir el paquete de recursos: {e}")
+            return PathManager._resource_pack
+    
+    @staticmethod
+    def resolve_resource(relative_path):
+        """Localiza un recurso: (ruta, offset, tamaño) o None si no existe.
+        
+        En el .exe manda el paquete; en desarrollo, los archivos sueltos
+        (para poder editarlos sin reconstruir el paquete). El resultado se
+        guarda, así cada recurso se busca una sola vez.
+        """
+        location = PathManager._resolved.get(relative_path)
+        if location is not None or relative_path in PathManager._resolved:
+            return location
+        
+        pack = PathManager.get_resource_pack()
+        
+        def from_pack():
+            found = pack.locate(relative_path) if pack is not None else None
+            return (pack.pack_path,) + found if found else None
+        
+        def from_file():
+            path = PathManager.get_resource_path(relative_path)
+            try:
+                return path, 0, os.path.getsize(path)
+            except OSError:
+                return None
+        
+        if getattr(sys, 'frozen', False):
+            location = from_pack() or from_file()
+        else:
+            location = from_file() or from_pack()
+        PathManager._resolved[relative_path] = location
+        return location
+    
+    @staticmethod
+    def has_resource(relative_path):
+        return PathManager.resolve_resource(relative_path) is not None
+    
+    @staticmethod
+    def read_resource(relative_path):
+        """Lee los bytes de un recurso (del paquete o del archivo suelto)"""
+        location = PathManager.resolve_resource(relative_path)
+        if location is None:
+            raise FileNotFoundError(relative_path)
+        
+        pack = PathManager.get_resource_pack()
+        if pack is not None and location[0] == pack.pack_path:
+            return pack.read(relative_path)
+        with open(location[0], 'rb') as f:
+            return f.read()
+    
+    @staticmethod
+    def open_resource(relative_path):
+        """Abre un recurso como archivo binario"""
+        location = PathManager.resolve_resource(relative_path)
+        if location is None:
+            raise FileNotFoundError(relative_path)
+        
+        pack = PathManager.get_resource_pack()
+        if pack is not None and location[0] == pack.pack_path:
+            return pack.open(relative_path)
+        return open(location[0], 'rb')
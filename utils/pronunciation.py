@@ -0,0 +1,277 @@
+# utils/pronunciation.py - ALMACÉN DE PRONUNCIACIONES
+import hashlib
+import io
+import mmap
+import os
+import struct
+import sys
+import threading
+from collections import OrderedDict
+
+# Formato binario (little-endian):
+#   cabecera -> magic, versión, flags, nº ids de palabra, tamaño del blob
+#   índice   -> (offset, longitud) uint32 por id de palabra; longitud 0 = sin audio
+#   blob     -> clips codificados (OGG/WAV/MP3) uno tras otro, sin duplicados
+PRONUNCIATION_MAGIC = b"EAPR"
+PRONUNCIATION_VERSION = 1
+DEFAULT_PACK_NAME = "assets/pronunciations.pack"
+CLIP_EXTENSIONS = (".ogg", ".wav", ".mp3")
+
+# Sonidos decodificados que se mantienen en memoria
+DEFAULT_CACHE_SIZE = 48
+
+_HEADER = struct.Struct("<4sHHII")
+_CLIP = struct.Struct("<II")
+
+
+class PronunciationPackError(Exception):
+    """Error al leer o escribir un paquete de pronunciaciones"""
+
+
+def clip_name(english):
+    """Nombre de archivo (sin extensión) del clip de una palabra inglesa"""
+    return "_".join(english.strip().lower().split())
+
+
+def compile_pronunciation_pack(clips, num_ids, pack_path):
+    """Empaqueta {id de palabra: bytes del clip} en un único archivo.
+
+    Los clips idénticos (la misma palabra en varias categorías) se guardan
+    una sola vez. Devuelve el número de ids con audio.
+    """
+    index = [(0, 0)] * num_ids
+    blob = bytearray()
+    stored = {}
+    for word_id, data in clips.items():
+        if not 0 <= word_id < num_ids:
+            raise PronunciationPackError(f"Id de palabra fuera de rango: {word_id}")
+        digest = hashlib.sha1(data).digest()
+        location = stored.get(digest)
+        if location is None:
+            location = stored[digest] = (len(blob), len(data))
+            blob += data
+        index[word_id] = location
+
+    # Escritura atómica: archivo temporal + rename
+    tmp_path = pack_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(PRONUNCIATION_MAGIC, PRONUNCIATION_VERSION, 0,
+                             num_ids, len(blob)))
+        for location in index:
+            f.write(_CLIP.pack(*location))
+        f.write(blob)
+    os.replace(tmp_path, pack_path)
+
+    return len(clips)
+
+
+class PronunciationStore:
+    """Clips de pronunciación servidos desde un paquete mapeado en memoria.
+
+    El índice se consulta por id de palabra (el mismo que usan VocabularyPack
+    y WordIndex) sin leer el resto del archivo. Los clips se decodifican solo
+    al pedirlos, con ``decode(bytes)``, y los últimos usados se guardan en una
+    caché LRU de tamaño fijo. ``prefetch`` decodifica en un hilo los clips de
+    las próximas tarjetas para que suenen sin espera.
+
+    ``offset`` y ``size`` permiten abrirlo dentro de otro archivo (un miembro
+    sin comprimir del paquete de recursos).
+    """
+
+    def __init__(self, pack_path, decode=None, cache_size=DEFAULT_CACHE_SIZE,
+                 offset=0, size=None):
+        self.pack_path = pack_path
+        # decode(bytes) -> objeto reproducible (p. ej. pygame.mixer.Sound)
+        self.decode = decode if decode is not None else bytes
+        self.cache_size = cache_size
+        self._file = open(pack_path, "rb")
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise PronunciationPackError(f"Paquete vacío: {pack_path}")
+
+        end = len(self._data) if size is None else min(len(self._data), offset + size)
+        try:
+            magic, version, _flags, self._num_ids, blob_size = _HEADER.unpack_from(self._data,
+                                                                                    offset)
+        except struct.error:
+            self.close()
+            raise PronunciationPackError(f"Cabecera inválida: {pack_path}")
+
+        if magic != PRONUNCIATION_MAGIC or version != PRONUNCIATION_VERSION:
+            self.close()
+            raise PronunciationPackError(f"Formato de paquete no soportado: {pack_path}")
+
+        self._index_pos = offset + _HEADER.size
+        self._blob_pos = self._index_pos + self._num_ids * _CLIP.size
+        if self._blob_pos + blob_size > end:
+            self.close()
+            raise PronunciationPackError(f"Paquete truncado: {pack_path}")
+
+        # Caché LRU: id de palabra -> sonido decodificado
+        self._sounds = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        # Precarga: solo importan las próximas tarjetas, así que cada
+        # petición reemplaza a la anterior
+        self._wanted = []
+        self._wake = threading.Condition(self._lock)
+        self._thread = None
+        self._closed = False
+
+    def __len__(self):
+        return self._num_ids
+
+    # --- Acceso a los clips ---
+
+    def _location(self, word_id):
+        if not 0 <= word_id < self._num_ids:
+            return 0, 0
+        return _CLIP.unpack_from(self._data, self._index_pos + word_id * _CLIP.size)
+
+    def has_clip(self, word_id):
+        """Indica si una palabra tiene audio en el paquete"""
+        return self._location(word_id)[1] > 0
+
+    def get_clip(self, word_id):
+        """Bytes codificados del clip de una palabra, o None"""
+        offset, length = self._location(word_id)
+        if not length:
+            return None
+        start = self._blob_pos + offset
+        return self._data[start:start + length]
+
+    def get_sound(self, word_id):
+        """Sonido decodificado de una palabra (desde la caché si está)"""
+        with self._lock:
+            sound = self._sounds.get(word_id)
+            if sound is not None:
+                self._sounds.move_to_end(word_id)
+                self.hits += 1
+                return sound
+            self.misses += 1
+        return self._load(word_id)
+
+    def _load(self, word_id):
+        # Decodifica fuera del candado; si dos hilos coinciden gana el primero
+        data = self.get_clip(word_id)
+        if data is None:
+            return None
+        try:
+            sound = self.decode(data)
+        except Exception as e:
+            print(f"⚠️ No se pudo decodificar la pronunciación {word_id}: {e}")
+            return None
+
+        with self._lock:
+            sound = self._sounds.setdefault(word_id, sound)
+            self._sounds.move_to_end(word_id)
+            while len(self._sounds) > self.cache_size:
+                self._sounds.popitem(last=False)
+        return sound
+
+    def is_cached(self, word_id):
+        with self._lock:
+            return word_id in self._sounds
+
+    # --- Precarga ---
+
+    def prefetch(self, word_ids):
+        """Decodifica en segundo plano los clips indicados que falten"""
+        if self._closed:
+            return
+        # Nunca más de los que caben: si no, la precarga se expulsaría sola
+        wanted = [word_id for word_id in word_ids if word_id is not None][:self.cache_size]
+        with self._lock:
+            self._wanted = [word_id for word_id in wanted if word_id not in self._sounds]
+            if not self._wanted:
+                return
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._prefetch_loop,
+                                                name="PronunciationPrefetch", daemon=True)
+                self._thread.start()
+            self._wake.notify()
+
+    def _prefetch_loop(self):
+        while True:
+            with self._lock:
+                while not self._wanted and not self._closed:
+                    self._wake.wait()
+                if self._closed:
+                    return
+                word_id = self._wanted.pop(0)
+                if word_id in self._sounds:
+                    continue
+            try:
+                self._load(word_id)
+            except (ValueError, OSError):
+                # El paquete se cerró mientras se precargaba
+                return
+
+    def close(self):
+        """Detiene la precarga y libera el mapeo y el archivo"""
+        lock = getattr(self, "_lock", None)
+        if lock is not None:
+            with lock:
+                self._closed = True
+                self._wanted = []
+                self._sounds.clear()
+                self._wake.notify()
+        data = getattr(self, "_data", None)
+        if data is not None:
+            data.close()
+            self._data = None
+        if not self._file.closed:
+            self._file.close()
+
+
+def decode_with_pygame(pygame):
+    """Decodificador de clips para PronunciationStore basado en pygame.mixer"""
+    def decode(data):
+        return pygame.mixer.Sound(file=io.BytesIO(data))
+    return decode
+
+
+def main(argv=None):
+    """Empaqueta clips sueltos: python -m utils.pronunciation carpeta_clips destino.pack
+
+    Cada palabra del vocabulario activo busca ``<inglés>.ogg`` (o .wav/.mp3)
+    en la carpeta, con los espacios como guiones bajos.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        print("Uso: python -m utils.pronunciation carpeta_clips destino.pack")
+        return 1
+
+    from core.vocabulary import get_vocabulary, get_word_index
+
+    clips_dir, destination = argv
+    files = {}
+    for filename in os.listdir(clips_dir):
+        name, extension = os.path.splitext(filename)
+        if extension.lower() in CLIP_EXTENSIONS:
+            files.setdefault(name.lower(), os.path.join(clips_dir, filename))
+
+    index = get_word_index(get_vocabulary())
+    num_ids = max(index.word_ids, default=-1) + 1
+    clips = {}
+    contents = {}
+    for word_id in index.word_ids:
+        path = files.get(clip_name(index.get_word(word_id)[1]))
+        if path is None or word_id in clips:
+            continue
+        if path not in contents:
+            with open(path, "rb") as f:
+                contents[path] = f.read()
+        clips[word_id] = contents[path]
+
+    total = compile_pronunciation_pack(clips, num_ids, destination)
+    print(f"✅ Paquete de pronunciación creado: {destination} ({total} de {num_ids} palabras)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+# utils/resource_pack.py - PAQUETE ÚNICO DE RECURSOS
+import io
+import json
+import mmap
+import os
+import struct
+import sys
+import zipfile
+
+# El paquete es un zip sin compresión (se puede abrir con cualquier
+# herramienta) con un manifiesto precalculado:
+#   miembros       -> cada recurso guardado tal cual (ZIP_STORED)
+#   manifest.json  -> {"version", "files": {nombre: [offset, tamaño]}} con la
+#                     posición absoluta de los datos de cada miembro
+#   comentario zip -> magic, versión, offset y tamaño del manifiesto
+# Así, al abrirlo no hace falta recorrer el directorio central del zip: se
+# lee el comentario al final del archivo, luego el manifiesto, y cada
+# recurso es una porción del archivo mapeado en memoria.
+RESOURCE_MAGIC = b"EARP"
+RESOURCE_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+_TRAILER = struct.Struct("<4sHII")
+_END_OF_ZIP = b"PK\x05\x06"
+_END_OF_ZIP_SIZE = 22
+
+
+class ResourcePackError(Exception):
+    """Error al leer o escribir un paquete de recursos"""
+
+
+def normalize_name(relative_path):
+    """Nombre de un recurso dentro del paquete (con '/' como separador)"""
+    name = relative_path.replace(os.sep, "/").replace("\\", "/")
+    while name.startswith("./"):
+        name = name[2:]
+    return name
+
+
+def build_resource_pack(pack_path, sources, root_dir="."):
+    """Crea un paquete con las carpetas o archivos indicados (relativos a root_dir)"""
+    files = []
+    for source in sources:
+        path = os.path.join(root_dir, source)
+        if os.path.isfile(path):
+            files.append(source)
+            continue
+        for folder, _dirs, names in os.walk(path):
+            for name in sorted(names):
+                files.append(os.path.relpath(os.path.join(folder, name), root_dir))
+
+    # Escritura atómica: archivo temporal + rename
+    tmp_path = pack_path + ".tmp"
+    manifest = {}
+    with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_STORED) as archive:
+        for relative_path in sorted(files):
+            name = normalize_name(relative_path)
+            archive.write(os.path.join(root_dir, relative_path), name)
+            info = archive.getinfo(name)
+            # Los datos empiezan tras la cabecera local del miembro
+            manifest[name] = [info.header_offset + len(info.FileHeader()), info.file_size]
+
+        data = json.dumps({"version": RESOURCE_VERSION, "files": manifest},
+                          ensure_ascii=False, sort_keys=True).encode("utf-8")
+        archive.writestr(MANIFEST_NAME, data)
+        info = archive.getinfo(MANIFEST_NAME)
+        archive.comment = _TRAILER.pack(RESOURCE_MAGIC, RESOURCE_VERSION,
+                                        info.header_offset + len(info.FileHeader()), len(data))
+    os.replace(tmp_path, pack_path)
+
+    return len(manifest)
+
+
+class ResourcePack:
+    """Recursos de solo lectura servidos desde un paquete mapeado en memoria.
+
+    Nada se extrae a disco: ``read`` devuelve la porción del archivo y
+    ``locate`` da la posición para quien quiera mapearla por su cuenta
+    (p. ej. PronunciationStore).
+    """
+
+    def __init__(self, pack_path):
+        self.pack_path = pack_path
+        self._file = open(pack_path, "rb")
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ResourcePackError(f"Paquete vacío: {pack_path}")
+
+        size = len(self._data)
+        end = size - _TRAILER.size - _END_OF_ZIP_SIZE
+        if end < 0 or self._data[end:end + 4] != _END_OF_ZIP:
+            self.close()
+            raise ResourcePackError(f"No es un paquete de recursos: {pack_path}")
+
+        magic, version, offset, length = _TRAILER.unpack_from(self._data, size - _TRAILER.size)
+        if magic != RESOURCE_MAGIC or version != RESOURCE_VERSION:
+            self.close()
+            raise ResourcePackError(f"Formato de paquete no soportado: {pack_path}")
+        if offset + length > size:
+            self.close()
+            raise ResourcePackError(f"Paquete truncado: {pack_path}")
+
+        try:
+            manifest = json.loads(self._data[offset:offset + length].decode("utf-8"))
+        except ValueError:
+            self.close()
+            raise ResourcePackError(f"Manifiesto inválido: {pack_path}")
+        self._files = {name: tuple(location) for name, location in manifest["files"].items()}
+
+    def __contains__(self, name):
+        return normalize_name(name) in self._files
+
+    def __len__(self):
+        return len(self._files)
+
+    def names(self):
+        return sorted(self._files)
+
+    def locate(self, name):
+        """Devuelve (offset, tamaño) de un recurso dentro del archivo, o None"""
+        return self._files.get(normalize_name(name))
+
+    def read(self, name):
+        """Devuelve los bytes de un recurso"""
+        location = self.locate(name)
+        if location is None:
+            raise KeyError(name)
+        offset, length = location
+        return self._data[offset:offset + length]
+
+    def open(self, name):
+        """Devuelve un recurso como archivo binario en memoria"""
+        return io.BytesIO(self.read(name))
+
+    def close(self):
+        """Libera el mapeo y el archivo"""
+        data = getattr(self, "_data", None)
+        if data is not None:
+            data.close()
+            self._data = None
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def main(argv=None):
+    """Crea un paquete: python -m utils.resource_pack destino.pack [carpeta ...]"""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("Uso: python -m utils.resource_pack destino.pack [carpeta ...]")
+        return 1
+
+    destination, sources = argv[0], argv[1:] or ["assets"]
+    total = build_resource_pack(destination, sources)
+    print(f"✅ Paquete de recursos creado: {destination} ({total} archivos)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
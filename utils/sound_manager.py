@@ -1,22 +1,152 @@
 # utils/sound_manager.py - GESTOR DE SONIDOS
-import pygame
 import os
+import sys
+import threading
+import time
+from collections import deque
 from .paths import PathManager
+from .pronunciation import (DEFAULT_PACK_NAME, PronunciationPackError, PronunciationStore,
+                            decode_with_pygame)
+from .tone_synth import FALLBACK_TONES, ToneCache
+
+# Formato del mezclador: (frecuencia, tamaño, canales)
+MIXER_FORMAT = (22050, -16, 2)
+MIXER_BUFFER = 512
+
+# Sonidos ya convertidos a PCM en la build (ver build_exe.py)
+PCM_SOUNDS_DIR = "assets/sounds/pcm"
+
+# Sonidos pedidos antes de que el mezclador esté listo: se guardan unos
+# pocos y al terminar la carga solo se reproducen los recientes
+PENDING_LIMIT = 4
+PENDING_MAX_AGE = 0.3
+
+# Canales reservados que gestiona SoundManager (no los usa Sound.play)
+CHANNEL_COUNT = 6
+# Prioridad por sonido: clic < respuesta < subida de nivel
+SOUND_PRIORITIES = {'click': 0, 'correct': 1, 'incorrect': 1, 'word': 1, 'level_up': 2}
+# Voces simultáneas máximas por prioridad
+MAX_VOICES = {0: 2, 1: 2, 2: 1}
+# Intervalo mínimo entre dos disparos del mismo sonido (segundos)
+MIN_INTERVALS = {'click': 0.06, 'correct': 0.12, 'incorrect': 0.12, 'word': 0.25,
+                 'level_up': 0.5}
+
+def pcm_resource_name(filename, mixer_format):
+    """Recurso PCM precalculado para un sonido y un formato de mezclador, o None.
+    
+    Solo hay PCM de 16 bits con signo en little-endian: si el mezclador usa
+    otro formato se decodifica el archivo original.
+    """
+    if not mixer_format or mixer_format[1] != -16 or sys.byteorder != 'little':
+        return None
+    frequency, _size, channels = mixer_format
+    stem = os.path.splitext(filename)[0]
+    return f"{PCM_SOUNDS_DIR}/{stem}_{frequency}_{channels}.pcm"
 
 class SoundManager:
-    """Gestiona los efectos de sonido de la aplicación"""
+    """Gestiona los efectos de sonido de la aplicación.
+    
+    Con ``deferred=True`` no se importa pygame ni se cargan sonidos hasta
+    llamar a ``load()`` o ``load_in_background()``; mientras tanto las
+    llamadas a ``play`` se encolan (y se descartan si llegan tarde).
     
-    def __init__(self, enabled=True):
+    Cada sonido se reproduce en un grupo fijo de canales reservados según su
+    prioridad: si no hay canal libre se roba el de menor prioridad (o el más
+    antiguo de la misma), y los disparos repetidos muy seguidos se ignoran.
+    """
+    
+    def __init__(self, enabled=True, deferred=False):
         self.enabled = enabled
         self.sounds = {}
+        self.ready = False
+        self.pygame = None
+        self._pending = deque(maxlen=PENDING_LIMIT)
+        self._lock = threading.Lock()
+        self._thread = None
+        self.tone_cache = None
+        # Pronunciaciones por id de palabra (utils.pronunciation), si hay paquete
+        self.pronunciations = None
+        
+        # Grupo de canales: [canal, prioridad, inicio] por canal
+        self.channels = []
+        self._channel_lock = threading.Lock()
+        self._last_played = {}
+        self.played = 0
+        self.dropped = 0
+        self.stolen = 0
         
-        if enabled:
+        if enabled and not deferred:
+            self.load()
+    
+    def load(self):
+        """Importa pygame, inicia el mezclador y carga los sonidos"""
+        if self.enabled:
             try:
-                pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+                # Importación diferida: pygame tarda en cargar
+                import pygame
+                frequency, size, channels = MIXER_FORMAT
+                pygame.mixer.init(frequency=frequency, size=size, channels=channels,
+                                  buffer=MIXER_BUFFER)
+                self.pygame = pygame
+                self.setup_channels()
                 self.load_default_sounds()
+                self.load_pronunciations()
             except Exception as e:
                 print(f"⚠️ No se pudieron inicializar los sonidos: {e}")
                 self.enabled = False
+        
+        with self._lock:
+            self.ready = True
+            pending = list(self._pending)
+            self._pending.clear()
+        
+        # Reproducir lo pedido durante la carga si aún tiene sentido
+        now = time.monotonic()
+        for sound_name, volume, requested in pending:
+            if now - requested <= PENDING_MAX_AGE:
+                self.play(sound_name, volume)
+        return self.enabled
+    
+    def load_in_background(self, on_ready=None):
+        """Carga los sonidos en un hilo; on_ready() se llama al terminar (en ese hilo)"""
+        def run():
+            self.load()
+            if on_ready is not None:
+                on_ready()
+        
+        self._thread = threading.Thread(target=run, name="SoundLoader", daemon=True)
+        self._thread.start()
+        return self._thread
+    
+    def setup_channels(self):
+        """Reserva los canales que se reparten por prioridad"""
+        self.pygame.mixer.set_num_channels(CHANNEL_COUNT)
+        self.pygame.mixer.set_reserved(CHANNEL_COUNT)
+        self.channels = [[self.pygame.mixer.Channel(i), -1, 0.0] for i in range(CHANNEL_COUNT)]
+    
+    def pick_channel(self, priority, now):
+        """Elige un canal libre o roba uno; None si todos suenan más importantes"""
+        busy_same = []
+        victim = None
+        for slot in self.channels:
+            channel, slot_priority, started = slot
+            if not channel.get_busy():
+                slot[1] = -1
+                continue
+            if slot_priority == priority:
+                busy_same.append(slot)
+            if slot_priority <= priority and (victim is None or
+                                              (slot_priority, started) < (victim[1], victim[2])):
+                victim = slot
+        
+        # Límite de voces: reemplazar la voz más antigua de esta prioridad
+        if len(busy_same) >= MAX_VOICES.get(priority, 1):
+            return min(busy_same, key=lambda slot: slot[2]), True
+        
+        for slot in self.channels:
+            if slot[1] == -1:
+                return slot, False
+        return victim, victim is not None
     
     def load_default_sounds(self):
         """Carga sonidos por defecto o crea fallbacks"""
@@ -27,12 +157,25 @@ class SoundManager:
             'level_up': 'level_up.mp3'
         }
         
+        mixer_format = self.pygame.mixer.get_init()
         for name, filename in sound_files.items():
-            sound_path = PathManager.get_resource_path(f"assets/sounds/{filename}")
+            # PCM listo para el mezclador: se carga sin decodificar el MP3
+            pcm_resource = pcm_resource_name(filename, mixer_format)
+            if pcm_resource and PathManager.has_resource(pcm_resource):
+                try:
+                    self.sounds[name] = self.pygame.mixer.Sound(
+                        buffer=PathManager.read_resource(pcm_resource))
+                    continue
+                except Exception:
+                    pass
             
-            if os.path.exists(sound_path):
+            # Desde el paquete de recursos o el archivo suelto, sin extraer nada
+            resource = f"assets/sounds/{filename}"
+            
+            if PathManager.has_resource(resource):
                 try:
-                    self.sounds[name] = pygame.mixer.Sound(sound_path)
+                    with PathManager.open_resource(resource) as f:
+                        self.sounds[name] = self.pygame.mixer.Sound(file=f)
                 except Exception:
                     print(f"⚠️ No se pudo cargar el sonido: {filename}")
                     self.create_fallback_sound(name)
@@ -40,52 +183,118 @@ class SoundManager:
                 print(f"📁 Sonido no encontrado: {filename}")
                 self.create_fallback_sound(name)
     
+    def load_pronunciations(self, pack_path=None):
+        """Abre el paquete de pronunciaciones (los clips se decodifican al usarlos)"""
+        if pack_path is not None:
+            location = (pack_path, 0, None) if os.path.exists(pack_path) else None
+        else:
+            # Puede estar suelto o dentro del paquete de recursos
+            location = PathManager.resolve_resource(DEFAULT_PACK_NAME)
+        if location is None:
+            return False
+        try:
+            path, offset, size = location
+            self.pronunciations = PronunciationStore(path, decode=decode_with_pygame(self.pygame),
+                                                     offset=offset, size=size)
+        except (OSError, PronunciationPackError) as e:
+            print(f"⚠️ No se pudo abrir el paquete de pronunciaciones: {e}")
+            return False
+        return True
+    
+    def has_pronunciations(self):
+        return self.ready and self.pronunciations is not None
+    
+    def has_word(self, word_id):
+        """Indica si hay pronunciación para una palabra"""
+        return (self.has_pronunciations() and word_id is not None
+                and self.pronunciations.has_clip(word_id))
+    
     def create_fallback_sound(self, name):
-        """Crea un sonido simple como fallback"""
+        """Crea un sonido simple como fallback (tono sintetizado y cacheado)"""
         try:
-            # Crear un sonido simple con pygame
-            import numpy as np
-            
-            if name == 'correct':
-                frequency = 800
-                duration = 300
-            elif name == 'incorrect':
-                frequency = 400
-                duration = 400
-            elif name == 'level_up':
-                frequency = 1000
-                duration = 500
-            else:  # click
-                frequency = 600
-                duration = 100
+            frequency, duration = FALLBACK_TONES.get(name, FALLBACK_TONES['click'])
             
-            # Crear onda senoidal simple
-            sample_rate = 22050
-            frames = int(duration * sample_rate / 1000)
-            arr = np.array([4096 * np.sin(2 * np.pi * frequency * x / sample_rate) 
-                           for x in range(frames)]).astype(np.int16)
-            arr = np.repeat(arr.reshape(frames, 1), 2, axis=1)
+            # Formato real del mezclador: (frecuencia, tamaño, canales)
+            mixer_format = self.pygame.mixer.get_init()
+            if self.tone_cache is None:
+                self.tone_cache = ToneCache()
+            pcm = self.tone_cache.get_tone(frequency, duration, mixer_format)
             
-            sound = pygame.sndarray.make_sound(arr)
-            self.sounds[name] = sound
+            # buffer= no necesita numpy (pygame.sndarray sí)
+            self.sounds[name] = self.pygame.mixer.Sound(buffer=pcm) if pcm else None
             
         except Exception:
             self.sounds[name] = None
     
     def play(self, sound_name, volume=0.7):
         """Reproduce un efecto de sonido"""
-        if not self.enabled or sound_name not in self.sounds:
+        if not self.enabled:
+            return
+        
+        if not self.ready:
+            with self._lock:
+                if not self.ready:
+                    # Todavía cargando: encolar (los más viejos se descartan)
+                    self._pending.append((sound_name, volume, time.monotonic()))
+                    return
+        
+        self.play_sound(sound_name, self.sounds.get(sound_name), volume)
+    
+    def play_word(self, word_id, volume=0.9):
+        """Pronuncia una palabra; devuelve False si no hay audio para ella"""
+        if not self.enabled or not self.has_pronunciations() or word_id is None:
+            return False
+        sound = self.pronunciations.get_sound(word_id)
+        if sound is None:
+            return False
+        self.play_sound('word', sound, volume)
+        return True
+    
+    def prefetch_words(self, word_ids):
+        """Decodifica en segundo plano las pronunciaciones de las próximas palabras"""
+        if self.enabled and self.has_pronunciations():
+            self.pronunciations.prefetch(word_ids)
+    
+    def play_sound(self, sound_name, sound, volume):
+        # Reproduce en el grupo de canales con la prioridad de sound_name
+        if not sound:
             return
         
         try:
-            sound = self.sounds[sound_name]
-            if sound:
-                sound.set_volume(volume)
-                sound.play()
+            with self._channel_lock:
+                now = time.monotonic()
+                # Limitar disparos repetidos (niños pulsando sin parar)
+                last = self._last_played.get(sound_name)
+                if last is not None and now - last < MIN_INTERVALS.get(sound_name, 0.1):
+                    self.dropped += 1
+                    return
+                
+                priority = SOUND_PRIORITIES.get(sound_name, 0)
+                slot, steal = self.pick_channel(priority, now)
+                if slot is None:
+                    self.dropped += 1
+                    return
+                if steal:
+                    self.stolen += 1
+                
+                # El volumen va en el canal; el Sound compartido no se toca
+                channel = slot[0]
+                channel.set_volume(volume)
+                channel.play(sound)
+                slot[1] = priority
+                slot[2] = now
+                self._last_played[sound_name] = now
+                self.played += 1
         except Exception:
             pass  # Silenciar errores de sonido
     
     def stop_all(self):
         """Detiene todos los sonidos"""
-        if self.enabled:
-            pygame.mixer.stop()
\ No newline at end of file
+        if self.enabled and self.pygame is not None:
+            self.pygame.mixer.stop()
+    
+    def close(self):
+        """Libera el paquete de pronunciaciones"""
+        if self.pronunciations is not None:
+            self.pronunciations.close()
+            self.pronunciations = None
\ No newline at end of file
@@ -0,0 +1,59 @@
+# utils/startup_trace.py - TRAZA DE ARRANQUE
+import json
+import os
+import threading
+import time
+
+# Variables de entorno para medir el arranque desde fuera
+TRACE_FILE_ENV = "EA_STARTUP_TRACE"       # ruta donde guardar la traza en JSON
+EXIT_AFTER_PAINT_ENV = "EA_EXIT_AFTER_PAINT"  # cerrar tras la primera pintura
+
+
+class StartupTrace:
+    """Marcas de tiempo del arranque, en ms desde el inicio del proceso"""
+    
+    def __init__(self, start=None):
+        self.start = time.perf_counter() if start is None else start
+        self.marks = []
+        self._lock = threading.Lock()
+    
+    def mark(self, name):
+        """Anota una marca y devuelve los ms transcurridos"""
+        elapsed = (time.perf_counter() - self.start) * 1000
+        with self._lock:
+            self.marks.append((name, elapsed))
+        return elapsed
+    
+    def get(self, name):
+        """Ms de la primera marca con ese nombre, o None"""
+        with self._lock:
+            for mark, elapsed in self.marks:
+                if mark == name:
+                    return elapsed
+        return None
+    
+    def as_dict(self):
+        with self._lock:
+            return {name: round(elapsed, 2) for name, elapsed in self.marks}
+    
+    def report(self):
+        """Resumen legible de todas las marcas"""
+        return "\n".join(f"   {name:<16} {elapsed:8.1f} ms" for name, elapsed in self.as_dict().items())
+    
+    def save(self, path=None):
+        """Guarda la traza en JSON (por defecto en la ruta de EA_STARTUP_TRACE)"""
+        path = path or os.environ.get(TRACE_FILE_ENV)
+        if not path:
+            return False
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.as_dict(), f, indent=2)
+            return True
+        except Exception as e:
+            print(f"Error al guardar la traza de arranque: {e}")
+            return False
+    
+    @staticmethod
+    def exit_after_paint():
+        """Indica si la aplicación debe cerrarse tras la primera pintura"""
+        return os.environ.get(EXIT_AFTER_PAINT_ENV, "") not in ("", "0")
@@ -0,0 +1,121 @@
+# utils/tone_synth.py - SÍNTESIS DE TONOS CON CACHÉ
+import hashlib
+import math
+import os
+import sys
+from array import array
+
+from .paths import PathManager
+
+# Cambiar si cambia el algoritmo, para invalidar la caché en disco
+SYNTH_VERSION = 1
+CACHE_DIR_NAME = "sound_cache"
+DEFAULT_AMPLITUDE = 4096
+# Rampa de entrada y salida (ms) para evitar chasquidos
+DEFAULT_ATTACK_MS = 5
+DEFAULT_RELEASE_MS = 25
+
+# Tonos de respaldo cuando falta un archivo de sonido: (frecuencia, duración ms)
+FALLBACK_TONES = {
+    'correct': (800, 300),
+    'incorrect': (400, 400),
+    'level_up': (1000, 500),
+    'click': (600, 100),
+}
+
+
+def _envelope_frames(frames, sample_rate, attack_ms, release_ms):
+    attack = min(frames, int(sample_rate * attack_ms / 1000))
+    release = min(frames - attack, int(sample_rate * release_ms / 1000))
+    return attack, release
+
+
+def synthesize_tone(frequency, duration_ms, sample_rate=22050, channels=2,
+                    amplitude=DEFAULT_AMPLITUDE, attack_ms=DEFAULT_ATTACK_MS,
+                    release_ms=DEFAULT_RELEASE_MS):
+    """Genera un tono senoidal con envolvente como PCM de 16 bits intercalado.
+
+    Con numpy se calcula en una sola pasada vectorizada; sin numpy (el .exe
+    lo excluye) se usa ``array`` y ``math``. Devuelve bytes en el orden de
+    bytes del sistema, listos para ``pygame.mixer.Sound(buffer=...)``.
+    """
+    frames = int(duration_ms * sample_rate / 1000)
+    attack, release = _envelope_frames(frames, sample_rate, attack_ms, release_ms)
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is not None:
+        t = np.arange(frames, dtype=np.float64)
+        wave = np.sin(t * (2 * np.pi * frequency / sample_rate)) * amplitude
+        envelope = np.ones(frames)
+        if attack:
+            envelope[:attack] = np.linspace(0.0, 1.0, attack, endpoint=False)
+        if release:
+            envelope[frames - release:] = np.linspace(1.0, 0.0, release)
+        mono = (wave * envelope).astype(np.int16)
+        # Copiar a todos los canales sin bucle: (frames, canales)
+        return np.ascontiguousarray(np.broadcast_to(mono[:, None], (frames, channels))).tobytes()
+
+    step = 2 * math.pi * frequency / sample_rate
+    sin = math.sin
+    mono = array('h', [int(sin(x * step) * amplitude) for x in range(frames)])
+    # Envolvente solo en los extremos
+    for x in range(attack):
+        mono[x] = int(mono[x] * x / attack)
+    for x in range(release):
+        position = frames - release + x
+        mono[position] = int(mono[position] * (release - 1 - x) / max(1, release - 1))
+
+    if channels == 1:
+        return mono.tobytes()
+    pcm = array('h', bytes(2 * frames * channels))
+    for channel in range(channels):
+        pcm[channel::channels] = mono
+    return pcm.tobytes()
+
+
+class ToneCache:
+    """Caché en disco del PCM generado, por parámetros y formato del mezclador"""
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or PathManager.get_data_path(CACHE_DIR_NAME)
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, frequency, duration_ms, mixer_format, **options):
+        sample_rate, size, channels = mixer_format
+        text = (f"v{SYNTH_VERSION}|{frequency}|{duration_ms}|{sample_rate}|{size}|{channels}|"
+                f"{sys.byteorder}|{sorted(options.items())}")
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()[:20]
+
+    def get_tone(self, frequency, duration_ms, mixer_format, **options):
+        """Devuelve el PCM del tono, leyéndolo de la caché o generándolo"""
+        sample_rate, size, channels = mixer_format
+        if size != -16:
+            # Solo se sintetiza en 16 bits con signo
+            return None
+
+        path = os.path.join(self.cache_dir,
+                            f"tone_{self.key(frequency, duration_ms, mixer_format, **options)}.pcm")
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            self.hits += 1
+            return data
+        except OSError:
+            pass
+
+        self.misses += 1
+        data = synthesize_tone(frequency, duration_ms, sample_rate, channels, **options)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ No se pudo guardar el tono en caché: {e}")
+        return data